@@ -0,0 +1,64 @@
+"""Compares ModuloInteger arithmetic under the available integer backends.
+
+Each backend is measured in a subprocess, since the backend is selected at
+import time through the DISLOGBACKEND environment variable.
+
+Usage (from the repository root): python -m benchmarks.bench_backend
+"""
+import os
+import random
+import subprocess
+import sys
+import timeit
+
+
+NUMBER = 2000
+
+
+def measure():
+    import dislog
+    from dislog.util import backend
+
+    rng = random.Random(0)
+    print("backend: {}".format(backend.NAME))
+    print("{:>6} {:>12} {:>12} {:>12}".format(
+        "bits", "mul ns", "inverse ns", "pow us"
+    ))
+
+    for bits in (64, 256, 1024, 2048, 4096):
+        modulus = rng.getrandbits(bits) | 1 | (1 << (bits - 1))
+        x = dislog.ModuloInteger(rng.randrange(modulus), modulus)
+        y = dislog.ModuloInteger(rng.randrange(modulus), modulus)
+        exponent = rng.getrandbits(bits)
+
+        namespace = {'x': x, 'y': y, 'e': exponent}
+        mul = min(timeit.repeat(
+            "x * y", globals=namespace, number=NUMBER, repeat=3
+        )) / NUMBER
+        inverse = min(timeit.repeat(
+            "x.inverse()", globals=namespace, number=NUMBER, repeat=3
+        )) / NUMBER
+        power = min(timeit.repeat(
+            "x ** e", globals=namespace, number=NUMBER // 20, repeat=3
+        )) / (NUMBER // 20)
+
+        print("{:6} {:12.0f} {:12.0f} {:12.1f}".format(
+            bits, mul * 1e9, inverse * 1e9, power * 1e6
+        ))
+
+
+def main():
+    for name in ('python', 'gmpy2'):
+        environment = dict(os.environ, DISLOGBACKEND=name)
+        subprocess.run(
+            [sys.executable, '-m', 'benchmarks.bench_backend', '--measure'],
+            env=environment, check=True
+        )
+        print()
+
+
+if __name__ == '__main__':
+    if '--measure' in sys.argv:
+        measure()
+    else:
+        main()
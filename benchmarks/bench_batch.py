@@ -0,0 +1,63 @@
+"""Compares the throughput of the batch solvers against per-argument loops.
+
+Usage (from the repository root): python -m benchmarks.bench_batch
+"""
+import random
+import time
+import dislog
+
+
+# 2 is a generator of Z_{20971661}, of order 2^2 * 5 * 1048583
+MODULUS = 20971661
+N = 20971660
+N_FACTORS = {2: 2, 5: 1, 1048583: 1}
+
+BATCH = 10 ** 5
+
+# Arguments solved one at a time by the looping solvers, whose throughput is
+# extrapolated
+LOOPED = 20
+
+
+def throughput(function, count):
+    started = time.perf_counter()
+    function()
+    return count / (time.perf_counter() - started)
+
+def main():
+    rng = random.Random(0)
+    alpha = dislog.ModuloInteger(2, MODULUS)
+    betas = [alpha ** rng.randrange(N) for _ in range(BATCH)]
+    solver = dislog.BabyGiantSolver(alpha, N, table='dict')
+
+    results = [
+        ("babygiant loop", throughput(
+            lambda: [dislog.babygiant(alpha, b, N) for b in betas[:LOOPED]],
+            LOOPED
+        )),
+        ("BabyGiantSolver loop", throughput(
+            lambda: solver.solve_many(betas[:LOOPED * 10]), LOOPED * 10
+        )),
+        ("batch_babygiant", throughput(
+            lambda: dislog.batch_babygiant(alpha, betas, N), BATCH
+        )),
+        ("pohlighellman loop", throughput(
+            lambda: [
+                dislog.pohlighellman(alpha, b, N, N_FACTORS)
+                for b in betas[:LOOPED]
+            ],
+            LOOPED
+        )),
+        ("batch_pohlighellman", throughput(
+            lambda: dislog.batch_pohlighellman(alpha, betas, N, N_FACTORS),
+            BATCH
+        ))
+    ]
+
+    print("{:<24} {:>14}".format("solver", "logs/s"))
+    for name, rate in results:
+        print("{:<24} {:14.1f}".format(name, rate))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""Benchmarks Pollard's Rho on elliptic curve groups.
+
+Compares the mean steps to a collision of the r-adding walk with and without
+the negation map, and the cost of scalar multiplications in Jacobian
+coordinates with the affine ones, which need an inversion per addition.
+
+Usage (from the repository root): python -m benchmarks.bench_ellipticcurve
+"""
+import math
+import random
+import timeit
+import dislog
+from dislog.util import backend
+from dislog.util import stats
+
+
+QUERIES = 30
+
+# Curves (p, a, b) of prime order n
+CURVES = [
+    (1000003, 3, 7, 999853),
+    (67108859, 3, 35, 67106561)
+]
+
+
+# Affine double and add, for comparison
+def affine_power(point, k, curve):
+    p, a = curve.p, curve.a
+    result = None
+    base = (point.x, point.y)
+    for bit in bin(k)[2:]:
+        result = affine_add(result, result, a, p)
+        if bit == '1':
+            result = affine_add(result, base, a, p)
+    return result
+
+def affine_add(P, Q, a, p):
+    if P is None:
+        return Q
+    if Q is None:
+        return P
+    (x1, y1), (x2, y2) = P, Q
+    if x1 == x2 and (y1 + y2) % p == 0:
+        return None
+    if P == Q:
+        slope = (3 * x1 * x1 + a) * backend.invert(2 * y1, p) % p
+    else:
+        slope = (y2 - y1) * backend.invert(x2 - x1, p) % p
+    x3 = (slope * slope - x1 - x2) % p
+    return (x3, (slope * (x1 - x3) - y1) % p)
+
+def random_point(curve, rng):
+    while True:
+        point = curve.lift_x(rng.randrange(curve.p))
+        if point is not None:
+            return point
+
+def main():
+    rng = random.Random(1)
+    stats.enable()
+
+    print("{:>5} {:<10} {:>12} {:>16}".format(
+        "bits", "walk", "mean steps", "steps/sqrt(n)"
+    ))
+
+    for p, a, b, n in CURVES:
+        curve = dislog.EllipticCurve(p, a, b, order=n)
+        alpha = random_point(curve, rng)
+        logs = [rng.randrange(1, n) for _ in range(QUERIES)]
+
+        for name, walk_class in (('adding', dislog.AddingWalk),
+                                 ('negation', dislog.NegationWalk)):
+            stats.reset()
+            for log in logs:
+                beta = alpha ** log
+                walk = walk_class(alpha, beta, n, seed=log)
+                ret = dislog.expollard(
+                    alpha, beta, n, seed=log, method='distinguished',
+                    walk=walk
+                )
+                assert ret == log
+
+            steps = stats.report()['dislog.pollard.pollard']['steps']
+            print("{:5} {:<10} {:12.0f} {:16.2f}".format(
+                n.bit_length(), name, steps / QUERIES,
+                steps / QUERIES / math.sqrt(n)
+            ))
+
+    print()
+    print("{:>5} {:>14} {:>14}".format("bits", "jacobian (us)", "affine (us)"))
+
+    # P-256 prime and coefficients; only the field size matters here
+    p = 2 ** 256 - 2 ** 224 + 2 ** 192 + 2 ** 96 - 1
+    b = 0x5AC635D8AA3A93E7B3EBBD55769886BC651D06B0CC53B0F63BCE3C3E27D2604B
+    for p, a, b in ((CURVES[1][0], 3, 35), (p, -3, b)):
+        curve = dislog.EllipticCurve(p, a, b)
+        point = random_point(curve, rng)
+        k = rng.getrandbits(int(p).bit_length())
+
+        jacobian = min(timeit.repeat(
+            lambda: (point ** k).x, number=20, repeat=3
+        )) / 20
+        affine = min(timeit.repeat(
+            lambda: affine_power(point, k, curve), number=20, repeat=3
+        )) / 20
+        assert affine_power(point, k, curve) == ((point ** k).x,
+                                                 (point ** k).y)
+
+        print("{:5} {:14.1f} {:14.1f}".format(
+            int(p).bit_length(), jacobian * 1e6, affine * 1e6
+        ))
+
+
+if __name__ == '__main__':
+    main()
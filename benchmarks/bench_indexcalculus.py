@@ -0,0 +1,60 @@
+"""Compares index calculus with Pollard's Rho in prime fields.
+
+Logarithms are computed in the subgroup of prime order q of Z_p^*, with
+p = 2q + 1 a safe prime. Index calculus pays for the factor base once per
+field, then each logarithm only costs a descent.
+
+Usage (from the repository root): python -m benchmarks.bench_indexcalculus
+"""
+import random
+import time
+import dislog
+from benchmarks.bench_pollard import safe_prime
+
+
+QUERIES = 5
+
+# Largest modulus size solved with rho too
+RHO_BITS = 40
+
+
+def main():
+    rng = random.Random(0)
+
+    print("{:>5} {:>12} {:>14} {:>14} {:>14}".format(
+        "bits", "factor base", "precomp (s)", "log (ms)", "rho log (ms)"
+    ))
+
+    for bits in (32, 40, 48, 64, 80, 96):
+        p, q = safe_prime(bits, rng)
+        alpha = dislog.ModuloInteger(4, p)
+        logs = [rng.randrange(1, q) for _ in range(QUERIES)]
+
+        start = time.perf_counter()
+        solver = dislog.IndexCalculusSolver(p, seed=bits)
+        precomputation = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for log in logs:
+            assert solver.solve(alpha, alpha ** log) == log
+        descent = (time.perf_counter() - start) / QUERIES
+
+        rho = float('nan')
+        if bits <= RHO_BITS:
+            start = time.perf_counter()
+            for log in logs:
+                beta = alpha ** log
+                walk = dislog.AddingWalk(alpha, beta, q)
+                assert dislog.expollard(
+                    alpha, beta, q, method='brent', walk=walk
+                ) == log
+            rho = (time.perf_counter() - start) / QUERIES
+
+        print("{:5} {:12} {:14.2f} {:14.2f} {:14.2f}".format(
+            bits, len(solver.factor_base), precomputation, descent * 1e3,
+            rho * 1e3
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""Compares element-wise inversion against batch_inverse.
+
+Usage (from the repository root): python -m benchmarks.bench_inverse
+"""
+import random
+import timeit
+import dislog
+from dislog.util import backend
+
+
+COUNT = 1000
+
+
+def main():
+    rng = random.Random(0)
+    print("backend: {}".format(backend.NAME))
+    print("{:>6} {:>18} {:>18} {:>9}".format(
+        "bits", "inverse (us/elt)", "batch (us/elt)", "speedup"
+    ))
+
+    for bits in (64, 256, 1024, 2048):
+        modulus = rng.getrandbits(bits) | 1 | (1 << (bits - 1))
+        elements = [
+            dislog.ModuloInteger(rng.randrange(1, modulus), modulus)
+            for _ in range(COUNT)
+        ]
+
+        single = min(timeit.repeat(
+            lambda: [element.inverse() for element in elements],
+            number=1, repeat=3
+        )) / COUNT
+        batch = min(timeit.repeat(
+            lambda: dislog.batch_inverse(elements), number=1, repeat=3
+        )) / COUNT
+
+        print("{:6} {:18.2f} {:18.2f} {:9.1f}".format(
+            bits, single * 1e6, batch * 1e6, single / batch
+        ))
+
+
+if __name__ == '__main__':
+    main()
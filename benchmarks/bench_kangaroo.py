@@ -0,0 +1,82 @@
+"""Compares the interval solvers with rho over the whole group.
+
+Logarithms lie in intervals of growing width in Z_p^*, p = 2^61 - 1, whose
+order is far too large for the generic solvers; rho is timed in the
+subgroup of prime order q of Z_p'^* for a safe prime p' with q about the
+interval width, to compare the same number of group operations.
+
+Usage (from the repository root): python -m benchmarks.bench_kangaroo
+"""
+import math
+import random
+import time
+import dislog
+from benchmarks.bench_pollard import safe_prime
+from dislog.util import stats
+
+
+QUERIES = 10
+MODULUS = 2 ** 61 - 1
+
+
+def timed(solve, logs):
+    stats.reset()
+    start = time.perf_counter()
+    for log in logs:
+        assert solve(log) == log
+    return (time.perf_counter() - start) / len(logs) * 1e3
+
+def main():
+    rng = random.Random(0)
+    stats.enable()
+    alpha = dislog.ModuloInteger(37, MODULUS)
+
+    print("{:>6} {:>14} {:>16} {:>14} {:>12} {:>12}".format(
+        "width", "kangaroo (ms)", "steps/sqrt(w)", "interval bsgs", "parallel",
+        "rho (ms)"
+    ))
+
+    for bits in (16, 20, 24, 28):
+        width = 1 << bits
+        lo = rng.randrange(MODULUS - width)
+        logs = [lo + rng.randrange(width) for _ in range(QUERIES)]
+
+        kangaroo = timed(
+            lambda log: dislog.kangaroo(alpha, alpha ** log, lo, lo + width),
+            logs
+        )
+        steps = stats.report()['dislog.kangaroo.kangaroo']['steps']
+
+        bsgs = timed(
+            lambda log: dislog.interval_babygiant(
+                alpha, alpha ** log, lo, lo + width, n=MODULUS - 1
+            ),
+            logs
+        )
+
+        parallel = timed(
+            lambda log: dislog.parallel_kangaroo(
+                alpha, alpha ** log, lo, lo + width, workers=4, seed=log
+            ),
+            logs[:2]
+        )
+
+        p, q = safe_prime(bits + 1, rng)
+        base = dislog.ModuloInteger(4, p)
+        rho_logs = [rng.randrange(q) for _ in range(QUERIES)]
+        rho = timed(
+            lambda log: dislog.expollard(
+                base, base ** log, q,
+                walk=dislog.AddingWalk(base, base ** log, q)
+            ),
+            rho_logs
+        )
+
+        print("{:>6} {:14.1f} {:16.2f} {:14.1f} {:12.1f} {:12.1f}".format(
+            "2^{}".format(bits), kangaroo,
+            steps / QUERIES / math.sqrt(width), bsgs, parallel, rho
+        ))
+
+
+if __name__ == '__main__':
+    main()
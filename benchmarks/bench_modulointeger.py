@@ -0,0 +1,99 @@
+"""Compares ModuloInteger arithmetic against the former validating class.
+
+Usage (from the repository root): python -m benchmarks.bench_modulointeger
+"""
+import sys
+import timeit
+import tracemalloc
+import dislog
+from numbers import Number
+
+
+MODULUS = 1000003
+STEPS = 200000
+
+
+class LegacyModuloInteger:
+    # Former ModuloInteger: __dict__ instances, full validation on every
+    # product
+    def __init__(self, value, modulus):
+        if not isinstance(value, Number):
+            raise TypeError("Value must be initialized with a number")
+        if not isinstance(modulus, Number):
+            raise TypeError("Modulus must be initialized with a number")
+        int_value = int(value)
+        int_modulus = int(modulus)
+        if value != int_value:
+            raise ValueError("Value must be initialized with an integer")
+        if modulus != int_modulus or modulus < 1:
+            raise ValueError("Modulus must be an integer greater than 0")
+        self.modulus = int_modulus
+        self.value = int_value % self.modulus
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __mul__(self, other):
+        if not isinstance(other, LegacyModuloInteger):
+            raise TypeError("Trying to multiply by a non-ModuloInteger object")
+        if self.modulus != other.modulus:
+            raise ValueError("Modulus must be the same")
+        mul = (self.value * other.value) % self.modulus
+        return LegacyModuloInteger(mul, self.modulus)
+
+
+def walk(cls):
+    alpha = cls(5, MODULUS)
+    power = cls(1, MODULUS)
+    for _ in range(STEPS):
+        power *= alpha
+    return power
+
+def table(cls):
+    alpha = cls(5, MODULUS)
+    power = cls(1, MODULUS)
+    exp_table = {}
+    for j in range(STEPS):
+        exp_table[power] = j
+        power = power * alpha
+    return exp_table
+
+def table_memory(cls):
+    tracemalloc.start()
+    exp_table = table(cls)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del exp_table
+    return size / STEPS
+
+def main():
+    print("{:<22} {:>14} {:>14} {:>14}".format(
+        "class", "walk (ns/mul)", "table (ns/op)", "bytes/entry"
+    ))
+
+    for name, cls in (("legacy", LegacyModuloInteger),
+                      ("ModuloInteger", dislog.ModuloInteger)):
+        walk_time = min(timeit.repeat(lambda: walk(cls), number=1, repeat=3))
+        table_time = min(
+            timeit.repeat(lambda: table(cls), number=1, repeat=3)
+        )
+        print("{:<22} {:14.1f} {:14.1f} {:14.1f}".format(
+            name,
+            walk_time / STEPS * 1e9,
+            table_time / STEPS * 1e9,
+            table_memory(cls)
+        ))
+
+    print("instance size: legacy {} bytes (+ __dict__ {}), slotted {} bytes"
+          .format(
+              sys.getsizeof(LegacyModuloInteger(1, MODULUS)),
+              sys.getsizeof(LegacyModuloInteger(1, MODULUS).__dict__),
+              sys.getsizeof(dislog.ModuloInteger(1, MODULUS))
+          ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""Measures the wall time of parallel_pollard against the number of workers.
+
+Usage (from the repository root): python -m benchmarks.bench_parallel_pollard
+"""
+import os
+import random
+import time
+import dislog
+from benchmarks.bench_pollard import safe_prime
+
+
+BITS = 36
+QUERIES = 5
+
+
+def main():
+    rng = random.Random(0)
+    p, q = safe_prime(BITS, rng)
+    alpha = dislog.ModuloInteger(4, p)
+    logs = [rng.randrange(1, q) for _ in range(QUERIES)]
+
+    print("{}-bit subgroup, {} CPUs".format(BITS, os.cpu_count()))
+    print("{:>8} {:>12}".format("workers", "mean s"))
+
+    workers = 1
+    while workers <= 2 * (os.cpu_count() or 1):
+        started = time.perf_counter()
+        for log in logs:
+            ret = dislog.parallel_pollard(
+                alpha, alpha ** log, q, dislog.modint_pollard_map,
+                workers=workers, seed=log
+            )
+            assert ret == log
+        elapsed = time.perf_counter() - started
+
+        print("{:8} {:12.2f}".format(workers, elapsed / QUERIES))
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Compares the prime power descents of Pohlig-Hellman across exponents.
+
+Logarithms are computed in Z_p^* for primes p = c * 2^e + 1, whose order has
+the factor 2^e, with the digit by digit expansion (former implementation)
+and with the divide-and-conquer descent of dislog.pohlighellman.
+
+Usage (from the repository root): python -m benchmarks.bench_pohlighellman
+"""
+import random
+import time
+import dislog
+from dislog.pohlighellman import SUBSOLVERS
+from dislog.pohlighellman import _solve_prime_power
+from sympy.ntheory import primitive_root
+from sympy.ntheory.primetest import isprime
+
+
+QUERIES = 10
+
+
+def digit_by_digit(alpha, beta, n, p, e, subsolver):
+    # Former _solve_prime_power implementation, with e exponentiations of
+    # size log n
+    alpha_inv = alpha ** (n - 1)
+    base = alpha ** (n // p)
+    arg_base = beta
+    inv_pow = alpha_inv
+    next_pow = 1
+    rem = 0
+
+    for j in range(e):
+        cur_pow = next_pow
+        next_pow *= p
+
+        l = subsolver(base, arg_base ** (n // next_pow), p)
+        if l is None:
+            return None, j + 1
+        rem += l * cur_pow
+
+        if j + 1 < e:
+            if l:
+                arg_base *= inv_pow ** l
+            inv_pow = inv_pow ** p
+
+    return rem, e
+
+def prime(e):
+    c = 1
+    while not isprime(c * 2 ** e + 1):
+        c += 2
+    return c * 2 ** e + 1
+
+def main():
+    rng = random.Random(0)
+    subsolver = SUBSOLVERS['exhaustive']
+
+    print("{:>6} {:>16} {:>16} {:>9}".format(
+        "e", "digits (ms)", "descent (ms)", "speedup"
+    ))
+
+    for e in (16, 64, 256, 1024):
+        modulus = prime(e)
+        n = modulus - 1
+        alpha = dislog.ModuloInteger(primitive_root(modulus), modulus)
+        betas = [alpha ** rng.randrange(n) for _ in range(QUERIES)]
+
+        times = []
+        for function in (digit_by_digit, _solve_prime_power):
+            start = time.perf_counter()
+            rems = [
+                function(alpha, beta, n, 2, e, subsolver)[0]
+                for beta in betas
+            ]
+            times.append((time.perf_counter() - start) / QUERIES * 1e3)
+            if function is digit_by_digit:
+                expected = rems
+            else:
+                assert rems == expected
+
+        print("{:>6} {:16.2f} {:16.2f} {:9.1f}".format(
+            e, times[0], times[1], times[0] / times[1]
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""Compares the cycle finding methods of pollard across group sizes.
+
+Walks run in prime order subgroups of Z_p^*, with p = 2q + 1 a safe prime
+and alpha generating the subgroup of order q of the quadratic residues.
+
+Usage (from the repository root): python -m benchmarks.bench_pollard
+"""
+import random
+import time
+import dislog
+from dislog.util import stats
+from sympy import isprime
+from sympy import nextprime
+
+
+QUERIES = 20
+
+
+def safe_prime(bits, rng):
+    q = nextprime(rng.getrandbits(bits - 1) | (1 << (bits - 2)))
+    while not isprime(2 * q + 1):
+        q = nextprime(q)
+    return 2 * q + 1, q
+
+def main():
+    rng = random.Random(0)
+    stats.enable()
+
+    print("{:>5} {:<14} {:>12} {:>12} {:>9}".format(
+        "bits", "method", "mean steps", "mean ms", "solved"
+    ))
+
+    for bits in (16, 20, 24, 28):
+        p, q = safe_prime(bits, rng)
+        alpha = dislog.ModuloInteger(4, p)
+        logs = [rng.randrange(1, q) for _ in range(QUERIES)]
+
+        for method in ('floyd', 'brent', 'distinguished'):
+            stats.reset()
+            solved = 0
+
+            started = time.perf_counter()
+            for log in logs:
+                beta = alpha ** log
+                ret = dislog.pollard(
+                    alpha, beta, q, dislog.modint_pollard_map, method=method
+                )
+                solved += ret == log
+            elapsed = time.perf_counter() - started
+
+            steps = stats.report()['dislog.pollard.pollard']['steps']
+            print("{:5} {:<14} {:12.0f} {:12.2f} {:>9}".format(
+                bits, method, steps / QUERIES, elapsed / QUERIES * 1e3,
+                "{}/{}".format(solved, QUERIES)
+            ))
+
+
+if __name__ == '__main__':
+    main()
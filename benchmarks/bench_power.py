@@ -0,0 +1,103 @@
+"""Compares the exponentiation methods across exponent sizes.
+
+The first table compares ModuloInteger.__pow__, which uses the modular
+exponentiation of the integer backend, with the former linear loop and with
+a square-and-multiply written in Python over ModuloInteger products.
+
+The second table compares the products of two powers alpha^a * beta^b
+computed separately, with dislog.group.multi_power (built-in exponentiations
+or Straus' method, depending on the modulus size) and with the generic
+dislog.util.power.straus on ModuloInteger instances.
+
+Usage (from the repository root): python -m benchmarks.bench_power
+"""
+import random
+import timeit
+import dislog
+import dislog.util as dgutil
+from dislog.group import multi_power
+
+
+# Mersenne prime modulus, so that exponents up to 127 bits are meaningful
+MODULUS = 2 ** 127 - 1
+
+# Largest exponent bit length for which the linear loop is still timed
+MAX_LOOP_BITS = 16
+
+
+def loop_power(base, exponent):
+    # Former ModuloInteger.__pow__ implementation, linear in the exponent
+    retval = 1
+    for _ in range(exponent):
+        retval = (retval * base.value) % base.modulus
+    return dislog.ModuloInteger(retval, base.modulus)
+
+def square_multiply(base, exponent):
+    # Left-to-right square-and-multiply over ModuloInteger products
+    result = base
+    for bit in bin(exponent)[3:]:
+        result = result * result
+        if bit == '1':
+            result = result * base
+    return result
+
+def bench(function, repeat):
+    return min(timeit.repeat(function, number=1, repeat=repeat)) * 1e6
+
+def main():
+    rng = random.Random(0)
+    base = dislog.ModuloInteger(rng.randrange(2, MODULUS), MODULUS)
+
+    print("{:>5} {:>12} {:>12} {:>12}".format(
+        "bits", "loop", "square-mul", "__pow__"
+    ))
+
+    for bits in (8, 12, 16, 32, 64, 127):
+        exponent = rng.getrandbits(bits) | (1 << (bits - 1))
+
+        if bits <= MAX_LOOP_BITS:
+            loop = "{:12.1f}".format(
+                bench(lambda: loop_power(base, exponent), 3)
+            )
+        else:
+            loop = "{:>12}".format("-")
+
+        print("{:5} {} {:12.1f} {:12.1f}".format(
+            bits,
+            loop,
+            bench(lambda: square_multiply(base, exponent), 50),
+            bench(lambda: base ** exponent, 50)
+        ))
+
+    print("(microseconds per exponentiation, best of repeated runs)")
+    print()
+
+    print("{:>5} {:>12} {:>12} {:>12}".format(
+        "bits", "separate", "multi_power", "straus"
+    ))
+
+    for bits in (256, 1024, 2048, 4096):
+        modulus = rng.getrandbits(bits) | (1 << (bits - 1)) | 1
+        bases = [
+            dislog.ModuloInteger(rng.randrange(2, modulus), modulus)
+            for _ in range(2)
+        ]
+        exponents = [rng.getrandbits(bits) for _ in range(2)]
+        identity = dislog.ModuloInteger(1, modulus)
+        repeat = max(3, 2 ** 14 // bits)
+
+        print("{:5} {:12.1f} {:12.1f} {:12.1f}".format(
+            bits,
+            bench(
+                lambda: (bases[0] ** exponents[0]) * (bases[1] ** exponents[1]),
+                repeat
+            ),
+            bench(lambda: multi_power(bases, exponents), repeat),
+            bench(lambda: dgutil.straus(bases, exponents, identity), repeat)
+        ))
+
+    print("(microseconds per product of two powers, best of repeated runs)")
+
+
+if __name__ == '__main__':
+    main()
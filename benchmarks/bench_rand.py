@@ -0,0 +1,71 @@
+"""Compares cyclic group sampling against the former list-based version.
+
+Usage (from the repository root): python -m benchmarks.bench_rand
+"""
+import random
+import time
+import dislog
+from dislog.util import isgenerator
+from dislog.util import rand_cyclic_zstar_instances
+from sympy.core.numbers import igcd as gcd
+from sympy.ntheory import factorint
+
+
+INSTANCES = 200
+
+# Largest modulus sampled with the former version
+LEGACY_LIMIT = 10 ** 6
+
+
+def legacy_rand_cyclic_zstar(min_modulus, max_modulus):
+    # Former rand_cyclic_zstar: lists of all the moduli and all the units
+    moduli = list(range(min_modulus, max_modulus + 1))
+    random.shuffle(moduli)
+
+    while moduli:
+        modulus = moduli.pop()
+
+        n = sum(1 for i in range(modulus) if gcd(i, modulus) == 1)
+        n_primes = factorint(n).keys()
+
+        elements = [i for i in range(modulus) if gcd(i, modulus) == 1]
+        random.shuffle(elements)
+
+        while elements:
+            g = elements.pop()
+            if isgenerator(dislog.ModuloInteger(g, modulus), n, n_primes):
+                return (modulus, n, g)
+    return None
+
+def main():
+    random.seed(0)
+    rng = random.Random(0)
+
+    print("{:>8} {:>18} {:>18}".format(
+        "modulus", "legacy (inst/s)", "streaming (inst/s)"
+    ))
+
+    for exponent in (4, 6, 9, 12, 18, 24):
+        low = 10 ** exponent
+
+        legacy = float('nan')
+        if low <= LEGACY_LIMIT:
+            count = max(1, 10 ** (6 - exponent))
+            start = time.perf_counter()
+            for _ in range(count):
+                legacy_rand_cyclic_zstar(low, 2 * low)
+            legacy = count / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        instances = list(
+            rand_cyclic_zstar_instances(low, 2 * low, INSTANCES, rng)
+        )
+        streaming = len(instances) / (time.perf_counter() - start)
+
+        print("{:>8} {:18.2f} {:18.1f}".format(
+            "10^{}".format(exponent), legacy, streaming
+        ))
+
+
+if __name__ == '__main__':
+    main()
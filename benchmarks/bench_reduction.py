@@ -0,0 +1,101 @@
+"""Compares built-in modular arithmetic with Montgomery and Barrett reduction.
+
+Both reductions replace the division by the modulus with multiplications
+and shifts, and Montgomery form can be kept through a whole
+exponentiation. Written in Python, they lose to the built-in int % and pow
+at the modulus sizes of the solvers, which is why ModuloInteger keeps them.
+
+Usage (from the repository root): python -m benchmarks.bench_reduction
+"""
+import random
+import timeit
+
+
+NUMBER = 2000
+
+
+def montgomery(modulus):
+    # Returns the REDC multiplication and the conversions from and to
+    # Montgomery form, with R = 2^bits
+    bits = modulus.bit_length()
+    mask = (1 << bits) - 1
+    factor = -pow(modulus, -1, 1 << bits) & mask
+    r2 = pow(2, 2 * bits, modulus)
+
+    def mul(a, b):
+        t = a * b
+        t = (t + ((t & mask) * factor & mask) * modulus) >> bits
+        return t - modulus if t >= modulus else t
+
+    return mul, (lambda a: mul(a, r2)), (lambda a: mul(a, 1))
+
+def barrett(modulus):
+    # Returns the Barrett multiplication of canonical residues
+    bits = modulus.bit_length()
+    mu = (1 << (2 * bits)) // modulus
+
+    def mul(a, b):
+        t = a * b
+        r = t - (((t >> (bits - 1)) * mu) >> (bits + 1)) * modulus
+        while r >= modulus:
+            r -= modulus
+        return r
+
+    return mul
+
+def square_multiply(mul, one, base, exponent):
+    # Left-to-right square and multiply with a given multiplication
+    ret = one
+    for bit in bin(exponent)[2:]:
+        ret = mul(ret, ret)
+        if bit == '1':
+            ret = mul(ret, base)
+    return ret
+
+def ns(statement, namespace, number=NUMBER):
+    return min(timeit.repeat(
+        statement, globals=namespace, number=number, repeat=5
+    )) / number * 1e9
+
+def main():
+    rng = random.Random(0)
+
+    print("{:>6} {:>10} {:>10} {:>11} {:>12} {:>12} {:>12}".format(
+        "bits", "a*b%m", "barrett", "montgomery",
+        "pow (us)", "barrett", "montgomery"
+    ))
+
+    for bits in (256, 512, 1024, 2048, 4096):
+        modulus = rng.getrandbits(bits) | 1 | (1 << (bits - 1))
+        a = rng.randrange(modulus)
+        b = rng.randrange(modulus)
+        e = rng.getrandbits(bits)
+        mont_mul, to_mont, from_mont = montgomery(modulus)
+
+        namespace = {
+            'a': a, 'b': b, 'e': e, 'm': modulus,
+            'barrett': barrett(modulus), 'mont': mont_mul,
+            'to_mont': to_mont, 'from_mont': from_mont,
+            'square_multiply': square_multiply
+        }
+        number = max(1, NUMBER * 256 // bits // 16)
+
+        print("{:6} {:10.0f} {:10.0f} {:11.0f} {:12.1f} {:12.1f} {:12.1f}"
+              .format(
+                  bits,
+                  ns("a * b % m", namespace),
+                  ns("barrett(a, b)", namespace),
+                  ns("mont(a, b)", namespace),
+                  ns("pow(a, e, m)", namespace, number) / 1e3,
+                  ns("square_multiply(barrett, 1, a, e)", namespace,
+                     number) / 1e3,
+                  ns("from_mont(square_multiply(mont, to_mont(1), "
+                     "to_mont(a), e))", namespace, number) / 1e3
+              ))
+
+    print("(nanoseconds per multiplication, microseconds per exponentiation"
+          " with a full size exponent)")
+
+
+if __name__ == '__main__':
+    main()
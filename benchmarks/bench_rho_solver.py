@@ -0,0 +1,69 @@
+"""Measures the cost of successive logarithms with the multi-target rho solver.
+
+Logarithms are computed one after the other in the subgroup of prime order q
+of Z_p^*, for a safe prime p, with a single RhoSolver, and the mean number
+of steps of each batch of queries is compared with sqrt(q) and with a fresh
+rho (expollard with an adding walk) for every query.
+
+Usage (from the repository root): python -m benchmarks.bench_rho_solver
+"""
+import math
+import random
+import time
+import dislog
+from benchmarks.bench_pollard import safe_prime
+from dislog.util import stats
+
+
+BATCHES = (1, 10, 100, 1000)
+
+
+def main():
+    rng = random.Random(0)
+    stats.enable()
+
+    print("{:>5} {:>9} {:>12} {:>14} {:>10} {:>8}".format(
+        "bits", "queries", "mean steps", "steps/sqrt(q)", "mean ms", "points"
+    ))
+
+    for bits in (24, 32):
+        p, q = safe_prime(bits, rng)
+        alpha = dislog.ModuloInteger(4, p)
+        solver = dislog.RhoSolver(alpha, q, seed=0)
+
+        # Fresh rho for every query, as a reference
+        stats.reset()
+        logs = [rng.randrange(q) for _ in range(5)]
+        start = time.perf_counter()
+        for log in logs:
+            beta = alpha ** log
+            walk = dislog.AddingWalk(alpha, beta, q, seed=log)
+            assert dislog.expollard(alpha, beta, q, walk=walk) == log
+        elapsed = (time.perf_counter() - start) / len(logs) * 1e3
+        steps = stats.report()['dislog.pollard.pollard']['steps'] / len(logs)
+        print("{:>5} {:>9} {:12.0f} {:14.2f} {:10.2f} {:>8}".format(
+            bits, "fresh", steps, steps / math.sqrt(q), elapsed, "-"
+        ))
+
+        done = 0
+        for batch in BATCHES:
+            stats.reset()
+            logs = [rng.randrange(q) for _ in range(batch - done)]
+            start = time.perf_counter()
+            for log in logs:
+                assert solver.solve(alpha ** log) == log
+            elapsed = (time.perf_counter() - start) / len(logs) * 1e3
+            steps = (
+                stats.report()['dislog.pollard.RhoSolver.solve']['steps']
+                / len(logs)
+            )
+            done = batch
+
+            print("{:>5} {:>9} {:12.0f} {:14.2f} {:10.2f} {:>8}".format(
+                bits, "{}-{}".format(batch - len(logs) + 1, batch), steps,
+                steps / math.sqrt(q), elapsed, len(solver.points)
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""Compares memory and time of the baby-step table backends.
+
+Usage (from the repository root): python -m benchmarks.bench_table
+"""
+import time
+import tracemalloc
+import dislog
+from dislog.util import table
+
+
+# Prime modulus, large enough for the powers of 2 not to repeat
+MODULUS = 1000000000039
+SIZES = (10 ** 4, 10 ** 5, 10 ** 6)
+LOOKUPS = 10 ** 5
+
+
+def build(kind, m):
+    alpha = dislog.ModuloInteger(2, MODULUS)
+    exp_table = table.make_table(kind, m)
+    power = alpha ** 0
+    for j in range(m):
+        exp_table.insert(power, j)
+        power *= alpha
+    exp_table.finalize()
+    return exp_table
+
+def main():
+    print("{:>8} {:<7} {:>12} {:>10} {:>14}".format(
+        "m", "table", "bytes/entry", "build s", "lookup us"
+    ))
+
+    probe = dislog.ModuloInteger(3, MODULUS)
+
+    for m in SIZES:
+        for kind in table.TABLES:
+            tracemalloc.start()
+            started = time.perf_counter()
+            exp_table = build(kind, m)
+            elapsed = time.perf_counter() - started
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            started = time.perf_counter()
+            for _ in range(LOOKUPS):
+                exp_table.lookup(probe)
+            lookup = (time.perf_counter() - started) / LOOKUPS
+
+            print("{:8} {:<7} {:12.1f} {:10.2f} {:14.2f}".format(
+                m, kind, size / m, elapsed, lookup * 1e6
+            ))
+            del exp_table
+
+
+if __name__ == '__main__':
+    main()
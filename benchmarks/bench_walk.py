@@ -0,0 +1,52 @@
+"""Compares the mean steps to a collision of the pollard iteration functions.
+
+Usage (from the repository root): python -m benchmarks.bench_walk
+"""
+import math
+import random
+import dislog
+from benchmarks.bench_pollard import safe_prime
+from dislog.util import stats
+
+
+QUERIES = 30
+
+
+def main():
+    rng = random.Random(1)
+    stats.enable()
+
+    print("{:>5} {:<16} {:>12} {:>16}".format(
+        "bits", "walk", "mean steps", "steps/sqrt(n)"
+    ))
+
+    for bits in (20, 24, 28):
+        p, q = safe_prime(bits, rng)
+        alpha = dislog.ModuloInteger(4, p)
+        logs = [rng.randrange(1, q) for _ in range(QUERIES)]
+
+        walks = {
+            'classic': lambda beta: dislog.ClassicWalk(
+                alpha, beta, q, dislog.modint_pollard_map
+            ),
+            'adding (r=20)': lambda beta: dislog.AddingWalk(alpha, beta, q),
+            'mixed (16+4)': lambda beta: dislog.MixedWalk(alpha, beta, q)
+        }
+
+        for name, make_walk in walks.items():
+            stats.reset()
+            for log in logs:
+                beta = alpha ** log
+                ret = dislog.pollard(
+                    alpha, beta, q, walk=make_walk(beta), method='brent'
+                )
+                assert ret == log
+
+            steps = stats.report()['dislog.pollard.pollard']['steps']
+            print("{:5} {:<16} {:12.0f} {:16.2f}".format(
+                bits, name, steps / QUERIES, steps / QUERIES / math.sqrt(q)
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -15,18 +15,56 @@ Usage example:
     # Compute the discrete logarithm of beta to the base alpha with an
     # exhaustive search
     dislog.exhaustive(alpha, beta, n)
+
+The algorithms only rely on the operations of dislog.group.GroupElement, so
+they work as well on the points of an elliptic curve, written
+multiplicatively:
+
+    # Curve y^2 = x^3 + 3x + 6 over F_{10007}, with 10039 points
+    curve = dislog.EllipticCurve(10007, 3, 6, order=10039)
+    alpha = curve.point(0, 1973)
+    beta = alpha ** 1234
+
+    dislog.babygiant(alpha, beta, 10039)
 """
 
 __all__ = [
-    'babygiant', 'exhaustive', 'ModuloInteger', 'pohlighellman',
-    'expollard', 'modint_pollard_map', 'pollard'
+    'babygiant', 'BabyGiantSolver', 'batch_babygiant', 'batch_inverse',
+    'batch_pohlighellman', 'clear_caches', 'EllipticCurve',
+    'EllipticCurvePoint', 'exhaustive', 'GroupElement', 'indexcalculus',
+    'IndexCalculusSolver',
+    'interval_babygiant', 'kangaroo', 'parallel_kangaroo', 'ModuloInteger',
+    'ModulusContext', 'pohlighellman', 'expollard', 'modint_pollard_map',
+    'parallel_pollard', 'pollard', 'RhoSolver', 'solve',
+    'AddingWalk', 'ClassicWalk', 'MixedWalk', 'NegationWalk'
 ]
 
 
+from dislog.babygiant import BabyGiantSolver
 from dislog.babygiant import babygiant
+from dislog.babygiant import interval_babygiant
+from dislog.batch import batch_babygiant
+from dislog.batch import batch_pohlighellman
+from dislog.ellipticcurve import EllipticCurve
+from dislog.ellipticcurve import EllipticCurvePoint
 from dislog.exhaustive import exhaustive
+from dislog.group import GroupElement
+from dislog.indexcalculus import IndexCalculusSolver
+from dislog.indexcalculus import indexcalculus
+from dislog.kangaroo import kangaroo
+from dislog.kangaroo import parallel_kangaroo
 from dislog.modulointeger import ModuloInteger
+from dislog.modulointeger import ModulusContext
+from dislog.modulointeger import batch_inverse
 from dislog.pohlighellman import pohlighellman
+from dislog.pollard import RhoSolver
 from dislog.pollard import expollard
 from dislog.pollard import modint_pollard_map
+from dislog.pollard import parallel_pollard
 from dislog.pollard import pollard
+from dislog.solve import clear_caches
+from dislog.solve import solve
+from dislog.walk import AddingWalk
+from dislog.walk import ClassicWalk
+from dislog.walk import MixedWalk
+from dislog.walk import NegationWalk
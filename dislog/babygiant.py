@@ -1,25 +1,121 @@
-import decimal
+import array
+import json
 import math
+import mmap
+from dislog.util import DEBUG
 from dislog.util import debug
+from dislog.util import stats
+from dislog.util import subgroup_order
+from dislog.util.table import DictTable
+from dislog.util.table import HashTable
+from dislog.util.table import SortedTable
+from dislog.util.table import estimate_bytes
+from dislog.util.table import fingerprint
+from dislog.util.table import make_table
 
-def _round_sqrt(n):
-    # Conversion to handle decimal operations on big numbers
-    dec_n = decimal.Decimal(n)
+# Smallest integer r such that r * r >= n
+def _ceil_sqrt(n):
+    root = math.isqrt(n)
+    return root if root * root == n else root + 1
 
-    # Set precision for calculating the square root of n up to at least one
-    # digit beyond the decimal point
-    num_digits = dec_n.adjusted() + 1
-    prec = num_digits // 2 + 2
-    context = decimal.Context(prec=prec, rounding=decimal.ROUND_UP)
+def choose_m(n, queries=1, memory=None, max_entries=None, table='dict'):
+    """Chooses the number of baby steps to store.
 
-    # Find root of order and round it up
-    dec_sqrt = dec_n.sqrt(context)
-    sqrt = int(dec_sqrt.to_integral_value(context=context))
-    debug(_round_sqrt, "sqrt={} rounded_sqrt={}", dec_sqrt, sqrt)
+    Building the table costs m multiplications, and each query costs at most
+    ceil(n / m) giant steps, so for q queries the total cost m + q * n / m is
+    minimal at m = sqrt(q * n): the more queries share a table, the larger it
+    should be. m is then capped by the memory budget and by n.
 
-    return sqrt
+    Args:
+        n: order of the group
+        queries: expected number of logarithms computed with the same table
+        memory: maximum size of the table in bytes, as estimated by
+            dislog.util.table.estimate_bytes; unbounded if not specified
+        max_entries: maximum number of entries of the table; unbounded if not
+            specified
+        table: baby-step table backend (see babygiant)
+
+    Returns:
+        The number m of baby steps, at least 1
+    """
+    m = min(_ceil_sqrt(n * max(queries, 1)), n)
+
+    if max_entries is not None:
+        m = min(m, max_entries)
+
+    if memory is not None and estimate_bytes(table, m) > memory:
+        # Largest m within the budget, the estimate being non-decreasing in m
+        low, high = 0, m
+        while low < high:
+            middle = (low + high + 1) // 2
+            if estimate_bytes(table, middle) <= memory:
+                low = middle
+            else:
+                high = middle - 1
+        m = low
 
-def babygiant(alpha, beta, n, m=None):
+    m = max(m, 1)
+    debug(
+        choose_m, "n={} queries={} memory={} max_entries={}: m={}",
+        n, queries, memory, max_entries, m
+    )
+    return m
+
+# Fills a baby-step table with the powers alpha^j for j in [0, m)
+def _build_table(alpha, m, table):
+    exp_table = make_table(table, m)
+    insert = exp_table.insert
+
+    # Fill table (using multiplications for efficiency)
+    power = alpha ** 0
+    insert(power, 0)
+    for j in range(1, m):
+        power *= alpha
+        insert(power, j)
+        if DEBUG:
+            debug(babygiant, "Adding {} : {} to table", power, j)
+    exp_table.finalize()
+
+    return exp_table
+
+# Giant steps: looks up beta * ((alpha ^ -m) ^ i) in the table for increasing
+# i, up to ceil(n / m) not included. Returns the logarithm (None if it does
+# not exist), the number of giant steps and of candidate verifications
+def _giant_steps(alpha, beta, n, m, exp_table, factor):
+    # At each iteration, candidate = beta * ((alpha ^ -m) ^ i)
+    candidate = beta
+    lookup = exp_table.lookup
+    exact = exp_table.exact
+    verifications = 0
+
+    # Check all powers up to the ceil of n / m not included
+    for i in range((n + m - 1) // m):
+        if DEBUG:
+            debug(
+                babygiant, "Checking presence of {} in lookup table", candidate
+            )
+        for j in lookup(candidate):
+            # Fingerprint tables may return false candidates
+            if not exact:
+                verifications += 1
+                if alpha ** j != candidate:
+                    continue
+
+            exp = i * m + j
+            debug(babygiant, "Found candidate; logarithm = {}", exp)
+            return exp, i + 1, verifications
+
+        if DEBUG:
+            debug(
+                babygiant, "Candidate not found; multiplying by {}", factor
+            )
+        candidate *= factor
+
+    debug(babygiant, "Logarithm does not exist")
+    return None, (n + m - 1) // m, verifications
+
+def babygiant(alpha, beta, n, m=None, table='dict', memory=None,
+              max_entries=None, n_factors=None):
     """Computes discrete logarithm using baby-step giant-step algorithm.
 
     Given a generator alpha of a cyclic group G, another element beta of the
@@ -34,7 +130,18 @@ def babygiant(alpha, beta, n, m=None):
             multiplication
         n: order of the group containing alpha and beta
         m: number of elements that the algorithm can store in memory; should be
-            less than n; if not specified, it is set to ceil(sqrt(n))
+            less than n; if not specified, it is chosen by choose_m within
+            the memory budget, that is ceil(sqrt(n)) if it fits
+        table: baby-step table backend (see dislog.util.table); 'dict' stores
+            the elements themselves, 'hash' (open addressing) and 'sorted'
+            (binary search) store 32 bit fingerprints and exponents in packed
+            arrays, for a few bytes per entry, verifying the candidates
+        memory: maximum size of the table in bytes, if m is not specified
+        max_entries: maximum number of table entries, if m is not specified
+        n_factors: dictionary containing the prime factors of n as keys and
+            their multiplicity as values; if specified, the search is limited
+            to the order of alpha, and skipped if beta is not a power of
+            alpha (see dislog.util.subgroup_order)
 
     Returns:
         The discrete logarithm log_{alpha}(beta) (the integer x such that alpha
@@ -42,40 +149,304 @@ def babygiant(alpha, beta, n, m=None):
     """
     debug(babygiant, "alpha={}\tbeta={}\tn={}\t", alpha, beta, n)
 
+    if n_factors is not None:
+        subgroup = subgroup_order(alpha, beta, n, n_factors)
+        if subgroup is None:
+            debug(babygiant, "beta is not a power of alpha")
+            return None
+        n = subgroup[0]
+
+    token = stats.start(babygiant)
+
     if m is None:
-        m = _round_sqrt(n)
+        m = choose_m(n, 1, memory, max_entries, table)
 
     # Exponent lookup table
     # Key: a^j, value: j
-    exp_table = {}
+    exp_table = _build_table(alpha, m, table)
 
-    # Fill table (using multiplications for efficiency)
-    power = alpha ** 0
-    exp_table[power] = 0
-    for j in range(1, m):
-        power *= alpha
-        if power not in exp_table:
-            exp_table[power] = j
-        debug(babygiant, "Adding {} : {} to table", power, j)
+    # alpha^-m, with the exponent reduced modulo the group order
+    factor = alpha ** (-m % n)
+
+    exp, giant_steps, verifications = _giant_steps(
+        alpha, beta, n, m, exp_table, factor
+    )
+
+    stats.record(
+        babygiant, token,
+        exponentiations=2 + verifications,
+        multiplications=(m - 1) + (giant_steps - 1),
+        table_inserts=len(exp_table),
+        table_lookups=giant_steps,
+        steps=giant_steps,
+        params={
+            'm': m, 'table': table, 'memory': memory,
+            'max_entries': max_entries
+        }
+    )
+    return exp
 
-    factor = alpha ** (-m)
-    if factor is None:
-        debug(babygiant, "alpha^-m does not exist, cannot use babygiant")
+
+def interval_babygiant(alpha, beta, lo, hi, m=None, table='dict', n=None):
+    """Computes discrete logarithm in an interval using baby-step giant-step.
+
+    Given an element alpha of a cyclic group G and another element beta of
+    G whose logarithm is known to lie in the interval [lo, hi], computes the
+    discrete logarithm of beta to the base of alpha with the baby-step
+    giant-step algorithm restricted to the interval: the giant steps start
+    from beta * alpha^-lo, and only ceil((hi - lo + 1) / m) of them are
+    needed. Unlike the kangaroo method, it is deterministic, at the cost of
+    a table of m elements.
+
+    Args:
+        alpha: logarithm base (see babygiant)
+        beta: logarithm argument (see babygiant)
+        lo: smallest possible logarithm
+        hi: largest possible logarithm
+        m: number of baby steps to store; ceil(sqrt(hi - lo + 1)) if not
+            specified
+        table: baby-step table backend (see babygiant)
+        n: order of the group containing alpha and beta, used to reduce the
+            negative exponents; if not specified, alpha must support negative
+            exponents
+
+    Returns:
+        The discrete logarithm log_{alpha}(beta) in [lo, hi] if it exists,
+        None otherwise
+    """
+    debug(
+        interval_babygiant, "alpha={}\tbeta={}\tlo={}\thi={}",
+        alpha, beta, lo, hi
+    )
+
+    if hi < lo:
+        raise ValueError("Must be: lo <= hi")
+
+    token = stats.start(interval_babygiant)
+    width = hi - lo + 1
+
+    if m is None:
+        m = _ceil_sqrt(width)
+
+    exp_table = _build_table(alpha, m, table)
+
+    # beta * alpha^-lo and alpha^-m
+    start = beta * alpha ** (-lo if n is None else -lo % n)
+    factor = alpha ** (-m if n is None else -m % n)
+
+    exp, giant_steps, verifications = _giant_steps(
+        alpha, start, width, m, exp_table, factor
+    )
+
+    stats.record(
+        interval_babygiant, token,
+        exponentiations=3 + verifications,
+        multiplications=m + giant_steps - 1,
+        table_inserts=len(exp_table),
+        table_lookups=giant_steps,
+        steps=giant_steps,
+        params={'m': m, 'table': table}
+    )
+
+    # The last giant step may reach beyond hi
+    if exp is None or exp >= width:
         return None
+    return lo + exp
 
-    # At each iteration, candidate = beta * ((alpha ^ -m) ^ i)
-    candidate = beta
 
-    # Check all powers up to the ceil of n / m not included
-    for i in range((n + m - 1) // m):
-        debug(babygiant, "Checking presence of {} in lookup table", candidate)
-        if candidate in exp_table:
-            exp = i * m + exp_table[candidate]
-            debug(babygiant, "Found candidate; logarithm = {}", exp)
-            return exp
+# Serialized table layout: magic string, length of the JSON header as 8 byte
+# little endian integer, JSON header, then the key and value arrays, each
+# starting at an offset multiple of 8 bytes
+_MAGIC = b'DISLOGBG'
 
-        debug(babygiant, "Candidate not found; multiplying by {}", factor)
-        candidate *= factor
+def _aligned(offset):
+    return (offset + 7) // 8 * 8
 
-    debug(babygiant, "Logarithm does not exist")
-    return None
+
+class BabyGiantSolver:
+    """Baby-step giant-step solver reusing one table for many logarithms.
+
+    The table of the powers alpha^j, j in [0, m), is built once, so that each
+    logarithm only costs at most ceil(n / m) giant steps. Tables can be saved
+    to disk and loaded back through a memory map, so that several processes
+    share a single copy of the table in the page cache.
+
+    Attributes:
+        alpha: logarithm base
+        n: order of the group containing alpha
+        m: number of baby steps stored in the table
+        table: baby-step table (see dislog.util.table)
+        params: parameters the table was built with
+    """
+
+    def __init__(self, alpha, n, m=None, table='hash', queries=1, memory=None,
+                 max_entries=None):
+        """Builds the baby-step table.
+
+        Args:
+            alpha: logarithm base (see babygiant)
+            n: order of the group containing alpha
+            m: number of baby steps to store; if not specified, it is chosen
+                by choose_m from the other parameters
+            table: baby-step table backend (see babygiant)
+            queries: expected number of logarithms to compute, used to choose
+                m; larger tables pay off over more queries
+            memory: maximum size of the table in bytes, if m is not specified
+            max_entries: maximum number of table entries, if m is not
+                specified
+        """
+        token = stats.start(BabyGiantSolver)
+
+        if m is None:
+            m = choose_m(n, queries, memory, max_entries, table)
+
+        self.alpha = alpha
+        self.n = n
+        self.m = m
+        self.table = _build_table(alpha, m, table)
+        self._factor = alpha ** (-m % n)
+        self.params = {
+            'm': m, 'table': table, 'queries': queries, 'memory': memory,
+            'max_entries': max_entries
+        }
+
+        stats.record(
+            BabyGiantSolver, token,
+            exponentiations=2, multiplications=m - 1,
+            table_inserts=len(self.table), params=self.params
+        )
+
+    def solve(self, beta):
+        """Computes the discrete logarithm of beta to the base alpha.
+
+        Args:
+            beta: logarithm argument (see babygiant)
+
+        Returns:
+            The discrete logarithm log_{alpha}(beta) if it exists, None
+            otherwise
+        """
+        token = stats.start(BabyGiantSolver.solve)
+
+        exp, giant_steps, verifications = _giant_steps(
+            self.alpha, beta, self.n, self.m, self.table, self._factor
+        )
+
+        stats.record(
+            BabyGiantSolver.solve, token,
+            exponentiations=verifications,
+            multiplications=giant_steps - 1,
+            table_lookups=giant_steps,
+            steps=giant_steps
+        )
+        return exp
+
+    def solve_many(self, betas):
+        """Computes the discrete logarithms of several elements.
+
+        Args:
+            betas: iterable of logarithm arguments
+
+        Returns:
+            A list with the logarithm of each argument, None where it does not
+            exist
+        """
+        return [self.solve(beta) for beta in betas]
+
+    def save(self, path):
+        """Writes the table to a file.
+
+        Tables backed by a dictionary are written as sorted fingerprint
+        tables.
+
+        Args:
+            path: path of the file
+        """
+        exp_table = self.table
+        if isinstance(exp_table, DictTable):
+            sorted_table = SortedTable(self.m)
+            for x, j in exp_table.items():
+                sorted_table.insert(x, j)
+            sorted_table.finalize()
+            exp_table = sorted_table
+
+        keys = exp_table.keys
+        values = exp_table.values
+        header = json.dumps({
+            'version': 1,
+            'n': self.n,
+            'm': self.m,
+            'alpha': fingerprint(self.alpha),
+            'table': 'hash' if isinstance(exp_table, HashTable) else 'sorted',
+            'key_bits': exp_table.key_bits,
+            'size': len(exp_table),
+            'keys': [keys.typecode, keys.itemsize, len(keys)],
+            'values': [values.typecode, values.itemsize, len(values)]
+        }).encode()
+
+        with open(path, 'wb') as file:
+            file.write(_MAGIC)
+            file.write(len(header).to_bytes(8, 'little'))
+            file.write(header)
+            for data in (keys, values):
+                file.write(bytes(_aligned(file.tell()) - file.tell()))
+                file.write(data.tobytes())
+
+        debug(BabyGiantSolver.save, "Saved {} entries to {}", len(exp_table),
+              path)
+
+    @classmethod
+    def load(cls, path, alpha, use_mmap=True):
+        """Loads a table written by save.
+
+        Args:
+            path: path of the file
+            alpha: logarithm base the table was built for
+            use_mmap: if True, the table arrays are memory-mapped read-only
+                instead of being read into memory
+
+        Returns:
+            A BabyGiantSolver instance
+        """
+        with open(path, 'rb') as file:
+            if use_mmap:
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                data = file.read()
+
+        if data[:len(_MAGIC)] != _MAGIC:
+            raise ValueError("Not a baby-step table file: {}".format(path))
+
+        offset = len(_MAGIC) + 8
+        header_length = int.from_bytes(data[len(_MAGIC):offset], 'little')
+        header = json.loads(bytes(data[offset:offset + header_length]))
+        offset += header_length
+
+        if header['version'] != 1:
+            raise ValueError("Unsupported table version")
+        if header['alpha'] != fingerprint(alpha):
+            raise ValueError("Table was built for a different logarithm base")
+
+        arrays = []
+        view = memoryview(data)
+        for typecode, itemsize, length in (header['keys'], header['values']):
+            if array.array(typecode).itemsize != itemsize:
+                raise ValueError("Table was written on an incompatible platform")
+            offset = _aligned(offset)
+            arrays.append(
+                view[offset:offset + itemsize * length].cast(typecode)
+            )
+            offset += itemsize * length
+
+        table_class = HashTable if header['table'] == 'hash' else SortedTable
+
+        solver = cls.__new__(cls)
+        solver.alpha = alpha
+        solver.n = header['n']
+        solver.m = header['m']
+        solver.params = {'m': solver.m, 'table': header['table']}
+        solver.table = table_class.from_arrays(
+            *arrays, header['key_bits'], header['size']
+        )
+        solver._factor = alpha ** (-solver.m % solver.n)
+        return solver
@@ -0,0 +1,244 @@
+from dislog.babygiant import choose_m
+from dislog.modulointeger import ModuloInteger
+from dislog.util import debug
+from dislog.util import order_factors
+from dislog.util import stats
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Moduli must be below this bound, so that the product of two residues fits
+# in a signed 64 bit integer
+MAX_MODULUS = 2 ** 31
+
+def _check(alpha):
+    if numpy is None:
+        raise ImportError("Batch solvers require NumPy")
+
+    if not isinstance(alpha, ModuloInteger):
+        raise TypeError("Batch solvers require ModuloInteger elements")
+
+    if alpha.modulus >= MAX_MODULUS:
+        raise ValueError(
+            "Batch solvers require moduli less than {}".format(MAX_MODULUS)
+        )
+
+# Converts the arguments (ModuloInteger instances, integers or an array of
+# integers) to an int64 array of residues
+def _values(betas, modulus):
+    if isinstance(betas, numpy.ndarray):
+        return betas.astype(numpy.int64) % modulus
+
+    return numpy.array(
+        [int(beta.value) if isinstance(beta, ModuloInteger) else int(beta)
+         for beta in betas],
+        dtype=numpy.int64
+    ) % modulus
+
+# Converts an int64 array of logarithms, with -1 for missing ones, to a list
+def _logs(logs):
+    return [None if log < 0 else int(log) for log in logs]
+
+def _powmod(bases, exponents, modulus):
+    # Square-and-multiply over arrays: bases and exponents can be arrays
+    # (elementwise) or scalars
+    bases = numpy.asarray(bases, dtype=numpy.int64) % modulus
+    exponents = numpy.asarray(exponents, dtype=numpy.int64)
+    result = numpy.ones(
+        numpy.broadcast(bases, exponents).shape, dtype=numpy.int64
+    )
+
+    if exponents.ndim == 0:
+        # Same exponent for all the elements: scalar control flow
+        exponent = int(exponents)
+        while exponent:
+            if exponent & 1:
+                result = result * bases % modulus
+            bases = bases * bases % modulus
+            exponent >>= 1
+        return result
+
+    exponents = exponents.copy()
+    while exponents.any():
+        odd = (exponents & 1).astype(bool)
+        result = numpy.where(odd, result * bases % modulus, result)
+        bases = bases * bases % modulus
+        exponents >>= 1
+    return result
+
+# Powers alpha^j for j in [0, m), doubling the computed prefix at each step
+def _powers(alpha, m, modulus):
+    powers = numpy.ones(1, dtype=numpy.int64)
+    while len(powers) < m:
+        step = pow(alpha, len(powers), modulus)
+        powers = numpy.concatenate((powers, powers * step % modulus))
+    return powers[:m]
+
+# Batch baby-step giant-step on residues; returns an int64 array of
+# logarithms, -1 where they do not exist
+def _babygiant(alpha, betas, n, m, modulus):
+    # Baby steps sorted by value; stable sorting keeps the smallest exponent
+    # first among equal values
+    powers = _powers(alpha, m, modulus)
+    order = numpy.argsort(powers, kind='stable')
+    table_values = powers[order]
+    table_exps = order
+
+    factor = pow(alpha, -m % n, modulus)
+
+    logs = numpy.full(len(betas), -1, dtype=numpy.int64)
+    pending = numpy.arange(len(betas))
+    candidates = betas.copy()
+
+    for i in range((n + m - 1) // m):
+        if not len(pending):
+            break
+
+        # Vectorized lookup of all the pending candidates
+        slots = numpy.searchsorted(table_values, candidates)
+        slots[slots == len(table_values)] = 0
+        found = table_values[slots] == candidates
+
+        logs[pending[found]] = i * m + table_exps[slots[found]]
+
+        pending = pending[~found]
+        candidates = candidates[~found] * factor % modulus
+
+    return logs
+
+def batch_babygiant(alpha, betas, n, m=None):
+    """Computes many discrete logarithms with vectorized baby-step giant-step.
+
+    Given a generator alpha of a cyclic subgroup of Z_p^*, with modulus less
+    than 2^31, the order n of the subgroup and many elements beta, computes
+    the discrete logarithms of all of them at once: the baby steps are
+    sorted once, and each giant step multiplies and looks up all the pending
+    arguments with NumPy array operations.
+
+    Args:
+        alpha: logarithm base, a ModuloInteger instance; should be a
+            generator to guarantee the existence of the logarithms
+        betas: logarithm arguments, either ModuloInteger instances, integer
+            values or a NumPy array of values
+        n: order of the group containing alpha and the arguments
+        m: number of baby steps; if not specified, it is set to
+            ceil(sqrt(n)) (see dislog.babygiant.choose_m)
+
+    Returns:
+        A list with the discrete logarithm of each argument, None where it
+        does not exist
+    """
+    _check(alpha)
+    token = stats.start(batch_babygiant)
+
+    modulus = int(alpha.modulus)
+    values = _values(betas, modulus)
+
+    if m is None:
+        m = choose_m(n)
+    debug(batch_babygiant, "n={} m={} arguments={}", n, m, len(values))
+
+    logs = _babygiant(int(alpha.value), values, n, m, modulus)
+
+    stats.record(
+        batch_babygiant, token,
+        table_inserts=m, table_lookups=len(values),
+        params={'m': m, 'batch': len(values)}
+    )
+    return _logs(logs)
+
+# Combines x = r1 mod m1 and x = r2 mod m2, with coprime moduli, into
+# x mod (m1 * m2), elementwise over the arrays of remainders
+def _crt(r1, m1, r2, m2):
+    coefficient = pow(m1, -1, m2)
+    return r1 + m1 * ((r2 - r1) % m2 * coefficient % m2)
+
+def batch_pohlighellman(alpha, betas, n, n_factors):
+    """Computes many discrete logarithms with vectorized Pohlig-Hellman.
+
+    Given a generator alpha of a cyclic subgroup of Z_p^*, with modulus less
+    than 2^31, the order n of the subgroup, its prime factorization and many
+    elements beta, computes the discrete logarithms of all of them at once:
+    the per-digit exponentiations run over arrays of arguments, and the
+    digits are found with batch_babygiant in the subgroups of prime order.
+
+    Args:
+        alpha: logarithm base, a ModuloInteger instance; should be a
+            generator to guarantee the existence of the logarithms
+        betas: logarithm arguments, either ModuloInteger instances, integer
+            values or a NumPy array of values
+        n: order of the group containing alpha and the arguments
+        n_factors: dictionary containing the prime factors of n as keys and
+            their multiplicity as values
+
+    Returns:
+        A list with the discrete logarithm of each argument, None where it
+        does not exist
+    """
+    _check(alpha)
+    token = stats.start(batch_pohlighellman)
+
+    # Digits are computed in the subgroup generated by alpha
+    n_factors = order_factors(alpha, n, n_factors)
+    if n_factors is None:
+        debug(batch_pohlighellman, "The order of alpha does not divide n")
+        stats.record(batch_pohlighellman, token)
+        return [None] * len(betas)
+
+    n = 1
+    for p, e in n_factors.items():
+        n *= p ** e
+
+    modulus = int(alpha.modulus)
+    alpha_value = int(alpha.value)
+    values = _values(betas, modulus)
+    debug(
+        batch_pohlighellman,
+        "n={} factors={} arguments={}", n, n_factors, len(values)
+    )
+
+    alpha_inv = pow(alpha_value, n - 1, modulus)
+    failed = numpy.zeros(len(values), dtype=bool)
+
+    logs = numpy.zeros(len(values), dtype=numpy.int64)
+    logs_modulus = 1
+
+    for p, e in n_factors.items():
+        base = pow(alpha_value, n // p, modulus)
+        m = choose_m(p)
+
+        # arg_base = beta * alpha^(-rem), inv_pow = alpha^(-p^j)
+        arg_base = values
+        inv_pow = alpha_inv
+        cur_pow = 1
+        rem = numpy.zeros(len(values), dtype=numpy.int64)
+
+        for j in range(e):
+            arg = _powmod(arg_base, n // (cur_pow * p), modulus)
+            digits = _babygiant(base, arg, p, m, modulus)
+
+            failed |= digits < 0
+            digits[digits < 0] = 0
+            rem += digits * cur_pow
+
+            if j + 1 < e:
+                arg_base = arg_base * _powmod(inv_pow, digits, modulus) % modulus
+                inv_pow = pow(inv_pow, p, modulus)
+            cur_pow *= p
+
+        logs = _crt(logs, logs_modulus, rem, cur_pow)
+        logs_modulus *= cur_pow
+
+    # Digits exist even for the arguments which are not powers of alpha
+    failed |= _powmod(alpha_value, logs, modulus) != values
+    logs[failed] = -1
+
+    stats.record(
+        batch_pohlighellman, token,
+        steps=sum(n_factors.values()), params={'batch': len(values)}
+    )
+    return _logs(logs)
+
@@ -0,0 +1,400 @@
+from dislog.group import GroupElement
+from dislog.util import backend
+from dislog.util import stats
+from numbers import Integral
+from numbers import Number
+from sympy.ntheory.primetest import isprime
+from sympy.ntheory.residue_ntheory import sqrt_mod
+
+
+class EllipticCurve:
+    """Short Weierstrass curve y^2 = x^3 + ax + b over a prime field F_p.
+
+    The points of the curve, together with the point at infinity, form an
+    abelian group, written multiplicatively by EllipticCurvePoint so that the
+    solvers apply unchanged: the product of two points is their sum, and
+    the power P ** k is the scalar multiple kP.
+
+    Attributes:
+        p: prime greater than 3, of the integer backend type (see
+            dislog.util.backend)
+        a: coefficient of x, reduced modulo p
+        b: constant coefficient, reduced modulo p
+        order: order of the group of points (or of a subgroup containing all
+            the points in use), used to reduce exponents; None if unknown
+    """
+
+    __slots__ = ('p', 'a', 'b', 'order')
+
+    def __init__(self, p, a, b, order=None):
+        for name, value in (('p', p), ('a', a), ('b', b)):
+            if not isinstance(value, Number) or int(value) != value:
+                raise TypeError("{} must be an integer".format(name))
+
+        if p <= 3 or not isprime(int(p)):
+            raise ValueError("p must be a prime greater than 3")
+
+        if (4 * a ** 3 + 27 * b ** 2) % p == 0:
+            raise ValueError("Curve is singular")
+
+        if order is not None and (int(order) != order or order < 1):
+            raise ValueError("Order must be an integer greater than 0")
+
+        self.p = backend.mpz(int(p))
+        self.a = backend.mpz(int(a) % int(p))
+        self.b = backend.mpz(int(b) % int(p))
+        self.order = None if order is None else int(order)
+
+    def __eq__(self, other):
+        if isinstance(other, EllipticCurve):
+            return ((self.p, self.a, self.b, self.order)
+                    == (other.p, other.a, other.b, other.order))
+        return False
+
+    def __hash__(self):
+        return hash((self.p, self.a, self.b, self.order))
+
+    def __str__(self):
+        return "y^2 = x^3 + {}x + {} (mod {})".format(self.a, self.b, self.p)
+
+    def contains(self, x, y):
+        """Checks whether the affine point (x, y) lies on the curve."""
+        p = self.p
+        return (y * y - (x * x * x + self.a * x + self.b)) % p == 0
+
+    def point(self, x, y):
+        """Returns the point of the curve with affine coordinates (x, y)."""
+        return EllipticCurvePoint(x, y, self)
+
+    def infinity(self):
+        """Returns the point at infinity, identity of the group."""
+        return _trusted(1, 1, 0, self)
+
+    def lift_x(self, x):
+        """Finds a point of the curve with a given x coordinate.
+
+        Args:
+            x: integer x coordinate
+
+        Returns:
+            One of the (at most two) points with affine x coordinate x, None
+            if there is none
+        """
+        p = int(self.p)
+        x = int(x) % p
+        y = sqrt_mod((x * x * x + int(self.a) * x + int(self.b)) % p, p)
+        if y is None:
+            return None
+        return _trusted(backend.mpz(x), backend.mpz(y), 1, self)
+
+
+class EllipticCurvePoint:
+    """Point of an elliptic curve over a prime field, in Jacobian coordinates.
+
+    The triple (X, Y, Z) represents the affine point (X / Z^2, Y / Z^3), and
+    the point at infinity when Z = 0, so that additions and doublings need no
+    field inversion. Equality is checked by cross-multiplication; hashing and
+    the affine coordinates normalize the point to Z = 1 in place, with a
+    single inversion, which also makes later additions of the point cheaper.
+
+    The group is written multiplicatively (see dislog.group.GroupElement):
+    P * Q is the sum of the points, P ** k the scalar multiple kP, and the
+    inverse is the negation (x, -y), which is free.
+    """
+
+    __slots__ = ('X', 'Y', 'Z', 'curve')
+
+    def __init__(self, x, y, curve):
+        """Initializes a point from its affine coordinates.
+
+        Args:
+            x: affine x coordinate, None for the point at infinity
+            y: affine y coordinate, None for the point at infinity
+            curve: EllipticCurve instance containing the point
+        """
+        if not isinstance(curve, EllipticCurve):
+            raise TypeError("Curve must be an EllipticCurve instance")
+
+        if x is None and y is None:
+            self.X, self.Y, self.Z = backend.mpz(1), backend.mpz(1), 0
+            self.curve = curve
+            return
+
+        for value in (x, y):
+            if not isinstance(value, Number) or int(value) != value:
+                raise TypeError("Coordinates must be integers")
+
+        x = backend.mpz(int(x) % curve.p)
+        y = backend.mpz(int(y) % curve.p)
+        if not curve.contains(x, y):
+            raise ValueError("Point is not on the curve")
+
+        self.X, self.Y, self.Z = x, y, 1
+        self.curve = curve
+
+    @property
+    def x(self):
+        """Affine x coordinate, None for the point at infinity."""
+        self._normalize()
+        return None if self.Z == 0 else self.X
+
+    @property
+    def y(self):
+        """Affine y coordinate, None for the point at infinity."""
+        self._normalize()
+        return None if self.Z == 0 else self.Y
+
+    def is_infinity(self):
+        return self.Z == 0
+
+    # Rescales the coordinates in place to Z = 1 (or X = Y = 1 for the point
+    # at infinity); the represented point does not change
+    def _normalize(self):
+        Z = self.Z
+        if Z == 1:
+            return
+        if Z == 0:
+            self.X = self.Y = backend.mpz(1)
+            return
+
+        p = self.curve.p
+        stats.count('inversions')
+        z_inverse = backend.invert(Z, p)
+        zz_inverse = z_inverse * z_inverse % p
+        self.X = self.X * zz_inverse % p
+        self.Y = self.Y * zz_inverse * z_inverse % p
+        self.Z = 1
+
+    def __eq__(self, other):
+        if not isinstance(other, EllipticCurvePoint):
+            return False
+
+        Z1, Z2 = self.Z, other.Z
+        if Z1 == 0 or Z2 == 0:
+            return Z1 == Z2
+
+        # X1 / Z1^2 = X2 / Z2^2 and Y1 / Z1^3 = Y2 / Z2^3
+        p = self.curve.p
+        Z1Z1 = Z1 * Z1
+        Z2Z2 = Z2 * Z2
+        return ((self.X * Z2Z2 - other.X * Z1Z1) % p == 0
+                and (self.Y * Z2Z2 * Z2 - other.Y * Z1Z1 * Z1) % p == 0)
+
+    def __hash__(self):
+        self._normalize()
+        return hash((self.X, self.Y)) if self.Z else hash(None)
+
+    def __mul__(self, other):
+        if not isinstance(other, EllipticCurvePoint):
+            raise TypeError(
+                "Trying to multiply by a non-EllipticCurvePoint object"
+            )
+
+        curve = self.curve
+        if (other.curve is not curve
+            and (other.curve.p, other.curve.a, other.curve.b)
+                != (curve.p, curve.a, curve.b)):
+            raise ValueError("Curve must be the same")
+
+        return _trusted(*_add(
+            self.X, self.Y, self.Z, other.X, other.Y, other.Z,
+            curve.a, curve.p
+        ), curve)
+
+    # Points are used as lookup table keys, so in-place multiplication
+    # rebinds to a new instance instead of mutating
+    __imul__ = __mul__
+
+    def __pow__(self, exponent):
+        if not isinstance(exponent, Integral):
+            raise TypeError("Exponent must be an integer")
+
+        curve = self.curve
+        if curve.order is not None:
+            exponent %= curve.order
+
+        # Affine base, so that every addition in the ladder is a mixed one
+        self._normalize()
+        X, Y, Z = self.X, self.Y, self.Z
+        if exponent < 0:
+            exponent = -exponent
+            Y = -Y % curve.p
+
+        a, p = curve.a, curve.p
+        negative_Y = -Y % p
+
+        # Left to right double and add on the non-adjacent form of the
+        # exponent, which has at most one non-zero digit in two
+        X3, Y3, Z3 = 1, 1, 0
+        for digit in reversed(_naf(exponent)):
+            X3, Y3, Z3 = _double(X3, Y3, Z3, a, p)
+            if digit == 1:
+                X3, Y3, Z3 = _add(X3, Y3, Z3, X, Y, Z, a, p)
+            elif digit == -1:
+                X3, Y3, Z3 = _add(X3, Y3, Z3, X, negative_Y, Z, a, p)
+
+        return _trusted(X3, Y3, Z3, curve)
+
+    def __str__(self):
+        if self.is_infinity():
+            return "infinity"
+        return "({}, {}) (mod {})".format(self.x, self.y, self.curve.p)
+
+    def inverse(self):
+        """Computes the inverse of the point, that is its negation (x, -y).
+
+        Returns:
+            An EllipticCurvePoint representing the inverse, which always
+            exists
+        """
+        return _trusted(self.X, -self.Y % self.curve.p, self.Z, self.curve)
+
+    def canonical(self):
+        """Chooses a representative of the class {P, P^-1} of the point.
+
+        The representative is the one whose affine y coordinate is at most
+        (p - 1) / 2; the point at infinity and the points of order 2 are
+        their own inverse.
+
+        Returns:
+            The pair (representative, negated), where negated is True if the
+            representative is the inverse of the point
+        """
+        self._normalize()
+        p = self.curve.p
+        if self.Z == 0 or 2 * self.Y <= p:
+            return self, False
+        return _trusted(self.X, p - self.Y, 1, self.curve), True
+
+    @classmethod
+    def multi_power(cls, bases, exponents):
+        """Computes a sum of scalar multiples of points on the same curve.
+
+        The non-adjacent forms of the exponents are scanned together from
+        the most significant digit, so that the doublings are shared: the
+        product of k powers of b bit exponents costs about b doublings and
+        k * b / 3 additions, instead of k * b doublings.
+
+        Args:
+            bases: non-empty sequence of EllipticCurvePoint instances on the
+                same curve
+            exponents: sequence of integer exponents, one per base
+
+        Returns:
+            An EllipticCurvePoint representing the product of bases[i] to the
+            power of exponents[i]
+        """
+        if len(bases) != len(exponents):
+            raise ValueError("There must be one exponent per base")
+
+        curve = bases[0].curve
+        a, p = curve.a, curve.p
+
+        # Affine points and their negations, with the non-adjacent forms of
+        # the absolute exponents
+        points = []
+        nafs = []
+        for base, exponent in zip(bases, exponents):
+            if (base.curve is not curve
+                and (base.curve.p, base.curve.a, base.curve.b)
+                    != (curve.p, curve.a, curve.b)):
+                raise ValueError("Curve must be the same")
+            if not isinstance(exponent, Integral):
+                raise TypeError("Exponent must be an integer")
+
+            if curve.order is not None:
+                exponent %= curve.order
+
+            base._normalize()
+            Y = base.Y if exponent >= 0 else -base.Y % p
+            points.append(((base.X, Y, base.Z), (base.X, -Y % p, base.Z)))
+            nafs.append(_naf(abs(exponent)))
+
+        X3, Y3, Z3 = 1, 1, 0
+        for i in range(max(len(naf) for naf in nafs) - 1, -1, -1):
+            X3, Y3, Z3 = _double(X3, Y3, Z3, a, p)
+            for naf, (point, negated) in zip(nafs, points):
+                if i >= len(naf) or not naf[i]:
+                    continue
+                X, Y, Z = point if naf[i] == 1 else negated
+                X3, Y3, Z3 = _add(X3, Y3, Z3, X, Y, Z, a, p)
+
+        return _trusted(X3, Y3, Z3, curve)
+
+
+GroupElement.register(EllipticCurvePoint)
+
+# Non-adjacent form of a non-negative integer, least significant digit first:
+# digits in {-1, 0, 1}, with no two adjacent non-zero digits
+def _naf(k):
+    digits = []
+    while k:
+        if k & 1:
+            digit = 2 - (k & 3)
+            k -= digit
+        else:
+            digit = 0
+        digits.append(digit)
+        k >>= 1
+    return digits
+
+# Doubling in Jacobian coordinates: 4 multiplications and 4 squarings
+def _double(X, Y, Z, a, p):
+    if Z == 0 or Y == 0:
+        return 1, 1, 0
+
+    YY = Y * Y % p
+    S = 4 * X * YY % p
+    ZZ = Z * Z % p
+    M = (3 * X * X + a * ZZ * ZZ) % p
+    X3 = (M * M - 2 * S) % p
+    Y3 = (M * (S - X3) - 8 * YY * YY) % p
+    Z3 = 2 * Y * Z % p
+    return X3, Y3, Z3
+
+# Addition in Jacobian coordinates: 12 multiplications and 4 squarings, 8
+# and 3 when the second point is affine (Z2 = 1)
+def _add(X1, Y1, Z1, X2, Y2, Z2, a, p):
+    if Z1 == 0:
+        return X2, Y2, Z2
+    if Z2 == 0:
+        return X1, Y1, Z1
+
+    Z1Z1 = Z1 * Z1 % p
+    if Z2 == 1:
+        U1, S1 = X1, Y1
+    else:
+        Z2Z2 = Z2 * Z2 % p
+        U1 = X1 * Z2Z2 % p
+        S1 = Y1 * Z2 * Z2Z2 % p
+    U2 = X2 * Z1Z1 % p
+    S2 = Y2 * Z1 * Z1Z1 % p
+
+    H = (U2 - U1) % p
+    R = (S2 - S1) % p
+    if H == 0:
+        # Same affine x: the points are equal or inverse of each other
+        if R == 0:
+            return _double(X1, Y1, Z1, a, p)
+        return 1, 1, 0
+
+    HH = H * H % p
+    HHH = H * HH % p
+    V = U1 * HH % p
+    X3 = (R * R - HHH - 2 * V) % p
+    Y3 = (R * (V - X3) - S1 * HHH) % p
+    Z3 = Z1 * H % p if Z2 == 1 else Z1 * Z2 * H % p
+    return X3, Y3, Z3
+
+
+_new = object.__new__
+
+# Builds a point from Jacobian coordinates already reduced modulo p, skipping
+# validation; only for points computed by the class itself
+def _trusted(X, Y, Z, curve):
+    instance = _new(EllipticCurvePoint)
+    instance.X = X
+    instance.Y = Y
+    instance.Z = Z
+    instance.curve = curve
+    return instance
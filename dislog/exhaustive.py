@@ -1,7 +1,10 @@
+from dislog.util import DEBUG
 from dislog.util import debug
+from dislog.util import stats
+from dislog.util import subgroup_order
 
 
-def exhaustive(alpha, beta, n):
+def exhaustive(alpha, beta, n, n_factors=None):
     """Computes discrete logarithm with a naive exhaustive approach.
 
     Given a generator alpha of a cyclic group G, another element beta of the
@@ -15,6 +18,10 @@ def exhaustive(alpha, beta, n):
         beta: logarithm argument, must support internal equality and
             multiplication
         n: order of the group containing alpha and beta
+        n_factors: dictionary containing the prime factors of n as keys and
+            their multiplicity as values; if specified, the search is limited
+            to the order of alpha, and skipped if beta is not a power of
+            alpha (see dislog.util.subgroup_order)
 
     Returns:
         The discrete logarithm log_{alpha}(beta) (the integer x such that alpha
@@ -22,6 +29,15 @@ def exhaustive(alpha, beta, n):
     """
     debug(exhaustive, "alpha={}, beta={}, n={}", alpha, beta, n)
 
+    if n_factors is not None:
+        subgroup = subgroup_order(alpha, beta, n, n_factors)
+        if subgroup is None:
+            debug(exhaustive, "beta is not a power of alpha")
+            return None
+        n = subgroup[0]
+
+    token = stats.start(exhaustive)
+
     # Current exponent and power value being evaluated
     exp = 0
     power = alpha ** 0
@@ -34,10 +50,19 @@ def exhaustive(alpha, beta, n):
         # alpha is not a generator
         if exp == n:
             debug(exhaustive, "n={} reached; logarithm does not exist", n)
+            stats.record(
+                exhaustive, token,
+                exponentiations=1, multiplications=exp - 1, steps=exp
+            )
             return None
 
         power *= alpha
-        debug(exhaustive, "alpha^{} = {}".format(exp, power))
+        if DEBUG:
+            debug(exhaustive, "alpha^{} = {}", exp, power)
 
     debug(exhaustive, "Logarithm = {}", exp)
+    stats.record(
+        exhaustive, token,
+        exponentiations=1, multiplications=exp, steps=exp
+    )
     return exp
@@ -0,0 +1,90 @@
+import abc
+
+
+class GroupElement(abc.ABC):
+    """Element of a finite cyclic group, in multiplicative notation.
+
+    The solvers (exhaustive, babygiant, pohlighellman, pollard and the ones
+    built on them) are written against this protocol only: x * y is the
+    group operation, x ** k the k-th power for any integer k (x ** 0 being
+    the identity and negative powers going through the inverse), and equal
+    elements must have equal hashes, which are used by lookup tables and
+    partitioning functions. Instances must not be mutated once they are
+    used as keys.
+
+    Elements whose inverse is cheap, like elliptic curve points, can also
+    implement canonical, which enables the negation map walk of Pollard's
+    Rho (see dislog.walk.NegationWalk). Element classes can implement a
+    multi_power class method computing a product of powers at once (see
+    multi_power).
+    """
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def __mul__(self, other):
+        """Returns the product of the instance and another element."""
+
+    @abc.abstractmethod
+    def __pow__(self, exponent):
+        """Returns the instance to the power of an integer exponent.
+
+        Args:
+            exponent: any integer; 0 gives the identity, negative exponents
+                are powers of the inverse
+
+        Returns:
+            The power, None if the exponent is negative and the instance is
+            not invertible
+        """
+
+    @abc.abstractmethod
+    def __eq__(self, other):
+        """Compares the instance with another element of the same group."""
+
+    @abc.abstractmethod
+    def __hash__(self):
+        """Hash consistent with equality, independent of the representation.
+        """
+
+    @abc.abstractmethod
+    def inverse(self):
+        """Returns the inverse of the instance, None if it does not exist."""
+
+
+def identity(x):
+    """Returns the identity of the group containing x."""
+    return x ** 0
+
+def multi_power(bases, exponents):
+    """Computes the product of the powers bases[i] ** exponents[i].
+
+    Uses the multi_power class method of the elements if they implement it,
+    which can share the work among the powers (e.g. the squarings in
+    Straus' method, see dislog.util.power.straus); otherwise the powers
+    are computed separately.
+
+    Args:
+        bases: non-empty sequence of elements of the same group
+        exponents: sequence of integer exponents, one per base
+
+    Returns:
+        The product of the powers, None if one of them does not exist
+    """
+    if not bases:
+        raise ValueError("At least one base is required")
+
+    method = getattr(type(bases[0]), 'multi_power', None)
+    if method is not None:
+        return method(bases, exponents)
+
+    if len(bases) != len(exponents):
+        raise ValueError("There must be one exponent per base")
+
+    result = None
+    for base, exponent in zip(bases, exponents):
+        factor = base ** exponent
+        if factor is None:
+            return None
+        result = factor if result is None else result * factor
+    return result
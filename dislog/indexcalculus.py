@@ -0,0 +1,480 @@
+import functools
+import math
+import random
+from dislog.modulointeger import ModuloInteger
+from dislog.pohlighellman import pohlighellman
+from dislog.util import backend
+from dislog.util import debug
+from dislog.util import isgenerator
+from dislog.util import stats
+from sympy.ntheory import factorint
+from sympy.ntheory import primerange
+from sympy.ntheory.modular import crt
+from sympy.ntheory.primetest import isprime
+
+
+# Largest prime factor of the group order whose part of the logarithms is
+# computed with Pohlig-Hellman instead of linear algebra
+_SMALL_FACTOR_LIMIT = 2 ** 16
+
+# Relations collected beyond the size of the factor base before giving up on
+# the logarithms of the primes still undetermined
+_EXTRA_RELATIONS = 50
+
+# Attempts at smoothing a single element before failing
+_MAX_DESCENT_ATTEMPTS = 10 ** 6
+
+# Default number of exponents tried when collecting relations, before giving
+# up on the factor base logarithms still undetermined
+_MAX_COLLECTION_TRIALS = 10 ** 7
+
+# Default smoothness bound, a multiple of L_p[1/2, 1/2] =
+# exp(sqrt(ln p ln ln p) / 2): relation collection dominates the running
+# time here, so a factor base larger than the asymptotic optimum pays off
+# (4 L_p[1/2, 1/2] was the fastest for moduli of 64 to 96 bits)
+def _default_bound(p):
+    # ln ln p is negative for p < e^e; such tiny fields get the minimum bound
+    log_p = math.log(max(p, 16))
+    bound = math.exp(math.sqrt(log_p * math.log(log_p)) / 2)
+    return max(int(4 * bound), 30)
+
+# Writes z mod p as a quotient r / t with |r|, |t| about sqrt(p), stopping
+# the extended Euclidean algorithm on (p, z) halfway: the remainders satisfy
+# r_i = z * t_i mod p
+def _split(z, p):
+    r_old, r = p, z
+    t_old, t = 0, 1
+    limit = math.isqrt(p)
+    while r > limit:
+        quotient = r_old // r
+        r_old, r = r, r_old - quotient * r
+        t_old, t = t, t_old - quotient * t
+    return r, t
+
+
+class IndexCalculusSolver:
+    """Index calculus in the multiplicative group Z_p^* of a prime field.
+
+    The logarithms of the primes up to a smoothness bound (the factor base)
+    are computed once, to the base of a fixed generator g, from relations
+    g^k = r / t mod p with r and t smooth. The logarithm of any other element
+    is then found with a descent: beta * g^s is split in the same way, with
+    at most one prime above the bound in r and in t, whose logarithm is in
+    turn found from a smooth splitting of itself and kept with the factor
+    base ones.
+
+    Linear algebra is carried out modulo the prime power factors of p - 1
+    above a size limit, with sparse Gaussian elimination choosing the
+    sparsest columns (largest primes) as pivots; the logarithms modulo the
+    small factors are computed with Pohlig-Hellman.
+
+    Attributes:
+        p: prime modulus
+        n: order p - 1 of the group
+        generator: ModuloInteger generator g of the group, base of the
+            logarithms of the factor base
+        factor_base: primes up to the smoothness bound
+        logs: logarithms of the factor base primes (and of the primes met
+            by the descent so far) modulo large_modulus
+        large_modulus: product of the prime power factors of n handled by
+            linear algebra
+        relations: number of relations collected
+    """
+
+    def __init__(self, p, bound=None, seed=None, max_trials=None):
+        """Computes the logarithms of the factor base.
+
+        Args:
+            p: prime modulus
+            bound: smoothness bound of the factor base; if not specified, it
+                is chosen according to the size of p
+            seed: seed for the random exponents
+            max_trials: maximum number of exponents tried when collecting
+                relations; the factor base logarithms still undetermined
+                after them are left out
+        """
+        if not isprime(p):
+            raise ValueError("Modulus must be prime")
+
+        token = stats.start(IndexCalculusSolver)
+
+        self.p = p
+        self.n = p - 1
+        self._rng = random.Random(seed)
+
+        n_factors = factorint(self.n)
+        self._small_factors = {
+            q: e for q, e in n_factors.items() if q <= _SMALL_FACTOR_LIMIT
+        }
+        large_factors = {
+            q: e for q, e in n_factors.items() if q > _SMALL_FACTOR_LIMIT
+        }
+        self.large_modulus = math.prod(q ** e for q, e in large_factors.items())
+
+        context = ModuloInteger(1, p).context
+        if p == 2:
+            # Z_2^* is the trivial group, generated by 1
+            self.generator = ModuloInteger(1, context)
+        else:
+            self.generator = next(
+                ModuloInteger(g, context) for g in range(2, p)
+                if isgenerator(ModuloInteger(g, context), self.n, n_factors)
+            )
+
+        # Bases of the subgroups of order q^e for the small factors, of the
+        # logarithms computed with Pohlig-Hellman
+        self._small_bases = {
+            q: self.generator ** (self.n // q ** e)
+            for q, e in self._small_factors.items()
+        }
+
+        if bound is None:
+            bound = _default_bound(p)
+        self.bound = bound
+        self.factor_base = list(primerange(2, bound + 1))
+        self._product = backend.mpz(math.prod(self.factor_base))
+
+        if max_trials is None:
+            max_trials = _MAX_COLLECTION_TRIALS
+
+        self.logs = {}
+        self.relations = 0
+        trials = 0
+        if large_factors:
+            trials = self._collect(large_factors, max_trials)
+
+        debug(
+            IndexCalculusSolver, "p={} bound={} factor base={} known={}",
+            p, bound, len(self.factor_base), len(self.logs)
+        )
+        stats.record(
+            IndexCalculusSolver, token,
+            exponentiations=1 + len(self._small_bases),
+            multiplications=trials, steps=trials,
+            table_inserts=len(self.logs),
+            params={'bound': bound, 'relations': self.relations}
+        )
+
+    # Factors x over the factor base, allowing at most one prime cofactor
+    # above the bound if allow_large is True. Returns the factorization as a
+    # dictionary, None if x is not smooth enough
+    def _factor(self, x, allow_large):
+        if x == 1:
+            return {}
+
+        # Smooth part of x: the factor base product raised to a power of two
+        # exceeding every exponent in x, modulo x, shares all of them with x
+        smooth = backend.gcd(
+            x, backend.powmod(self._product, 1 << x.bit_length().bit_length(),
+                              x)
+        )
+        cofactor = x // smooth
+        if cofactor != 1 and not (allow_large
+                                  and cofactor < self.bound * self.bound):
+            return None
+
+        factors = {}
+        if cofactor != 1:
+            factors[int(cofactor)] = 1
+
+        smooth = int(smooth)
+        for q in self.factor_base:
+            if smooth == 1:
+                break
+            while smooth % q == 0:
+                smooth //= q
+                factors[q] = factors.get(q, 0) + 1
+        return factors
+
+    # Collects relations g^k = r / t and eliminates them modulo each large
+    # prime power factor, until the logarithms of the whole factor base are
+    # determined or the relation or trial budget is exhausted. Returns the
+    # number of exponents tried
+    def _collect(self, large_factors, max_trials):
+        columns = {q: i for i, q in enumerate(self.factor_base)}
+        systems = {
+            q ** e: _EchelonSystem(q, q ** e) for q, e in large_factors.items()
+        }
+        limit = len(self.factor_base) + _EXTRA_RELATIONS
+        g, p, n = self.generator, self.p, self.n
+        half = n // 2
+        trials = 0
+
+        # Exponents in arithmetic progression with a random step, for one
+        # multiplication each (a step of 1 would relate the splittings of
+        # consecutive powers through the small generator)
+        k = self._rng.randrange(1, n)
+        step = self._rng.randrange(1, n)
+        power = g ** k
+        factor = g ** step
+        while (self.relations < limit
+               and any(system.rank < len(columns)
+                       for system in systems.values())):
+            if trials == max_trials:
+                debug(
+                    IndexCalculusSolver, "Giving up after {} trials", trials
+                )
+                break
+
+            k += step
+            power *= factor
+            trials += 1
+            r, t = _split(int(power.value), p)
+
+            numerator = self._factor(r, False)
+            if numerator is None:
+                continue
+            denominator = self._factor(abs(t), False)
+            if denominator is None:
+                continue
+
+            # log r - log |t| = k - log(sign t), with log(-1) = (p - 1) / 2
+            row = {}
+            for q, e in numerator.items():
+                row[columns[q]] = e
+            for q, e in denominator.items():
+                row[columns[q]] = row.get(columns[q], 0) - e
+            rhs = k - half if t < 0 else k
+
+            self.relations += 1
+            for system in systems.values():
+                system.add(row, rhs)
+
+        debug(
+            IndexCalculusSolver, "{} relations from {} trials",
+            self.relations, trials
+        )
+
+        solutions = {m: system.solve() for m, system in systems.items()}
+        moduli = list(solutions)
+        for q, i in columns.items():
+            residues = [solutions[m].get(i) for m in moduli]
+            if None not in residues:
+                self.logs[q] = int(crt(moduli, residues)[0])
+
+        return trials
+
+    # Logarithm modulo large_modulus of a positive integer below p, from the
+    # cache or from a smooth splitting of x * g^s
+    def _large_log(self, x, allow_large=True):
+        if x in self.logs:
+            return self.logs[x]
+
+        g, p, n = self.generator, self.p, self.n
+        modulus = self.large_modulus
+        half = n // 2
+
+        for _ in range(_MAX_DESCENT_ATTEMPTS):
+            s = self._rng.randrange(n)
+            r, t = _split(int((g ** s).value) * x % p, p)
+
+            numerator = self._factor(r, allow_large)
+            if numerator is None:
+                continue
+            denominator = self._factor(abs(t), allow_large)
+            if denominator is None:
+                continue
+
+            log = half - s if t < 0 else -s
+            for factors, sign in ((numerator, 1), (denominator, -1)):
+                for q, e in factors.items():
+                    q_log = self.logs.get(q)
+                    if q_log is None:
+                        # Large prime, or factor base prime left out
+                        if q <= self.bound or not allow_large:
+                            break
+                        q_log = self._large_log(q, False)
+                        if q_log is None:
+                            break
+                        self.logs[q] = q_log
+                    log += sign * e * q_log
+                else:
+                    continue
+                break
+            else:
+                return log % modulus
+
+        return None
+
+    def log(self, beta):
+        """Computes the logarithm of beta to the base of the generator.
+
+        Args:
+            beta: ModuloInteger with modulus p, or integer
+
+        Returns:
+            The discrete logarithm log_{g}(beta), None if beta is not
+            invertible modulo p
+        """
+        value = int(beta.value if isinstance(beta, ModuloInteger) else beta)
+        value %= self.p
+        if value == 0:
+            return None
+
+        # No relation found: no logarithm of the factor base is known
+        if self.large_modulus > 1 and not self.logs:
+            return None
+
+        moduli = []
+        residues = []
+
+        # Small factors, with Pohlig-Hellman in the subgroups
+        element = ModuloInteger(value, self.generator.context)
+        for q, e in self._small_factors.items():
+            m = q ** e
+            rem = pohlighellman(
+                self._small_bases[q], element ** (self.n // m), m, {q: e}
+            )
+            if rem is None:
+                return None
+            moduli.append(m)
+            residues.append(rem)
+
+        if self.large_modulus > 1:
+            log = self._large_log(value)
+            if log is None:
+                return None
+            moduli.append(self.large_modulus)
+            residues.append(log)
+
+        return int(crt(moduli, residues)[0]) if moduli else 0
+
+    def solve(self, alpha, beta):
+        """Computes the discrete logarithm of beta to the base of alpha.
+
+        Args:
+            alpha: ModuloInteger with modulus p, not necessarily a generator
+            beta: ModuloInteger with modulus p
+
+        Returns:
+            The discrete logarithm log_{alpha}(beta), reduced modulo the
+            order of alpha, if it exists, None otherwise
+        """
+        token = stats.start(IndexCalculusSolver.solve)
+
+        alpha_log = self.log(alpha)
+        beta_log = self.log(beta)
+        ret = None
+
+        # alpha^x = beta iff alpha_log * x = beta_log mod n
+        if alpha_log is not None and beta_log is not None:
+            d = math.gcd(alpha_log, self.n)
+            if beta_log % d == 0:
+                order = self.n // d
+                ret = (beta_log // d) * pow(alpha_log // d, -1, order) % order
+
+        stats.record(
+            IndexCalculusSolver.solve, token, exponentiations=1, steps=1
+        )
+        return ret
+
+
+class _EchelonSystem:
+    # Linear system modulo m = q^e reduced to echelon form as the rows
+    # arrive: each new row is reduced by the pivot rows, then normalized on
+    # the column of its largest unit entry (the sparsest, as it stands for
+    # the largest prime) which becomes its pivot
+
+    def __init__(self, q, m):
+        self.q = q
+        self.m = m
+        self.pivots = {}
+        self.order = []
+        self._position = {}
+
+    @property
+    def rank(self):
+        return len(self.pivots)
+
+    def add(self, row, rhs):
+        m = self.m
+        row = {i: c % m for i, c in row.items() if c % m}
+        rhs %= m
+
+        # Pivot rows only contain columns that were not pivots when they
+        # were added, so eliminating the oldest pivot column first ends
+        while True:
+            pivot_columns = [i for i in row if i in self.pivots]
+            if not pivot_columns:
+                break
+            i = min(pivot_columns, key=self._position.get)
+            factor = row[i]
+            pivot_row, pivot_rhs = self.pivots[i]
+            for j, c in pivot_row.items():
+                value = (row.get(j, 0) - factor * c) % m
+                if value:
+                    row[j] = value
+                else:
+                    row.pop(j, None)
+            rhs = (rhs - factor * pivot_rhs) % m
+
+        units = [i for i, c in row.items() if c % self.q]
+        if not units:
+            return False
+
+        i = max(units)
+        inverse = pow(row[i], -1, m)
+        self.pivots[i] = (
+            {j: c * inverse % m for j, c in row.items()}, rhs * inverse % m
+        )
+        self._position[i] = len(self.order)
+        self.order.append(i)
+        return True
+
+    def solve(self):
+        # Back substitution, newest pivot first; columns depending on a
+        # column without pivot stay undetermined
+        m = self.m
+        solution = {}
+        for i in reversed(self.order):
+            row, rhs = self.pivots[i]
+            value = rhs
+            for j, c in row.items():
+                if j == i:
+                    continue
+                if j not in solution:
+                    break
+                value -= c * solution[j]
+            else:
+                solution[i] = value % m
+        return solution
+
+
+# Solvers cached by modulus and bound, since the factor base logarithms only
+# depend on the field
+@functools.lru_cache(maxsize=16)
+def _solver(p, bound):
+    return IndexCalculusSolver(p, bound)
+
+def clear_cache():
+    """Discards the cached factor base logarithms."""
+    _solver.cache_clear()
+
+def indexcalculus(alpha, beta, bound=None):
+    """Computes discrete logarithm using the index calculus algorithm.
+
+    Given an element alpha of the multiplicative group Z_p^* of a prime field
+    and another element beta of the subgroup generated by alpha, computes the
+    discrete logarithm of beta to the base of alpha in subexponential time.
+    The logarithms of the factor base are cached for each field, so that
+    further logarithms modulo the same prime only cost a descent.
+
+    Args:
+        alpha: logarithm base, ModuloInteger with a prime modulus
+        beta: logarithm argument, ModuloInteger with the same modulus
+        bound: smoothness bound of the factor base; chosen according to the
+            size of the modulus if not specified
+
+    Returns:
+        The discrete logarithm log_{alpha}(beta), reduced modulo the order of
+        alpha, if it exists, None otherwise
+    """
+    debug(indexcalculus, "alpha={} beta={}", alpha, beta)
+    solver = _solver(int(alpha.modulus), bound)
+    ret = solver.solve(alpha, beta)
+
+    # Guards against wrong cached logarithms
+    if ret is not None and alpha ** ret != beta:
+        debug(indexcalculus, "Logarithm {} not verified", ret)
+        return None
+    return ret
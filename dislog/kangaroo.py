@@ -0,0 +1,326 @@
+import math
+import multiprocessing
+import os
+import queue
+import random
+from dislog.pollard import default_dp_bits
+from dislog.util import DEBUG
+from dislog.util import debug
+from dislog.util import stats
+from dislog.walk import hash_partition
+
+
+# Interval widths below which the exponents are simply scanned
+_SCAN_LIMIT = 16
+
+# Seconds waited for a distinguished point before checking that the workers
+# are still alive
+_POLL_INTERVAL = 1.0
+
+# Jump distances: the powers of two 2^i for i in [0, k), with the smallest k
+# for which their mean (2^k - 1) / k reaches the given mean. Returns the
+# distances and the corresponding powers of alpha
+def _jumps(alpha, mean):
+    k = 1
+    while ((1 << k) - 1) / k < mean:
+        k += 1
+    sizes = [1 << i for i in range(k)]
+    return sizes, [alpha ** size for size in sizes]
+
+# Checks the exponents in [lo, hi] one by one. Returns the logarithm (None
+# if it is not in the interval) and the number of multiplications
+def _scan(alpha, beta, lo, hi):
+    power = alpha ** lo
+    for exp in range(lo, hi + 1):
+        if power == beta:
+            return exp, exp - lo
+        power *= alpha
+    return None, hi - lo + 1
+
+def kangaroo(alpha, beta, lo, hi, restarts=8):
+    """Computes discrete logarithm in an interval using Pollard's Kangaroo.
+
+    Given an element alpha of a cyclic group G and another element beta of
+    G whose logarithm is known to lie in the interval [lo, hi], computes the
+    discrete logarithm of beta to the base of alpha with Pollard's Lambda
+    (Kangaroo) algorithm, in O(sqrt(hi - lo)) operations and constant
+    memory, independently of the order of G.
+
+    A tame kangaroo starts at alpha^hi and makes about sqrt(hi - lo) jumps,
+    whose length depends on the element it lands on, then sets a trap where
+    it stops. A wild kangaroo starts at beta and jumps with the same rule;
+    once it lands on a spot of the tame path, it follows it into the trap.
+    If the wild kangaroo passes the trap, the attempt is repeated with a new
+    jump rule.
+
+    Args:
+        alpha: logarithm base, must support internal equality and
+            multiplication, integer exponentiation and hashing
+        beta: logarithm argument, must support internal equality,
+            multiplication and hashing
+        lo: smallest possible logarithm
+        hi: largest possible logarithm
+        restarts: maximum number of attempts
+
+    Returns:
+        The discrete logarithm log_{alpha}(beta) in [lo, hi] if it is found,
+        None otherwise
+    """
+    debug(kangaroo, "alpha={} beta={} lo={} hi={}", alpha, beta, lo, hi)
+
+    if hi < lo:
+        raise ValueError("Must be: lo <= hi")
+
+    token = stats.start(kangaroo)
+    width = hi - lo
+
+    if width < _SCAN_LIMIT:
+        ret, multiplications = _scan(alpha, beta, lo, hi)
+        stats.record(
+            kangaroo, token,
+            exponentiations=1, multiplications=multiplications,
+            steps=multiplications
+        )
+        return ret
+
+    mean = math.sqrt(width) / 2
+    sizes, jumps = _jumps(alpha, mean)
+    k = len(sizes)
+    tame_jumps = math.ceil(2 * mean)
+    steps = attempts = 0
+    ret = None
+
+    for attempt in range(restarts):
+        attempts += 1
+
+        # Tame kangaroo: from alpha^hi, leaves the trap at alpha^(hi + trap)
+        x = alpha ** hi
+        trap = 0
+        for _ in range(tame_jumps):
+            i = (hash_partition(x, k) + attempt) % k
+            x *= jumps[i]
+            trap += sizes[i]
+        trap_x = x
+        steps += tame_jumps
+
+        # Wild kangaroo: from beta, until it falls in the trap or passes it
+        x = beta
+        distance = 0
+        while distance <= width + trap:
+            if x == trap_x:
+                ret = hi + trap - distance
+                break
+            i = (hash_partition(x, k) + attempt) % k
+            x *= jumps[i]
+            distance += sizes[i]
+            steps += 1
+
+        if DEBUG:
+            debug(kangaroo, "Attempt {}: logarithm={}", attempt, ret)
+
+        if ret is not None:
+            break
+
+    # A group order smaller than the interval may also yield a logarithm
+    # outside of it, which the trap cannot tell apart
+    if ret is not None and not lo <= ret <= hi:
+        ret = None
+
+    stats.record(
+        kangaroo, token,
+        exponentiations=len(sizes) + attempts,
+        multiplications=steps, steps=steps,
+        params={'jumps': k, 'tame_jumps': tame_jumps}
+    )
+    return ret
+
+
+# Herd of a worker process: one tame and one wild kangaroo, jumping in
+# turns. Every distinguished point is reported to the collision store as
+# (point, worker index, kind, exponent, steps since the previous report):
+# the exponent is the logarithm of the point for the tame kangaroo ('tame'),
+# and the distance from beta for the wild one ('wild'). A kangaroo is
+# moved to a new random start when the store sends its kind to the inbox,
+# after it met another kangaroo of the same kind
+def _worker(alpha, beta, lo, width, sizes, jumps, dp_bits, index, seed,
+            points, inbox, stop):
+    rng = random.Random(seed)
+    mask = (1 << dp_bits) - 1
+    k = len(sizes)
+
+    def start(kind):
+        if kind == 'tame':
+            exp = lo + width // 2 + rng.randrange(width // 4 + 1)
+            return [alpha ** exp, exp]
+        exp = rng.randrange(width // 4 + 1)
+        return [beta * alpha ** exp, exp]
+
+    herd = {'tame': start('tame'), 'wild': start('wild')}
+    trail = 0
+
+    while not stop.is_set():
+        trail += 1
+        for kind, kangaroo in herd.items():
+            x = kangaroo[0]
+            i = hash_partition(x, k)
+            kangaroo[0] = x = x * jumps[i]
+            kangaroo[1] += sizes[i]
+
+            if hash(x) & mask == 0:
+                points.put((x, index, kind, kangaroo[1], trail))
+                trail = 0
+
+        try:
+            while True:
+                kind = inbox.get_nowait()
+                herd[kind] = start(kind)
+        except queue.Empty:
+            pass
+
+def parallel_kangaroo(alpha, beta, lo, hi, workers=None, dp_bits=None,
+                      seed=None, max_points=None):
+    """Computes discrete logarithm in an interval using parallel kangaroos.
+
+    Given an element alpha of a cyclic group G and another element beta of
+    G whose logarithm is known to lie in the interval [lo, hi], computes the
+    discrete logarithm of beta to the base of alpha with the parallel
+    kangaroo method of van Oorschot and Wiener: each worker process runs a
+    tame kangaroo, started in the upper half of the interval, and a wild one,
+    started near beta, and reports the distinguished points they meet to a
+    table kept by the calling process, until a tame and a wild kangaroo meet
+    in the same point. The mean jump grows with the number of kangaroos, so
+    that the expected running time shrinks linearly with the number of
+    workers.
+
+    Args:
+        alpha: logarithm base, must support internal equality and
+            multiplication, integer exponentiation, hashing and pickling
+        beta: logarithm argument, must support internal equality and
+            multiplication, hashing and pickling
+        lo: smallest possible logarithm
+        hi: largest possible logarithm
+        workers: number of worker processes; if not specified, it is set to
+            the number of CPUs
+        dp_bits: number of trailing zero bits in the hash of a distinguished
+            point; if not specified, it is chosen according to hi - lo
+        seed: seed for the starting points of the kangaroos
+        max_points: maximum number of distinguished points to collect before
+            giving up; unbounded if not specified
+
+    Returns:
+        The discrete logarithm log_{alpha}(beta) in [lo, hi] if it is found
+        within max_points distinguished points, None otherwise
+    """
+    debug(
+        parallel_kangaroo, "alpha={} beta={} lo={} hi={} workers={}",
+        alpha, beta, lo, hi, workers
+    )
+
+    if hi < lo:
+        raise ValueError("Must be: lo <= hi")
+
+    token = stats.start(parallel_kangaroo)
+    width = hi - lo
+
+    if width < _SCAN_LIMIT:
+        ret, multiplications = _scan(alpha, beta, lo, hi)
+        stats.record(
+            parallel_kangaroo, token,
+            exponentiations=1, multiplications=multiplications,
+            steps=multiplications
+        )
+        return ret
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if dp_bits is None:
+        dp_bits = default_dp_bits(width)
+
+    # Mean jump of about N sqrt(width) / 4 for a herd of N kangaroos
+    sizes, jumps = _jumps(alpha, workers * math.sqrt(width) / 2)
+
+    rng = random.Random(seed)
+    context = multiprocessing.get_context()
+    points = context.Queue()
+    inboxes = [context.Queue() for _ in range(workers)]
+    stop = context.Event()
+
+    processes = [
+        context.Process(
+            target=_worker,
+            args=(
+                alpha, beta, lo, width, sizes, jumps, dp_bits, index,
+                rng.getrandbits(64), points, inboxes[index], stop
+            ),
+            daemon=True
+        )
+        for index in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    # Collision store
+    # Key: distinguished point, value: (kind, exponent)
+    table = {}
+    steps = collisions = 0
+    log = None
+
+    try:
+        while max_points is None or len(table) < max_points:
+            try:
+                x, index, kind, exp, trail = points.get(
+                    timeout=_POLL_INTERVAL
+                )
+            except queue.Empty:
+                if not any(process.is_alive() for process in processes):
+                    raise RuntimeError("All worker processes terminated")
+                continue
+
+            steps += 2 * trail
+            if DEBUG:
+                debug(parallel_kangaroo, "Point {}: {} {}", x, kind, exp)
+
+            if x not in table:
+                table[x] = (kind, exp)
+                continue
+
+            collisions += 1
+            other_kind, other_exp = table[x]
+            if other_kind == kind:
+                # Both kangaroos would follow the same path from now on
+                inboxes[index].put(kind)
+                continue
+
+            tame_exp, wild_exp = (
+                (exp, other_exp) if kind == 'tame' else (other_exp, exp)
+            )
+            candidate = tame_exp - wild_exp
+            if alpha ** candidate == beta:
+                log = candidate
+                break
+
+    finally:
+        stop.set()
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+        points.close()
+        for inbox in inboxes:
+            inbox.close()
+
+    stats.record(
+        parallel_kangaroo, token,
+        multiplications=steps, steps=steps, table_inserts=len(table),
+        table_lookups=len(table) + collisions, collisions=collisions,
+        params={'workers': workers, 'dp_bits': dp_bits}
+    )
+
+    if log is not None and not lo <= log <= hi:
+        log = None
+
+    if log is None:
+        debug(parallel_kangaroo, "No solution found")
+    else:
+        debug(parallel_kangaroo, "Returning logarithm={}", log)
+    return log
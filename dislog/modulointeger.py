@@ -1,31 +1,94 @@
+import functools
+from dislog.group import GroupElement
+from dislog.util import DEBUG
+from dislog.util import backend
 from dislog.util import debug
+from dislog.util import stats
+from dislog.util.power import _interleaved_windows
+from dislog.util.power import _window_width
+from numbers import Integral
 from numbers import Number
 
 
+class ModulusContext:
+    """Parameters shared by all the integers modulo the same modulus.
+
+    Elements produced by arithmetic on ModuloInteger instances reference the
+    context of their operands instead of validating and storing the modulus
+    again.
+
+    Attributes:
+        modulus: integer greater than 0, of the integer backend type (see
+            dislog.util.backend)
+        order: order of the multiplicative group of units modulo modulus (or
+            of a subgroup containing all the elements in use), used to reduce
+            exponents; None if unknown
+    """
+
+    __slots__ = ('modulus', 'order')
+
+    def __init__(self, modulus, order=None):
+        if not isinstance(modulus, Number):
+            raise TypeError("Modulus must be initialized with a number")
+
+        int_modulus = int(modulus)
+
+        if (modulus != int_modulus
+            or modulus < 1):
+            raise ValueError(
+                "Modulus must be initialized with an integer greater than 0"
+            )
+
+        if order is not None and (int(order) != order or order < 1):
+            raise ValueError("Order must be an integer greater than 0")
+
+        self.modulus = backend.mpz(int_modulus)
+        self.order = None if order is None else int(order)
+
+    def __eq__(self, other):
+        if isinstance(other, ModulusContext):
+            return (self.modulus == other.modulus
+                    and self.order == other.order)
+        return False
+
+    def __hash__(self):
+        return hash((self.modulus, self.order))
+
+
+# Contexts for plain integer moduli, shared among the instances created with
+# the same modulus
+@functools.lru_cache(maxsize=128)
+def _shared_context(modulus):
+    return ModulusContext(modulus)
+
+
 class ModuloInteger:
+    __slots__ = ('value', 'context')
+
     def __init__(self, value, modulus):
         if not isinstance(value, Number):
             raise TypeError("Value must be initialized with a number")
 
-        if not isinstance(modulus, Number):
-            raise TypeError("Modulus must be initialized with a number")
+        if isinstance(modulus, ModulusContext):
+            context = modulus
+        elif isinstance(modulus, Number) and int(modulus) == modulus:
+            context = _shared_context(int(modulus))
+        else:
+            context = ModulusContext(modulus)
 
         int_value = int(value)
-        int_modulus = int(modulus)
 
         if value != int_value:
             raise ValueError(
                 "Value must be initialized with an integer"
             )
 
-        if (modulus != int_modulus
-            or modulus < 1):
-            raise ValueError(
-                "Modulus must be initialized with an integer greater than 0"
-            )
+        self.context = context
+        self.value = int_value % context.modulus
 
-        self.modulus = int_modulus
-        self.value = int_value % self.modulus
+    @property
+    def modulus(self):
+        return self.context.modulus
 
     def __eq__(self, other):
         if isinstance(other, ModuloInteger):
@@ -39,27 +102,39 @@ class ModuloInteger:
         if not isinstance(other, ModuloInteger):
             raise TypeError("Trying to multiply by a non-ModuloInteger object")
 
-        if self.modulus != other.modulus:
+        context = self.context
+        if (other.context is not context
+            and other.context.modulus != context.modulus):
             raise ValueError("Modulus must be the same")
 
-        mul = (self.value * other.value) % self.modulus
-        return ModuloInteger(mul, self.modulus)
+        return _trusted(self.value * other.value % context.modulus, context)
+
+    # Instances are hashed by value and used as lookup table keys, so in-place
+    # multiplication rebinds to a new (trusted) instance instead of mutating
+    __imul__ = __mul__
 
     def __pow__(self, exponent):
-        if not isinstance(exponent, int):
+        if not isinstance(exponent, Integral):
             raise TypeError("Exponent must be an integer")
 
+        # The order of the context only bounds the order of the units: the
+        # powers of a zero divisor are not periodic from the identity
+        order = self.context.order
+        if (order is not None and (exponent < 0 or exponent >= order)
+            and backend.gcd(self.value, self.modulus) == 1):
+            exponent %= order
+
         base = self.inverse() if exponent < 0 else self
 
         if base is None:
             debug(self.__pow__, "Base not invertible, power does not exist")
             return None
 
-        retval = 1
-        for i in range(abs(exponent)):
-            retval = (retval * base.value) % self.modulus
+        # Built-in modular exponentiation (sliding window over the bits of
+        # the exponent, logarithmic in its size)
+        retval = backend.powmod(base.value, abs(exponent), self.modulus)
 
-        return ModuloInteger(retval, self.modulus)
+        return _trusted(retval, self.context)
 
     def __str__(self):
         return "{} (mod {})".format(self.value, self.modulus)
@@ -72,7 +147,8 @@ class ModuloInteger:
 
         It does that by solving the equivalent diophantine equation
         ax + ny = 1, using an adapted version of the extended euclidean
-        algorithm.
+        algorithm (the native one of the integer backend, if it is not pure
+        Python).
 
         It can be proved that a solution exists iff gcd(a,n) = 1, that is iff a
         is coprime to n.
@@ -88,6 +164,14 @@ class ModuloInteger:
             A ModuloInteger representing the inverse if it exists, None
             otherwise
         """
+        stats.count('inversions')
+
+        # Native extended GCD of the integer backend, if available
+        if backend.NAME != 'python':
+            x = backend.invert(self.value, self.modulus)
+            debug(self.inverse, "Inverse value: {}", x)
+            return None if x is None else _trusted(x, self.context)
+
         # Initialized with n and a respectively
         r = self.modulus
         r_new = self.value
@@ -95,11 +179,8 @@ class ModuloInteger:
         x = 0
         x_new = 1
 
-        debug(self.inverse, "Computing inverse of {}".format(self))
-        debug(
-            self.inverse, "\t\tr={}\tr_new={}\tx={}\tx_new={}"
-            .format(r, r_new, x, x_new)
-        )
+        if DEBUG:
+            debug(self.inverse, "Computing inverse of {}", self)
 
         # Finds r = gcd(a,n) and left solution x
         while r_new != 0:
@@ -107,10 +188,11 @@ class ModuloInteger:
             r, r_new = r_new, r - quotient * r_new
             x, x_new = x_new, x - quotient * x_new
 
-            debug(
-                self.inverse, "\tq={}\tr={}\tr_new={}\tx={}\tx_new={}"
-                .format(quotient, r, r_new, x, x_new)
-            )
+            if DEBUG:
+                debug(
+                    self.inverse, "\tq={}\tr={}\tr_new={}\tx={}\tx_new={}",
+                    quotient, r, r_new, x, x_new
+                )
 
         # No solution exists, since gcd(a, n) != 1 (a and n are not coprime)
         if r > 1:
@@ -123,8 +205,196 @@ class ModuloInteger:
         # Extended GCD finds either one or the other.
         # If it finds the negative one, n must be added to make it positive.
         if x < 0:
-            debug(self.inverse, "Adding {} to x".format(self.modulus))
             x = x + self.modulus
 
-        debug(self.inverse, "Inverse value: {}", x)
-        return ModuloInteger(x, self.modulus)
+        if DEBUG:
+            debug(self.inverse, "Inverse value: {}", x)
+        return _trusted(x, self.context)
+
+    @classmethod
+    def multi_power(cls, bases, exponents):
+        """Computes a product of powers of ModuloInteger instances.
+
+        The built-in modular exponentiation of the integer backend outruns
+        any interpreted loop on small moduli, so below a size depending on
+        the backend the powers are computed separately; on larger moduli they
+        are interleaved with Straus' method (see dislog.util.power.straus) on
+        the integer values, sharing the squarings among all the powers.
+
+        Args:
+            bases: non-empty sequence of ModuloInteger instances with the same
+                modulus
+            exponents: sequence of integer exponents, one per base
+
+        Returns:
+            A ModuloInteger representing the product of bases[i] to the power
+            of exponents[i], None if an exponent is negative and its base is
+            not invertible
+        """
+        if len(bases) != len(exponents):
+            raise ValueError("There must be one exponent per base")
+
+        context = bases[0].context
+        modulus = context.modulus
+        order = context.order
+
+        values = []
+        reduced = []
+        for base, exponent in zip(bases, exponents):
+            if (base.context is not context
+                and base.context.modulus != modulus):
+                raise ValueError("Modulus must be the same")
+            if not isinstance(exponent, Integral):
+                raise TypeError("Exponent must be an integer")
+
+            value = base.value
+            if (order is not None and (exponent < 0 or exponent >= order)
+                and backend.gcd(value, modulus) == 1):
+                exponent %= order
+
+            if exponent < 0:
+                stats.count('inversions')
+                value = backend.invert(value, modulus)
+                if value is None:
+                    debug(
+                        cls.multi_power,
+                        "Base not invertible, power does not exist"
+                    )
+                    return None
+                exponent = -exponent
+
+            values.append(value)
+            reduced.append(int(exponent))
+
+        if modulus.bit_length() >= _STRAUS_BITS.get(backend.NAME, 2048):
+            return _trusted(_straus(values, reduced, modulus), context)
+
+        result = 1 % modulus
+        for value, exponent in zip(values, reduced):
+            result = result * backend.powmod(value, exponent, modulus) % modulus
+        return _trusted(result, context)
+
+
+# Smallest modulus bit length from which Straus' interleaved method on the
+# integer values beats separate built-in exponentiations, for each integer
+# backend (see benchmarks/bench_power.py)
+_STRAUS_BITS = {'gmpy2': 2048, 'python': 256}
+
+# Straus' interleaved exponentiation (see dislog.util.power.straus) on
+# integer values modulo modulus, with non-negative exponents
+def _straus(values, exponents, modulus):
+    bits = max(exponent.bit_length() for exponent in exponents)
+    if bits == 0:
+        return 1 % modulus
+    width = _window_width(bits)
+
+    # Odd powers: odd_powers[i][k] = values[i] ^ (2k + 1)
+    odd_powers = []
+    for value in values:
+        powers = [value]
+        square = value * value % modulus
+        for _ in range((1 << (width - 1)) - 1):
+            powers.append(powers[-1] * square % modulus)
+        odd_powers.append(powers)
+
+    windows = _interleaved_windows(exponents, width)
+
+    result = 1
+    for j in range(bits - 1, -1, -1):
+        result = result * result % modulus
+        for index, window in windows.get(j, ()):
+            result = result * odd_powers[index][window >> 1] % modulus
+
+    return result % modulus
+
+
+def batch_inverse(elements):
+    """Computes the inverses of several ModuloInteger instances at once.
+
+    Uses Montgomery's trick: with the prefix products p_i = a_0 * ... * a_i,
+    only p_{k-1} is inverted, and each a_i^-1 = p_{i-1} * p_i^-1 is then
+    recovered walking back, with p_{i-1}^-1 = a_i * p_i^-1. Inverting k
+    elements costs a single extended GCD and about 3k multiplications.
+
+    If the product is not invertible, the elements which are not coprime to
+    the modulus are found with a GCD each and left out of the product.
+
+    Args:
+        elements: sequence of ModuloInteger instances with the same modulus
+
+    Returns:
+        A list with the inverse of each element, None for the elements that
+        are not invertible
+    """
+    elements = list(elements)
+    if not elements:
+        return []
+
+    context = elements[0].context
+    modulus = context.modulus
+    values = []
+    for element in elements:
+        if (element.context is not context
+            and element.context.modulus != modulus):
+            raise ValueError("Modulus must be the same")
+        values.append(element.value)
+
+    indices = range(len(values))
+    inverses = _batch_invert(values, indices, modulus)
+
+    if inverses is None:
+        gcd = backend.gcd
+        indices = [i for i in indices if gcd(values[i], modulus) == 1]
+        debug(
+            batch_inverse, "{} of {} elements not invertible",
+            len(values) - len(indices), len(values)
+        )
+        inverses = _batch_invert(values, indices, modulus)
+
+    result = [None] * len(values)
+    for i, x in zip(indices, inverses):
+        result[i] = _trusted(x, context)
+    return result
+
+# Montgomery's trick on the values at the given indices: returns their
+# inverses modulo modulus, in the same order, or None if their product is not
+# invertible
+def _batch_invert(values, indices, modulus):
+    # prefix[i] is the product of the first i + 1 values
+    prefix = []
+    product = backend.mpz(1)
+    for i in indices:
+        product = product * values[i] % modulus
+        prefix.append(product)
+
+    if not prefix:
+        return []
+
+    stats.count('inversions')
+    inverse = backend.invert(prefix[-1], modulus)
+    if inverse is None:
+        return None
+
+    inverses = [None] * len(prefix)
+    for position in range(len(prefix) - 1, 0, -1):
+        value = values[indices[position]]
+        inverses[position] = inverse * prefix[position - 1] % modulus
+        inverse = inverse * value % modulus
+    inverses[0] = inverse
+
+    return inverses
+
+
+# Registered rather than subclassed, so that isinstance checks on the
+# concrete class in the arithmetic skip the ABCMeta machinery
+GroupElement.register(ModuloInteger)
+
+_new = object.__new__
+
+# Builds an instance from an already reduced integer value and a context,
+# skipping validation; only for values computed by the class itself
+def _trusted(value, context):
+    instance = _new(ModuloInteger)
+    instance.value = value
+    instance.context = context
+    return instance
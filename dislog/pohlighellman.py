@@ -1,9 +1,112 @@
 import dislog
 from dislog.util import debug
+from dislog.util import stats
+from dislog.util import subgroup_order
 from sympy.ntheory.modular import crt
 
 
-def pohlighellman(alpha, beta, n, n_factors):
+# Largest prime subgroup order solved with an exhaustive search by default
+_EXHAUSTIVE_LIMIT = 2 ** 10
+
+# Largest prime subgroup order solved with baby-step giant-step by default;
+# beyond it the table would not fit in memory, and rho is used
+_BABYGIANT_LIMIT = 2 ** 48
+
+# Smallest prime subgroup order for which the default baby-step table is a
+# compact fingerprint table instead of a dictionary
+_COMPACT_TABLE_LIMIT = 2 ** 32
+
+def _exhaustive(base, arg, p):
+    return dislog.exhaustive(base, arg, p)
+
+def _babygiant(base, arg, p):
+    table = 'hash' if p >= _COMPACT_TABLE_LIMIT else 'dict'
+    return dislog.babygiant(base, arg, p, table=table)
+
+def _pollard(base, arg, p):
+    # Random walks degenerate in tiny groups
+    if p <= _EXHAUSTIVE_LIMIT:
+        return _exhaustive(base, arg, p)
+
+    walk = dislog.AddingWalk(base, arg, p)
+    return dislog.expollard(base, arg, p, method='brent', walk=walk)
+
+def _auto(base, arg, p):
+    if p <= _EXHAUSTIVE_LIMIT:
+        return _exhaustive(base, arg, p)
+    if p <= _BABYGIANT_LIMIT:
+        return _babygiant(base, arg, p)
+    return _pollard(base, arg, p)
+
+
+# Subsolvers for the prime order subproblems selectable in pohlighellman
+SUBSOLVERS = {
+    'auto': _auto,
+    'exhaustive': _exhaustive,
+    'babygiant': _babygiant,
+    'pollard': _pollard
+}
+
+# Computes x mod p^e, with x the logarithm of beta to the base alpha, by a
+# balanced divide-and-conquer descent: with gamma = alpha^(n / p^e), of order
+# p^e, and h = beta^(n / p^e), the logarithm of h modulo p^e splits into its
+# low digits, found from h^(p^k) in the subgroup of order p^(e - k), and its
+# high digits, found from h * gamma^(-low) in the subgroup of order p^k. The
+# ladder gamma^(p^k) is computed once, and every digit is solved with the
+# same base alpha^(n / p), of order p. Each level of the recursion costs
+# O(e log p) multiplications, for O(e log e log p) in total instead of the
+# O(e^2 log p) of the digit by digit expansion. Returns the remainder (None
+# if a digit does not exist), the number of digits computed and the numbers
+# of exponentiations and multiplications outside of the subsolver
+def _solve_prime_power(alpha, beta, n, p, e, subsolver):
+    debug(pohlighellman, "Factor: {}^{}", p, e)
+
+    # ladder[k] = gamma^(p^k), of order p^(e - k)
+    ladder = [alpha ** (n // p ** e)]
+    for _ in range(e - 1):
+        ladder.append(ladder[-1] ** p)
+
+    digits = multiplications = 0
+    exponentiations = e + 1
+
+    # Logarithm of h to the base ladder[k] modulo p^(e - k), or None
+    def descend(h, k):
+        nonlocal digits, exponentiations, multiplications
+        length = e - k
+
+        if length == 1:
+            digits += 1
+            l = subsolver(ladder[-1], h, p)
+            debug(pohlighellman, "Digit {}: {}", k, l)
+            return l
+
+        high = length // 2
+        low = length - high
+
+        exponentiations += 1
+        x_low = descend(h ** (p ** high), k + high)
+        if x_low is None:
+            return None
+
+        if x_low:
+            exponentiations += 1
+            multiplications += 1
+            h *= ladder[k] ** (p ** length - x_low)
+        x_high = descend(h, k + low)
+        if x_high is None:
+            return None
+
+        return x_low + p ** low * x_high
+
+    rem = descend(beta ** (n // p ** e), 0)
+
+    if rem is None:
+        debug(pohlighellman, "Could not calculate reduced logarithm")
+    else:
+        debug(pohlighellman, "Found congruence: x = {} mod ({}^{})", rem, p, e)
+    return rem, digits, exponentiations, multiplications
+
+def pohlighellman(alpha, beta, n, n_factors, subsolver='auto', executor=None):
     """Computes discrete logarithm using Pohlig-Hellman algorithm.
 
     Given a generator alpha of a cyclic group G, another element beta of the
@@ -11,15 +114,28 @@ def pohlighellman(alpha, beta, n, n_factors):
     computes the discrete logarithm of beta to the base of alpha using the
     Pohlig-Hellman algorithm.
 
+    The order of alpha is computed first (see dislog.util.subgroup_order):
+    if beta is not a power of alpha, no subproblem is solved, and otherwise
+    the subproblems are the ones of the subgroup generated by alpha.
+
     Args:
         alpha: logarithm base, must support internal equality and
-            multiplication and integer exponentiation; should be a generator to
-            guarantee the existence of the logarithm
+            multiplication and integer exponentiation
         beta: logarithm argument, must support internal equality and
-            multiplication
-        n: order of the group containing alpha and beta
+            multiplication and integer exponentiation
+        n: order of the cyclic group containing alpha and beta
         n_factors: dictionary containing the prime factors of n as keys and
             their multiplicity as values
+        subsolver: algorithm for the logarithms in the subgroups of prime
+            order p, searched up to p; either 'exhaustive', 'babygiant',
+            'pollard' (exhaustive search for small p, where random walks
+            degenerate), 'auto' (exhaustive search for small p, baby-step
+            giant-step for medium p, rho for large p) or a function taking
+            base, argument and p and returning the logarithm or None
+        executor: concurrent.futures.Executor solving the prime power
+            subproblems concurrently (with a ProcessPoolExecutor, alpha,
+            beta and subsolver must be picklable); if not specified, they are
+            solved one after the other
 
     Returns:
         The discrete logarithm log_{alpha}(beta) (the integer x such that alpha
@@ -29,49 +145,52 @@ def pohlighellman(alpha, beta, n, n_factors):
         pohlighellman,
         "alpha={} beta={} n={} factors={}", alpha, beta, n, n_factors
     )
+    if not callable(subsolver):
+        if subsolver not in SUBSOLVERS:
+            raise ValueError("Unknown subsolver: {}".format(subsolver))
+        subsolver = SUBSOLVERS[subsolver]
+
+    subgroup = subgroup_order(alpha, beta, n, n_factors)
+    if subgroup is None:
+        debug(pohlighellman, "beta is not a power of alpha")
+        return None
+
+    n, n_factors = subgroup
+    token = stats.start(pohlighellman)
 
     # List of remainder values and moduli to be solved with C.r.t.
     remainders = []
     moduli = []
 
-    # For each factor p, store x mod (p ^ e) together with the modulus
-    for p, e in n_factors.items():
-        debug(pohlighellman, "Factor: {}^{}", p, e)
-
-        # Initialize reduced logarithm base, constant
-        base = alpha ** (n // p)
-
-        # Initialize helper variables
-        arg_base = beta
-        cur_pow = 0
-        next_pow = 1
-        l = 0
-        rem = 0
-
-        # Compute expansion coefficients
-        for j in range(e):
-            debug(pohlighellman, "Calculating l_({})", j)
-
-            prev_l = l  # l_{j - 1}
+    # Digits (subproblems) computed so far, and the group operations done
+    # outside of the subproblems
+    digits = exponentiations = multiplications = 0
 
-            prev_pow = cur_pow       # p ^ (j - 1) for j > 0
-            cur_pow = next_pow       # p ^ (j)
-            next_pow *= p            # p ^ (j + 1)
-
-            arg_base *= alpha ** (- prev_l * prev_pow)
-            arg_exp = n // next_pow
-            arg = arg_base ** arg_exp
-
-            l = dislog.exhaustive(base, arg, n)
-
-            if l is None:
-                debug(pohlighellman, "Could not calculate reduced logarithm")
-                return None
-            debug(pohlighellman, "l_({})={}", j, l)
-
-            rem += l * cur_pow
-
-        debug(pohlighellman, "Found congruence: x = {} mod ({}^{})", rem, p, e)
+    # For each factor p, store x mod (p ^ e) together with the modulus
+    if executor is None:
+        results = (
+            _solve_prime_power(alpha, beta, n, p, e, subsolver)
+            for p, e in n_factors.items()
+        )
+    else:
+        futures = [
+            executor.submit(_solve_prime_power, alpha, beta, n, p, e, subsolver)
+            for p, e in n_factors.items()
+        ]
+        results = (future.result() for future in futures)
+
+    for (p, e), result in zip(n_factors.items(), results):
+        rem, rem_digits, rem_exponentiations, rem_multiplications = result
+        digits += rem_digits
+        exponentiations += rem_exponentiations
+        multiplications += rem_multiplications
+
+        if rem is None:
+            if executor is not None:
+                for future in futures:
+                    future.cancel()
+            _record(token, digits, exponentiations, multiplications)
+            return None
 
         remainders.append(rem)
         moduli.append(p ** e)
@@ -79,10 +198,29 @@ def pohlighellman(alpha, beta, n, n_factors):
     debug(pohlighellman, "Applying Chinese remainder theorem")
     ret = crt(moduli, remainders)
 
-    if ret is not None:
-        ret = ret[0]
-        debug(pohlighellman, "Logarithm={}", ret)
-    else:
+    if ret is None:
+        _record(token, digits, exponentiations, multiplications)
         debug(pohlighellman, "No solution found")
-
-    return int(ret)
+        return None
+
+    ret = int(ret[0])
+
+    # Custom subsolvers may return wrong digits
+    valid = alpha ** ret == beta
+    _record(token, digits, exponentiations + 1, multiplications)
+    if not valid:
+        debug(pohlighellman, "Candidate {} is not a logarithm", ret)
+        return None
+
+    debug(pohlighellman, "Logarithm={}", ret)
+    return ret
+
+# Records the statistics of a pohlighellman call that computed the given
+# number of digits
+def _record(token, digits, exponentiations, multiplications):
+    stats.record(
+        pohlighellman, token,
+        exponentiations=exponentiations,
+        multiplications=multiplications,
+        steps=digits
+    )
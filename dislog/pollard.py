@@ -1,43 +1,162 @@
-from dislog import ModuloInteger
+import copy
+import json
+import math
+import multiprocessing
+import os
+import queue
+import random
+from dislog.group import multi_power
+from dislog.util import DEBUG
+from dislog.util import backend
 from dislog.util import debug
-from sympy.core.numbers import mod_inverse
-from sympy.ntheory.primetest import isprime
-
-
-# _map helper list for alfa exponents
-_A_MAP = [
-    lambda a, n: a,
-    lambda a, n: (a * 2) % n,
-    lambda a, n: (a + 1) % n
-]
-
-# _map helper list for beta exponents
-_B_MAP = [
-    lambda b, n: (b + 1) % n,
-    lambda b, n: (b * 2) % n,
-    lambda b, n: b
-]
-
-# _map helper list for group elements
-_X_MAP = [
-    lambda x, alpha, beta: x * beta,
-    lambda x, alpha, beta: x ** 2,
-    lambda x, alpha, beta: x * alpha
-]
-
-# Maps a triple (alpha exponent, beta exponent, group element) to the next one,
-# according to the subset number of the group element
-def _map(a, b, x, alpha, beta, n, s_num):
-    debug(
-        pollard,
-        "Calculating _map for: s_num={} a={} b={} x={} n={}", s_num, a, b, x, n
-    )
-    a = _A_MAP[s_num](a, n)
-    b = _B_MAP[s_num](b, n)
-    x = _X_MAP[s_num](x, alpha, beta)
-    return (a, b, x)
+from dislog.util import stats
+from dislog.util import subgroup_order
+from dislog.util.table import fingerprint
+from dislog.walk import ClassicWalk
+from dislog.walk import hash_partition
+
+
+# Checked mode: verifies that a triple (a, b, x) satisfies the invariant
+# alpha^a * beta^b = x of the walk
+def _check(alpha, beta, a, b, x):
+    if multi_power((alpha, beta), (a, b)) != x:
+        raise AssertionError(
+            "Walk invariant violated: alpha^{} * beta^{} != {}".format(a, b, x)
+        )
+
+# Floyd's cycle finding: the hare moves twice as fast as the tortoise, until
+# they meet; returns the two colliding triples and the number of steps. The
+# hare has its own step function, for walks which keep state along a sequence
+def _floyd(step, fast_step, start):
+    slow = fast = start
+    steps = 0
+
+    while True:
+        slow = step(slow)
+        fast = fast_step(fast_step(fast))
+        steps += 3
+
+        if slow[2] == fast[2]:
+            return slow, fast, steps
+
+# Brent's cycle finding: the tortoise teleports to the hare every time the
+# number of hare steps since the last teleport reaches a power of two; one
+# step per iteration
+def _brent(step, start):
+    tortoise = start
+    hare = step(start)
+    steps = 1
+
+    power = length = 1
+    while tortoise[2] != hare[2]:
+        if power == length:
+            tortoise = hare
+            power *= 2
+            length = 0
+
+        hare = step(hare)
+        steps += 1
+        length += 1
+
+    return tortoise, hare, steps
+
+def default_dp_bits(n):
+    """Chooses the number of trailing zero bits of distinguished points.
+
+    About a quarter of the bits of n, so that a search over n elements meets
+    O(n^(1/4)) distinguished points, each after O(n^(1/4)) steps.
+
+    Args:
+        n: order of the group, or width of the searched interval
+
+    Returns:
+        The number of trailing bits of the hash of a distinguished point
+        which must be zero
+    """
+    return max(n.bit_length() // 4 - 1, 0)
+
+# Distinguished point cycle finding: only the points whose hash has dp_bits
+# trailing zero bits are stored, and the walk stops when one of them repeats.
+# If no distinguished point is found in a long trail, the walk is stuck in a
+# cycle without any of them, which is then found with Brent's method. Returns
+# the two colliding triples, the number of steps, of stored points and of
+# lookups among them
+def _distinguished(step, start, dp_bits):
+    mask = (1 << dp_bits) - 1
+    max_trail = 20 << dp_bits
+
+    points = {}
+    current = start
+    steps = trail = 0
+
+    while True:
+        current = step(current)
+        steps += 1
+        trail += 1
+
+        x = current[2]
+        if hash(x) & mask == 0:
+            if x in points:
+                return points[x], current, steps, len(points), len(points) + 1
+            points[x] = current
+            trail = 0
+
+        elif trail > max_trail:
+            debug(pollard, "No distinguished point in cycle, using Brent")
+            first, second, brent_steps = _brent(step, current)
+            return (first, second, steps + brent_steps, len(points),
+                    len(points))
+
+
+# Solves the congruence given by two triples with the same group element,
+# alpha^a1 * beta^b1 = alpha^a2 * beta^b2, that is
+# (b1 - b2) * x = (a2 - a1) mod n, for the logarithm x of beta.
+# If d = gcd(b1 - b2, n) > 1, the congruence has d solutions modulo n, which
+# are enumerated and verified as long as d does not exceed sqrt(n) (beyond
+# that, a new walk is cheaper). Returns the first verified solution, if any,
+# and the numbers of exponentiations and multiplications computed
+def _solve_collision(alpha, beta, n, first, second):
+    a_first, b_first = first
+    a_second, b_second = second
+
+    r = (b_first - b_second) % n
+    c = (a_second - a_first) % n
+    d = math.gcd(r, n)
+    debug(_solve_collision, "(b - B) mod n = {} gcd = {}", r, d)
+
+    if c % d != 0 or d > max(math.isqrt(n), 1):
+        debug(_solve_collision, "Failure: {} candidates", 0 if c % d else d)
+        return None, 0, 0
+
+    # Unique solution modulo n / d
+    reduced_n = n // d
+    x = (c // d) * backend.invert(r // d, reduced_n) % reduced_n if d < n else 0
+    x = int(x)
+
+    # Candidates x + k * n / d for k in [0, d)
+    power = alpha ** x
+    factor = alpha ** reduced_n
+    for k in range(d):
+        if power == beta:
+            debug(_solve_collision, "Verified solution: {}", x)
+            return x, 2, k
+        power *= factor
+        x += reduced_n
+
+    debug(_solve_collision, "Failure: no candidate verified")
+    return None, 2, d
+
+# Group products computed by a walk beyond one per step so far: the
+# look-ahead retries and the cycle escapes of NegationWalk
+def _extra_products(walk):
+    return getattr(walk, 'retries', 0) + getattr(walk, 'escapes', 0)
+
+# Cycle finding methods selectable in pollard
+_METHODS = ['floyd', 'brent', 'distinguished']
 
-def pollard(alpha, beta, n, s_map, a_start=0, b_start=0):
+def pollard(alpha, beta, n, s_map=None, a_start=0, b_start=0,
+            method='floyd', checked=False, dp_bits=None, walk=None,
+            n_factors=None):
     """Computes discrete logarithm using Pollard's Rho algorithm.
 
     Given a generator alpha of a cyclic group G, another element beta of G,
@@ -52,9 +171,26 @@ def pollard(alpha, beta, n, s_map, a_start=0, b_start=0):
             multiplication and integer exponentiation
         n: order of the group containing alpha and beta
         s_map: function mapping group elements to their partition; must returns
-            an integer between 0 and 2 representing the partition number
+            an integer between 0 and 2 representing the partition number; if
+            not specified, partitions are computed from the element hashes
         a_start: starting coefficient in the sequence of the alpha exponents
         b_start: starting coefficient in the sequence of the beta exponents
+        method: cycle finding method; one of 'floyd' (tortoise and hare, three
+            steps per iteration), 'brent' (one step per iteration) and
+            'distinguished' (stores the points with a distinguishing hash
+            property)
+        checked: if True, verifies the invariant alpha^a * beta^b = x after
+            every step, raising AssertionError if it does not hold
+        dp_bits: for the 'distinguished' method, number of trailing zero bits
+            in the hash of a distinguished point; if not specified, it is
+            chosen according to n
+        walk: iteration function, an object with start and step methods built
+            for alpha, beta and n (see dislog.walk); if not specified, the
+            classic walk with partitioning function s_map is used
+        n_factors: dictionary containing the prime factors of n as keys and
+            their multiplicity as values; if specified, the search is limited
+            to the order of alpha, and skipped if beta is not a power of
+            alpha (see dislog.util.subgroup_order)
 
     Returns:
         The discrete logarithm log_{alpha}(beta) (the integer x such that alpha
@@ -63,75 +199,133 @@ def pollard(alpha, beta, n, s_map, a_start=0, b_start=0):
     """
     debug(pollard, "alpha={} beta={} n={}", alpha, beta, n)
     debug(pollard, "s_map={} a_start={} b_start={}", s_map, a_start, b_start)
+    debug(pollard, "method={} checked={}", method, checked)
 
-    # Initialization
-    a_slow = a_fast = a_start
-    b_slow = b_fast = b_start
-    x_slow = x_fast = (alpha ** a_start) * (beta ** b_start)
+    if method not in _METHODS:
+        raise ValueError("Unknown cycle finding method: {}".format(method))
 
-    debug(pollard, "a={} b={} x={}", a_slow, b_slow, x_slow)
-    debug(pollard, "A={} B={} X={}", a_fast, b_fast, x_fast)
+    if n_factors is not None:
+        subgroup = subgroup_order(alpha, beta, n, n_factors)
+        if subgroup is None:
+            debug(pollard, "beta is not a power of alpha")
+            return None
+        n = subgroup[0]
 
-    while True:
-        debug(pollard, "Increasing")
+    token = stats.start(pollard)
 
-        # Floyd's tortoise increase
-        a_slow, b_slow, x_slow = _map(
-            a_slow, b_slow, x_slow,
-            alpha, beta, n, s_map(x_slow)
-        )
-        debug(pollard, "a={} b={} x={}", a_slow, b_slow, x_slow)
-        assert((alpha ** a_slow) * (beta ** b_slow) == x_slow)
+    if walk is None:
+        walk = ClassicWalk(alpha, beta, n, s_map)
 
-        # Floyd's hare double increase
-        for _ in range(2):
-            a_fast, b_fast, x_fast = _map(
-                a_fast, b_fast, x_fast,
-                alpha, beta, n, s_map(x_fast)
-            )
-            debug(pollard, "A={} B={} X={}", a_fast, b_fast, x_fast)
-            assert((alpha ** a_fast) * (beta ** b_fast) == x_fast)
+    def stepper(walk):
+        def step(triple):
+            a, b, x = walk.step(*triple)
+            if checked:
+                _check(alpha, beta, a, b, x)
+            return (a, b, x)
+        return step
 
-        # Found loop
-        if x_slow == x_fast:
-            debug(pollard, "Found loop: x={} X={}", x_slow, x_fast)
-            debug(pollard, "            a={} A={}", a_slow, a_fast)
-            debug(pollard, "            b={} B={}", b_slow, b_fast)
+    # Initialization
+    start = walk.start(a_start, b_start)
+    debug(pollard, "a={} b={} x={}", *start)
 
-            assert(
-                (alpha ** a_slow) * (beta ** b_slow) ==
-                (alpha ** a_fast) * (beta ** b_fast)
-            )
+    step = stepper(walk)
+    walks = [walk]
+    extra = _extra_products(walk)
+    inserts = lookups = 0
+    if method == 'floyd':
+        walks.append(copy.copy(walk))
+        extra *= 2
+        first, second, steps = _floyd(step, stepper(walks[1]), start)
+    elif method == 'brent':
+        first, second, steps = _brent(step, start)
+    else:
+        if dp_bits is None:
+            dp_bits = default_dp_bits(n)
+        first, second, steps, inserts, lookups = _distinguished(
+            step, start, dp_bits
+        )
+    extra = sum(_extra_products(instance) for instance in walks) - extra
 
-            r = (b_slow - b_fast) % n
+    a_slow, b_slow, x_slow = first
+    a_fast, b_fast, x_fast = second
 
-            debug(pollard, "(b - B) mod n = {}", r)
+    debug(pollard, "Found loop: x={} X={}", x_slow, x_fast)
+    debug(pollard, "            a={} A={}", a_slow, a_fast)
+    debug(pollard, "            b={} B={}", b_slow, b_fast)
 
-            if r == 0:
-                return None
+    if checked:
+        _check(alpha, beta, a_slow, b_slow, x_fast)
+        _check(alpha, beta, a_fast, b_fast, x_slow)
 
-            try:
-                r_inv = mod_inverse(r, n)
+    log, exponentiations, multiplications = _solve_collision(
+        alpha, beta, n, (a_slow, b_slow), (a_fast, b_fast)
+    )
+
+    # The start and the checks are multi-exponentiations
+    if checked:
+        exponentiations += steps + 2
+    stats.record(
+        pollard, token,
+        exponentiations=exponentiations + 1,
+        multiplications=multiplications + steps + extra, steps=steps,
+        table_inserts=inserts, table_lookups=lookups, collisions=1,
+        params={'method': method, 'dp_bits': dp_bits}
+    )
 
-            except ValueError:
-                debug(pollard, "Failure: r={} not invertible", r)
-                return None
+    if log is not None:
+        debug(pollard, "Returning logarithm={}", log)
+    return log
 
-            debug(pollard, "r_inv={}", r_inv)
+def expollard(alpha, beta, n, s_map=None, restarts=32, seed=None,
+              method='brent', walk=None, n_factors=None):
+    """Computes discrete logarithm using Pollard's Rho with random restarts.
 
-            log = (r_inv * (a_fast - a_slow)) % n
-            debug(pollard, "Returning logarithm={}", log)
+    Runs pollard from random starting exponents until a walk ends in a
+    collision that yields the logarithm, or the budget of walks is exhausted.
 
-            return log
+    Args:
+        alpha: logarithm base (see pollard)
+        beta: logarithm argument (see pollard)
+        n: order of the group containing alpha and beta
+        s_map: function mapping group elements to their partition (see
+            pollard)
+        restarts: maximum number of walks
+        seed: seed for the starting exponents
+        method: cycle finding method (see pollard)
+        walk: iteration function (see pollard)
+        n_factors: dictionary containing the prime factors of n as keys and
+            their multiplicity as values; if specified, the walks run in the
+            order of alpha, and none is started if beta is not a power of
+            alpha (see dislog.util.subgroup_order)
 
-def expollard(alpha, beta, n, s_map):
+    Returns:
+        The discrete logarithm log_{alpha}(beta) (the integer x such that alpha
+        to the power of x equals beta) if it is found within the given number
+        of walks, None otherwise
+    """
     debug(expollard, "alpha={} beta={} n={} s_map={}", alpha, beta, n, s_map)
-    for a_start in range(n):
-        for b_start in range(n):
-            ret = pollard(alpha, beta, n, s_map, a_start, b_start)
-            if ret is not None:
-                return ret
-    debug(expollard, "No suitable starting values were found")
+
+    if n_factors is not None:
+        subgroup = subgroup_order(alpha, beta, n, n_factors)
+        if subgroup is None:
+            debug(expollard, "beta is not a power of alpha")
+            return None
+        n = subgroup[0]
+
+    rng = random.Random(seed)
+
+    for attempt in range(restarts):
+        a_start = rng.randrange(n)
+        b_start = rng.randrange(n)
+
+        ret = pollard(
+            alpha, beta, n, s_map, a_start, b_start, method=method, walk=walk
+        )
+        if ret is not None:
+            debug(expollard, "Found logarithm at walk {}", attempt)
+            return ret
+
+    debug(expollard, "No logarithm found in {} walks", restarts)
     return None
 
 
@@ -141,3 +335,431 @@ _MODINT_MAP = [1, 0, 2]
 # Subset map for ModuloInteger instances
 def modint_pollard_map(modulo_integer_x):
     return _MODINT_MAP[modulo_integer_x.value % 3]
+
+
+# Seconds waited for a distinguished point before checking that the workers
+# are still alive
+_POLL_INTERVAL = 1.0
+
+# Walk of a worker process: starts from random exponents and reports every
+# distinguished point to the collision store, together with the number of
+# steps taken since the previous report. A walk which does not find a
+# distinguished point within a long trail, or finds one of its own again, is
+# stuck in a cycle and restarts from new random exponents
+def _worker(walk, n, dp_bits, seed, points, stop):
+    rng = random.Random(seed)
+    mask = (1 << dp_bits) - 1
+    max_trail = 20 << dp_bits
+
+    while not stop.is_set():
+        a = rng.randrange(n)
+        b = rng.randrange(n)
+        a, b, x = walk.start(a, b)
+
+        own_points = set()
+        trail = 0
+
+        while trail <= max_trail:
+            a, b, x = walk.step(a, b, x)
+            trail += 1
+
+            if hash(x) & mask == 0:
+                points.put((x, a, b, trail))
+                trail = 0
+
+                if x in own_points or stop.is_set():
+                    break
+                own_points.add(x)
+
+def parallel_pollard(alpha, beta, n, s_map=None, workers=None, dp_bits=None,
+                     seed=None, max_points=None, walk=None):
+    """Computes discrete logarithm using parallel Pollard's Rho algorithm.
+
+    Given a generator alpha of a cyclic group G, another element beta of G,
+    the order n of G and a suitable partitioning function on G, computes the
+    discrete logarithm of beta to the base of alpha with the parallel
+    collision search of van Oorschot and Wiener: several worker processes
+    walk from random starting exponents and report the distinguished points
+    they meet to a table kept by the calling process, until two walks meet in
+    the same point. The expected speedup is linear in the number of workers.
+
+    Args:
+        alpha: logarithm base, must support internal equality and
+            multiplication, integer exponentiation, hashing and pickling;
+            should be a generator to guarantee the existence of the logarithm
+        beta: logarithm argument, must support internal equality and
+            multiplication, integer exponentiation, hashing and pickling
+        n: order of the group containing alpha and beta
+        s_map: function mapping group elements to their partition (see
+            pollard); must be picklable, e.g. defined at module level
+        workers: number of worker processes; if not specified, it is set to
+            the number of CPUs
+        dp_bits: number of trailing zero bits in the hash of a distinguished
+            point; if not specified, it is chosen according to n
+        seed: seed for the starting exponents of the walks
+        max_points: maximum number of distinguished points to collect before
+            giving up; unbounded if not specified
+        walk: iteration function (see pollard); must be picklable
+
+    Returns:
+        The discrete logarithm log_{alpha}(beta) (the integer x such that alpha
+        to the power of x equals beta) if it exists and it is found within
+        max_points distinguished points, None otherwise
+    """
+    debug(
+        parallel_pollard,
+        "alpha={} beta={} n={} workers={}", alpha, beta, n, workers
+    )
+    token = stats.start(parallel_pollard)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if dp_bits is None:
+        dp_bits = default_dp_bits(n)
+    if walk is None:
+        walk = ClassicWalk(alpha, beta, n, s_map)
+
+    rng = random.Random(seed)
+    context = multiprocessing.get_context()
+    points = context.Queue()
+    stop = context.Event()
+
+    processes = [
+        context.Process(
+            target=_worker,
+            args=(
+                walk, n, dp_bits, rng.getrandbits(64),
+                points, stop
+            ),
+            daemon=True
+        )
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    # Collision store
+    # Key: distinguished point, value: (alpha exponent, beta exponent)
+    table = {}
+    steps = collisions = exponentiations = multiplications = 0
+    log = None
+
+    try:
+        while max_points is None or len(table) < max_points:
+            try:
+                x, a, b, trail = points.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                if not any(process.is_alive() for process in processes):
+                    raise RuntimeError("All worker processes terminated")
+                continue
+
+            steps += trail
+            if DEBUG:
+                debug(parallel_pollard, "Point {}: a={} b={}", x, a, b)
+
+            if x not in table:
+                table[x] = (a, b)
+                continue
+
+            collisions += 1
+            result = _solve_collision(alpha, beta, n, table[x], (a, b))
+            log = result[0]
+            exponentiations += result[1]
+            multiplications += result[2]
+            if log is not None:
+                break
+
+    finally:
+        stop.set()
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+        points.close()
+
+    stats.record(
+        parallel_pollard, token,
+        exponentiations=exponentiations,
+        multiplications=steps + multiplications, steps=steps,
+        table_inserts=len(table),
+        table_lookups=len(table) + collisions, collisions=collisions,
+        params={'workers': workers, 'dp_bits': dp_bits}
+    )
+
+    if log is None:
+        debug(parallel_pollard, "No solution found")
+    else:
+        debug(parallel_pollard, "Returning logarithm={}", log)
+    return log
+
+
+# Default maximum number of distinguished points kept by RhoSolver
+_MAX_POINTS = 2 ** 20
+
+
+class RhoSolver:
+    """Rho solver reusing its distinguished points for many logarithms.
+
+    Multi-target rho of Kuhn and Struik: the walk is an r-adding walk whose
+    multipliers are powers of alpha only, x -> x * alpha^(m_i), so that the
+    path from a point does not depend on the logarithm being computed. A walk
+    started at beta * alpha^a (wild) or at alpha^a (tame) runs until it meets
+    a distinguished point, whose logarithm is then known (tame) or known up
+    to the one of beta (wild). Once a logarithm is found, the distinguished
+    points of its wild walks join the table of known logarithms, so every
+    query leaves behind points for the next ones to collide with: the i-th
+    logarithm costs about sqrt(n / i) steps instead of sqrt(n).
+
+    The table maps the 64 bit fingerprints of the points (see
+    dislog.util.table.fingerprint) to their logarithms, every candidate
+    being verified, and holds at most max_points entries. It can be saved to
+    a file and loaded back.
+
+    Attributes:
+        alpha: logarithm base
+        n: order of the group containing alpha
+        r: number of partitions of the walk
+        dp_bits: number of trailing zero bits in the hash of a distinguished
+            point
+        max_points: maximum number of points in the table
+        seed: seed of the multiplier exponents
+        points: dictionary mapping fingerprints of distinguished points to
+            their logarithms
+    """
+
+    def __init__(self, alpha, n, r=20, dp_bits=None, max_points=_MAX_POINTS,
+                 seed=None):
+        """Initializes the walk, with an empty table.
+
+        Args:
+            alpha: logarithm base, must support internal equality and
+                multiplication, integer exponentiation and hashing
+            n: order of the group containing alpha
+            r: number of partitions of the walk
+            dp_bits: number of trailing zero bits in the hash of a
+                distinguished point; if not specified, it is chosen according
+                to n
+            max_points: maximum number of points in the table; once it is
+                full, new points are no longer stored
+            seed: seed of the multiplier exponents and of the starting points
+        """
+        if dp_bits is None:
+            dp_bits = default_dp_bits(n)
+        if seed is None:
+            seed = random.getrandbits(64)
+
+        self.alpha = alpha
+        self.n = n
+        self.r = r
+        self.dp_bits = dp_bits
+        self.max_points = max_points
+        self.seed = seed
+        self.points = {}
+
+        rng = random.Random(seed)
+        self._exponents = [rng.randrange(n) for _ in range(r)]
+        self._multipliers = [alpha ** m for m in self._exponents]
+        self._rng = rng
+
+        debug(RhoSolver, "n={} r={} dp_bits={}", n, r, dp_bits)
+
+    # Walks from (x, a) to the next distinguished point. Returns the point,
+    # its exponent and the number of steps, or None as point if the walk is
+    # stuck in a cycle without distinguished points
+    def _walk(self, x, a):
+        r = self.r
+        exponents = self._exponents
+        multipliers = self._multipliers
+        mask = (1 << self.dp_bits) - 1
+        max_trail = 20 << self.dp_bits
+
+        for steps in range(1, max_trail + 1):
+            i = hash_partition(x, r)
+            x *= multipliers[i]
+            a += exponents[i]
+            if hash(x) & mask == 0:
+                return x, a % self.n, steps
+
+        return None, a, max_trail
+
+    # Stores the logarithm of a distinguished point, if there is room
+    def _store(self, key, log):
+        if len(self.points) < self.max_points:
+            self.points[key] = log
+            return True
+        return False
+
+    def solve(self, beta, max_walks=None):
+        """Computes the discrete logarithm of beta to the base alpha.
+
+        Each round walks from beta times a random power of alpha to a
+        distinguished point. While the table holds fewer points than the
+        wild walks of this query, a tame walk from a random power of alpha
+        follows, so that the first query runs the classic tame and wild
+        collision search, and the later ones mostly wild walks against the
+        points left by the previous queries.
+
+        Args:
+            beta: logarithm argument, must support internal equality,
+                multiplication and hashing
+            max_walks: maximum number of wild walks before giving up, e.g.
+                when beta may not belong to the group generated by alpha;
+                unbounded if not specified
+
+        Returns:
+            The discrete logarithm log_{alpha}(beta) if it is found within
+            max_walks walks, None otherwise
+        """
+        token = stats.start(RhoSolver.solve)
+
+        alpha = self.alpha
+        n = self.n
+        rng = self._rng
+        points = self.points
+
+        # Distinguished points of the wild walks of this query
+        # Key: fingerprint, value: exponent a of the point beta * alpha^a
+        wild = {}
+        steps = walks = tame_walks = collisions = verifications = 0
+        lookups = inserts = 0
+        log = None
+
+        def verify(candidate):
+            nonlocal verifications
+            verifications += 1
+            return candidate if alpha ** candidate == beta else None
+
+        while max_walks is None or walks < max_walks:
+            walks += 1
+            start = rng.randrange(n)
+            x, a, trail = self._walk(beta * alpha ** start, start)
+            steps += trail
+
+            if x is not None:
+                key = fingerprint(x)
+                lookups += 1
+                if key in points:
+                    collisions += 1
+                    log = verify((points[key] - a) % n)
+                    if log is not None:
+                        break
+                elif key in wild:
+                    # Merged with an earlier walk of this query
+                    collisions += 1
+                else:
+                    wild[key] = a
+
+            if len(points) >= len(wild) or len(points) >= self.max_points:
+                continue
+
+            tame_walks += 1
+            start = rng.randrange(n)
+            x, a, trail = self._walk(alpha ** start, start)
+            steps += trail
+
+            if x is not None:
+                key = fingerprint(x)
+                if key in wild:
+                    collisions += 1
+                    log = verify((a - wild[key]) % n)
+                    if log is not None:
+                        inserts += self._store(key, a)
+                        break
+                else:
+                    lookups += 1
+                    if key not in points:
+                        inserts += self._store(key, a)
+
+        if log is not None:
+            # The wild points of this query now have known logarithms
+            for key, a in wild.items():
+                if key not in points:
+                    if not self._store(key, (log + a) % n):
+                        break
+                    inserts += 1
+
+        stats.record(
+            RhoSolver.solve, token,
+            exponentiations=walks + tame_walks + verifications,
+            multiplications=steps + walks, steps=steps,
+            table_inserts=inserts, table_lookups=lookups,
+            collisions=collisions, params={'walks': walks}
+        )
+
+        if log is None:
+            debug(RhoSolver.solve, "No solution found in {} walks", walks)
+        else:
+            debug(RhoSolver.solve, "Returning logarithm={}", log)
+        return log
+
+    def solve_many(self, betas, max_walks=None):
+        """Computes the discrete logarithms of several elements.
+
+        Args:
+            betas: iterable of logarithm arguments
+            max_walks: maximum number of walks for each argument (see solve)
+
+        Returns:
+            A list with the logarithm of each argument, None where it is not
+            found
+        """
+        return [self.solve(beta, max_walks) for beta in betas]
+
+    def save(self, path):
+        """Writes the walk parameters, the table and the state of the random
+        starting points to a JSON file.
+
+        Args:
+            path: path of the file
+        """
+        version, internal, gauss = self._rng.getstate()
+        with open(path, 'w') as file:
+            json.dump({
+                'version': 2,
+                'n': self.n,
+                'alpha': fingerprint(self.alpha),
+                'r': self.r,
+                'dp_bits': self.dp_bits,
+                'max_points': self.max_points,
+                'seed': self.seed,
+                'rng': [version, list(internal), gauss],
+                'points': list(self.points.items())
+            }, file)
+
+        debug(RhoSolver.save, "Saved {} points to {}", len(self.points), path)
+
+    @classmethod
+    def load(cls, path, alpha):
+        """Loads a solver written by save.
+
+        The starting points continue the sequence of the saved solver, so
+        that a restored solver does not walk again from the points it
+        already walked from (files without this state get fresh ones).
+
+        Args:
+            path: path of the file
+            alpha: logarithm base the solver was built for
+
+        Returns:
+            A RhoSolver instance
+        """
+        with open(path) as file:
+            data = json.load(file)
+
+        if data.get('version') not in (1, 2):
+            raise ValueError("Unsupported distinguished point file version")
+        if data['alpha'] != fingerprint(alpha):
+            raise ValueError("Table was built for a different logarithm base")
+
+        solver = cls(
+            alpha, data['n'], data['r'], data['dp_bits'], data['max_points'],
+            data['seed']
+        )
+        solver.points = {key: log for key, log in data['points']}
+
+        if 'rng' in data:
+            version, internal, gauss = data['rng']
+            solver._rng.setstate((version, tuple(internal), gauss))
+        else:
+            solver._rng.seed(random.getrandbits(64))
+        return solver
@@ -0,0 +1,227 @@
+import collections
+import functools
+import math
+import dislog
+from dislog.ellipticcurve import EllipticCurvePoint
+from dislog.indexcalculus import clear_cache as _clear_factor_bases
+from dislog.modulointeger import ModuloInteger
+from dislog.util import debug
+from dislog.util import stats
+from dislog.util import subgroup_order
+from sympy.ntheory import factorint
+from sympy.ntheory.primetest import isprime
+
+
+# Largest order solved with an exhaustive search
+_EXHAUSTIVE_LIMIT = 2 ** 10
+
+# Largest prime order solved with a cached baby-step giant-step table; beyond
+# it the table would not fit in memory, and rho is used
+_BABYGIANT_LIMIT = 2 ** 40
+
+# Largest prime modulus for which index calculus is considered: it factors
+# the order of the field and sieves over the whole field, at a cost growing
+# as L_p[1/2, sqrt(2)]
+_INDEXCALCULUS_LIMIT = 2 ** 100
+
+# Index calculus takes about 4 ns times L_p[1/2, sqrt(2)], a rho logarithm
+# about 2 sqrt(q) steps of 0.8 us (benchmarks/bench_indexcalculus.py): ratio
+# of the two unit costs
+_INDEXCALCULUS_RATIO = 400
+
+
+# Maximum number of entries of each cache
+_CACHE_SIZE = 256
+
+# Maximum total size in bytes of the cached baby-step tables; a table of a
+# subgroup of order close to _BABYGIANT_LIMIT takes about 16 MiB
+_CACHE_BYTES = 2 ** 28
+
+
+class _LRUCache:
+    # Bounded mapping discarding the least recently used entries, when there
+    # are more than maxsize of them or, if a weight function is given, when
+    # their total weight exceeds maxweight; values heavier than maxweight
+    # alone are not kept
+
+    def __init__(self, maxsize, maxweight=None, weight=None):
+        self.maxsize = maxsize
+        self.maxweight = maxweight
+        self.weight = weight
+        self.total = 0
+        self.entries = collections.OrderedDict()
+
+    def get(self, key, make):
+        # Returns the value for key, computing it with make if missing
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return self.entries[key][0]
+
+        value = make()
+        weight = 0 if self.weight is None else self.weight(value)
+        if self.maxweight is not None and weight > self.maxweight:
+            return value
+
+        self.entries[key] = (value, weight)
+        self.total += weight
+        while (len(self.entries) > self.maxsize
+               or (self.maxweight is not None
+                   and self.total > self.maxweight)):
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.total -= evicted
+        return value
+
+    def clear(self):
+        self.entries.clear()
+        self.total = 0
+
+
+# Cache of the baby-step giant-step solvers for prime order subgroups,
+# bounded by the memory of their tables
+_solvers = _LRUCache(
+    _CACHE_SIZE, _CACHE_BYTES, lambda solver: solver.table.nbytes
+)
+
+# Factorization of an order, as a tuple of (prime, multiplicity) pairs
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _factorization(n):
+    return tuple(sorted(factorint(n).items()))
+
+# Order of the multiplicative group of units modulo modulus
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _group_order(modulus):
+    # Euler's totient function, from the factorization of the modulus
+    order = 1
+    for p, e in _factorization(modulus):
+        order *= (p - 1) * p ** (e - 1)
+    return order
+
+# Whether the modulus of a ModuloInteger is prime
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _prime_modulus(modulus):
+    return isprime(modulus)
+
+# Whether index calculus in Z_modulus^* is expected to be faster than rho in
+# its subgroup of prime order q
+def _use_indexcalculus(modulus, q):
+    if modulus >= _INDEXCALCULUS_LIMIT or not _prime_modulus(modulus):
+        return False
+
+    log_p = math.log(modulus)
+    cost = math.exp(math.sqrt(2 * log_p * math.log(log_p)))
+    return cost < _INDEXCALCULUS_RATIO * math.sqrt(q)
+
+# Key identifying an element together with its group, since elements of
+# different groups may compare equal (e.g. ModuloInteger values)
+def _group_key(x):
+    if isinstance(x, ModuloInteger):
+        return (ModuloInteger, x.value, x.modulus)
+    if isinstance(x, EllipticCurvePoint):
+        curve = x.curve
+        return (EllipticCurvePoint, x.x, x.y, curve.p, curve.a, curve.b)
+    return (type(x), x)
+
+# Logarithm in a subgroup of prime order p, through a baby-step giant-step
+# table cached for the base, or for very large p index calculus in small
+# prime fields where it beats rho, and rho elsewhere
+def _prime_order_log(base, arg, p):
+    if p <= _EXHAUSTIVE_LIMIT:
+        return dislog.exhaustive(base, arg, p)
+
+    if p > _BABYGIANT_LIMIT:
+        if (isinstance(base, ModuloInteger)
+            and _use_indexcalculus(int(base.modulus), p)):
+            return dislog.indexcalculus(base, arg)
+
+        walk = dislog.AddingWalk(base, arg, p)
+        return dislog.expollard(base, arg, p, method='brent', walk=walk)
+
+    solver = _solvers.get(
+        (_group_key(base), p),
+        lambda: dislog.BabyGiantSolver(base, p, table='hash')
+    )
+    return solver.solve(arg)
+
+def clear_caches():
+    """Discards the cached group orders, factorizations, tables and factor
+    base logarithms.
+
+    The baby-step tables of solve are bounded to 256 MiB in total, which a
+    long-running process may want to release when it is done with a group.
+    """
+    _factorization.cache_clear()
+    _group_order.cache_clear()
+    _prime_modulus.cache_clear()
+    _clear_factor_bases()
+    _solvers.clear()
+
+def solve(alpha, beta, n=None, n_factors=None):
+    """Computes discrete logarithm choosing the algorithm automatically.
+
+    Given an element alpha of a cyclic group G and another element beta of
+    G, computes the discrete logarithm of beta to the base of alpha with the
+    fastest algorithm for the structure of the order n of G: exhaustive
+    search for tiny orders, baby-step giant-step (or rho, for very large
+    orders) for prime orders, Pohlig-Hellman otherwise.
+
+    The order of alpha is computed first (see dislog.util.subgroup_order), so
+    that the queries where beta is not a power of alpha fail after a few
+    exponentiations, and the algorithm is chosen for the subgroup generated
+    by alpha when it is not a generator.
+
+    Orders, factorizations and baby-step tables are kept in bounded caches,
+    so that repeated queries in the same group skip them (see clear_caches).
+
+    Args:
+        alpha: logarithm base (see babygiant and pohlighellman)
+        beta: logarithm argument
+        n: order of the cyclic group containing alpha and beta; if not
+            specified, alpha and beta must be ModuloInteger instances, and the
+            order is the one of the context if known, of the group of units
+            otherwise, or EllipticCurvePoint instances of a curve with known
+            order
+        n_factors: dictionary containing the prime factors of n as keys and
+            their multiplicity as values; computed if not specified
+
+    Returns:
+        The discrete logarithm log_{alpha}(beta) (the integer x such that alpha
+        to the power of x equals beta) if it exists, None otherwise
+    """
+    token = stats.start(solve)
+
+    if n is None:
+        if isinstance(alpha, ModuloInteger):
+            n = alpha.context.order or _group_order(alpha.modulus)
+        elif isinstance(alpha, EllipticCurvePoint) and alpha.curve.order:
+            n = alpha.curve.order
+        else:
+            raise ValueError("Group order must be specified")
+
+    if n_factors is None:
+        n_factors = dict(_factorization(n))
+
+    debug(solve, "alpha={} beta={} n={} factors={}", alpha, beta, n, n_factors)
+
+    subgroup = subgroup_order(alpha, beta, n, n_factors)
+    if subgroup is None:
+        debug(solve, "beta is not a power of alpha")
+        stats.record(solve, token, params={'n': n, 'method': 'precheck'})
+        return None
+
+    n, n_factors = subgroup
+
+    if n <= _EXHAUSTIVE_LIMIT:
+        method = 'exhaustive'
+        ret = dislog.exhaustive(alpha, beta, n)
+    elif len(n_factors) == 1 and n in n_factors:
+        method = 'prime'
+        ret = _prime_order_log(alpha, beta, n)
+    else:
+        method = 'pohlighellman'
+        ret = dislog.pohlighellman(
+            alpha, beta, n, n_factors, subsolver=_prime_order_log
+        )
+
+    debug(solve, "method={} logarithm={}", method, ret)
+    stats.record(solve, token, params={'n': n, 'method': method})
+    return ret
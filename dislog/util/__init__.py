@@ -1,4 +1,12 @@
+from dislog.util import stats
+from dislog.util.debug import DEBUG
 from dislog.util.debug import debug
 from dislog.util.generator import isgenerator
+from dislog.util.generator import order
+from dislog.util.generator import order_factors
+from dislog.util.generator import subgroup_order
+from dislog.util.hashing import fibonacci_hash
 from dislog.util.rand import rand_cyclic_zstar
+from dislog.util.rand import rand_cyclic_zstar_instances
 from dislog.util.rand import rand_zstar_element
+from dislog.util.power import straus
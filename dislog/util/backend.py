@@ -0,0 +1,40 @@
+import math
+import os
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+
+# Integer backend: gmpy2 if installed, unless the DISLOGBACKEND environment
+# variable is set to "python"
+if gmpy2 is not None and os.environ.get("DISLOGBACKEND") != "python":
+    NAME = 'gmpy2'
+
+    mpz = gmpy2.mpz
+    powmod = gmpy2.powmod
+    gcd = gmpy2.gcd
+
+    def invert(value, modulus):
+        """Computes the inverse of value modulo modulus, None if not coprime.
+        """
+        try:
+            return gmpy2.invert(value, modulus)
+        except ZeroDivisionError:
+            return None
+
+else:
+    NAME = 'python'
+
+    mpz = int
+    powmod = pow
+    gcd = math.gcd
+
+    def invert(value, modulus):
+        """Computes the inverse of value modulo modulus, None if not coprime.
+        """
+        try:
+            return pow(value, -1, modulus)
+        except ValueError:
+            return None
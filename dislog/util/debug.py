@@ -1,6 +1,11 @@
 import os
 
 
+# Whether debug messages are enabled; hot loops check it before calling debug,
+# so that no call is made and no argument is evaluated when it is not set
+DEBUG = "DISLOGDEBUG" in os.environ
+
+
 def debugprint(function, message, *formatargs):
     print(
         "[{}:{}]\t".format(function.__module__, function.__name__)
@@ -11,4 +16,4 @@ def dummy(*args):
     pass
 
 
-debug = debugprint if "DISLOGDEBUG" in os.environ else dummy
+debug = debugprint if DEBUG else dummy
@@ -1,3 +1,7 @@
+from dislog.util import debug
+from dislog.util import stats
+
+
 def isgenerator(alpha, n, n_primes):
     identity = alpha ** 0
 
@@ -8,3 +12,112 @@ def isgenerator(alpha, n, n_primes):
             return False
 
     return True
+
+def order_factors(alpha, n, n_factors):
+    """Computes the prime factorization of the order of a group element.
+
+    For each prime power p^e dividing n, the other factors are removed from
+    the exponent, and alpha^(n / p^e) is raised to the p until it reaches the
+    identity: the number of powers needed is the multiplicity of p in the
+    order of alpha. The cost is one exponentiation per prime factor plus at
+    most e exponentiations to the p, instead of a search over the divisors.
+    If the identity is not reached after e powers, the order of alpha does
+    not divide n (e.g. n is wrong, or alpha is not invertible).
+
+    Args:
+        alpha: group element, must support internal equality and integer
+            exponentiation
+        n: order of the group containing alpha, or any multiple of the order
+            of alpha
+        n_factors: dictionary containing the prime factors of n as keys and
+            their multiplicity as values
+
+    Returns:
+        A dictionary containing the prime factors of the order of alpha as
+        keys and their multiplicity as values, None if the order of alpha
+        does not divide n
+    """
+    return _order_factors(alpha, n, n_factors)[0]
+
+# Implementation of order_factors: returns the factors of the order of alpha
+# (None if it does not divide n) and the number of exponentiations computed
+def _order_factors(alpha, n, n_factors):
+    identity = alpha ** 0
+    factors = {}
+    exponentiations = 1
+
+    for p, e in n_factors.items():
+        power = alpha ** (n // p ** e)
+        exponentiations += 1
+
+        k = 0
+        while power != identity:
+            if k == e:
+                debug(order_factors, "alpha^n is not the identity")
+                return None, exponentiations
+            power = power ** p
+            k += 1
+            exponentiations += 1
+
+        if k:
+            factors[p] = k
+
+    return factors, exponentiations
+
+def order(alpha, n, n_factors):
+    """Computes the order of a group element (see order_factors).
+
+    Returns:
+        The order of alpha, None if it does not divide n
+    """
+    factors = order_factors(alpha, n, n_factors)
+    if factors is None:
+        return None
+
+    ret = 1
+    for p, e in factors.items():
+        ret *= p ** e
+    return ret
+
+def subgroup_order(alpha, beta, n, n_factors):
+    """Checks that beta is a power of alpha, from the order of alpha.
+
+    In a cyclic group there is exactly one subgroup of each order d, the
+    elements x with x^d = 1, so beta belongs to the subgroup generated by
+    alpha if and only if beta^ord(alpha) is the identity. The check takes a
+    handful of exponentiations, and the order it computes is the one to
+    search the logarithm in when alpha is not a generator.
+
+    Args:
+        alpha: logarithm base, must support internal equality and integer
+            exponentiation
+        beta: logarithm argument, must support internal equality and integer
+            exponentiation
+        n: order of the cyclic group containing alpha and beta
+        n_factors: dictionary containing the prime factors of n as keys and
+            their multiplicity as values
+
+    Returns:
+        A pair (order of alpha, dictionary of its prime factors and their
+        multiplicity) if beta belongs to the subgroup generated by alpha,
+        None otherwise or if the order of alpha does not divide n
+    """
+    token = stats.start(subgroup_order)
+
+    factors, exponentiations = _order_factors(alpha, n, n_factors)
+    if factors is None:
+        stats.record(subgroup_order, token, exponentiations=exponentiations)
+        return None
+
+    d = 1
+    for p, e in factors.items():
+        d *= p ** e
+
+    member = beta ** d == alpha ** 0
+
+    stats.record(
+        subgroup_order, token,
+        exponentiations=exponentiations + 2,
+        params={'order': d}
+    )
+    return (d, factors) if member else None
@@ -0,0 +1,19 @@
+# Odd 64 bit constant close to 2^64 / golden ratio, for multiplicative hashing
+GOLDEN = 0x9E3779B97F4A7C15
+MASK64 = (1 << 64) - 1
+
+def fibonacci_hash(x):
+    """Scrambles the hash of a hashable group element.
+
+    The hash is multiplied by GOLDEN modulo 2^64 (Fibonacci hashing), which
+    spreads every bit of the hash over the high bits of the result, so that
+    elements whose hashes only differ in a few bits (e.g. consecutive
+    integers scaled by a common factor) get unrelated high bits.
+
+    Args:
+        x: hashable group element
+
+    Returns:
+        An integer between 0 and 2^64 - 1, whose high bits should be used
+    """
+    return (hash(x) * GOLDEN) & MASK64
@@ -0,0 +1,89 @@
+# Upper exponent bit lengths for which each sliding window width minimizes
+# the number of group multiplications (Handbook of Applied Cryptography,
+# table 14.16)
+_WINDOW_LIMITS = [(1, 8), (2, 24), (3, 80), (4, 240), (5, 672)]
+
+def _window_width(bits):
+    for width, limit in _WINDOW_LIMITS:
+        if bits <= limit:
+            return width
+    return 6
+
+# Sliding windows of several non-negative exponents, for interleaved
+# exponentiation: maps every bit position j to the list of pairs (index of
+# the exponent, odd window value) of the windows whose lowest bit is j
+def _interleaved_windows(exponents, width):
+    windows = {}
+
+    for index, exponent in enumerate(exponents):
+        i = exponent.bit_length() - 1
+        while i >= 0:
+            if not (exponent >> i) & 1:
+                i -= 1
+                continue
+
+            j = max(i - width + 1, 0)
+            while not (exponent >> j) & 1:
+                j += 1
+            window = (exponent >> j) & ((1 << (i - j + 1)) - 1)
+            windows.setdefault(j, []).append((index, window))
+            i = j - 1
+
+    return windows
+
+def straus(bases, exponents, identity, width=None):
+    """Computes a product of powers with Straus' interleaved method.
+
+    The odd powers of every base up to the (2^width - 1)-th are precomputed,
+    then the exponents are scanned together from the most significant bit,
+    in sliding windows of at most width bits: the squarings are shared by
+    all the powers, so that the product of k powers of b bit exponents costs
+    about b squarings and k * b / (width + 1) multiplications, instead of
+    k * b squarings (Shamir's trick, generalized to windows).
+
+    Args:
+        bases: sequence of group elements, must support internal
+            multiplication
+        exponents: sequence of non-negative integer exponents, one per base
+        identity: identity element of the group containing the bases
+        width: maximum window width in bits; if not specified, it is chosen
+            according to the bit length of the largest exponent
+
+    Returns:
+        The product of the group elements bases[i] to the power of
+        exponents[i]
+    """
+    if len(bases) != len(exponents):
+        raise ValueError("There must be one exponent per base")
+    if any(exponent < 0 for exponent in exponents):
+        raise ValueError("Exponents must be non-negative")
+
+    bits = max((exponent.bit_length() for exponent in exponents), default=0)
+    if bits == 0:
+        return identity
+
+    if width is None:
+        width = _window_width(bits)
+
+    # Odd powers: odd_powers[i][k] = bases[i] ^ (2k + 1)
+    odd_powers = []
+    for base in bases:
+        powers = [base]
+        if width > 1:
+            square = base * base
+            for _ in range((1 << (width - 1)) - 1):
+                powers.append(powers[-1] * square)
+        odd_powers.append(powers)
+
+    windows = _interleaved_windows(exponents, width)
+
+    result = None
+    for j in range(bits - 1, -1, -1):
+        if result is not None:
+            result = result * result
+        for index, window in windows.get(j, ()):
+            factor = odd_powers[index][window >> 1]
+            result = factor if result is None else result * factor
+
+    return result
+
@@ -1,49 +1,139 @@
+import math
 import random
 import dislog as dg
 import dislog.util as dgutil
-from sympy.core.numbers import igcd as gcd
 from sympy.ntheory import factorint
-from sympy.ntheory import totient
+from sympy.ntheory import perfect_power
 from sympy.ntheory.primetest import isprime
 
 
-def rand_cyclic_zstar(min_modulus, max_modulus):
+# Lazy uniform permutation of the integers in [low, high]: Fisher-Yates
+# shuffle on a virtual array, storing only the swapped positions, so that
+# drawing k integers costs O(k) time and memory
+def _lazy_permutation(low, high, rng):
+    size = high - low + 1
+    swapped = {}
+
+    for i in range(size):
+        j = rng.randrange(i, size)
+        yield low + swapped.get(j, j)
+        swapped[j] = swapped.pop(i, i)
+
+# Order of Z_modulus^* and its prime factors if the group is cyclic, that is
+# if modulus is 1, 2, 4, p^k or 2p^k with p an odd prime; None otherwise
+def _cyclic_order(modulus):
+    if modulus in (1, 2):
+        return 1, []
+    if modulus == 4:
+        return 2, [2]
+
+    odd = modulus // 2 if modulus % 4 == 2 else modulus
+    if odd % 2 == 0:
+        return None
+
+    if isprime(odd):
+        p, k = odd, 1
+    else:
+        power = perfect_power(odd)
+        if not power or not isprime(power[0]):
+            return None
+        p, k = power
+
+    n_primes = list(factorint(p - 1))
+    if k > 1:
+        n_primes.append(p)
+    return (p - 1) * p ** (k - 1), n_primes
+
+# Random generator of the cyclic group Z_modulus^* of order n: candidates
+# are drawn until one is a unit and a generator, which takes O(log log n)
+# draws on average
+def _rand_generator(modulus, n, n_primes, rng):
+    if modulus == 2:
+        return 1
+
+    context = dg.ModulusContext(modulus, n)
+    while True:
+        g = rng.randrange(2, modulus)
+        if math.gcd(g, modulus) != 1:
+            continue
+        if dgutil.isgenerator(dg.ModuloInteger(g, context), n, n_primes):
+            return g
+
+def rand_cyclic_zstar_instances(min_modulus, max_modulus, count=None,
+                                rng=None):
+    """Generates random cyclic groups Z_m^* together with a generator.
+
+    Moduli are drawn without repetition from the interval, lazily, and the
+    cyclic ones are recognized from their structure (1, 2, 4, p^k or 2p^k
+    with p an odd prime) without computing the group.
+
+    Args:
+        min_modulus: smallest modulus, at least 2
+        max_modulus: largest modulus
+        count: maximum number of instances; if not specified, instances are
+            generated until the cyclic moduli of the interval are exhausted
+        rng: random.Random instance; the random module if not specified
+
+    Yields:
+        Triples (modulus, n, g) with n the order of Z_modulus^* and g a
+        generator of it
+    """
     if min_modulus < 2 or max_modulus < min_modulus:
         raise ValueError("Must be: 2 <= min_modulus <= max_modulus")
 
-    moduli = list(range(min_modulus, max_modulus + 1))
-    random.shuffle(moduli)
+    if rng is None:
+        rng = random
 
-    while moduli:
-        modulus = moduli.pop()
+    found = 0
+    for modulus in _lazy_permutation(min_modulus, max_modulus, rng):
+        if count is not None and found >= count:
+            return
 
-        n = totient(modulus)
-        n_primes = factorint(n).keys()
+        order = _cyclic_order(modulus)
+        if order is None:
+            continue
 
-        elements = [i for i in range(modulus) if gcd(i, modulus) == 1]
-        random.shuffle(elements)
+        n, n_primes = order
+        g = _rand_generator(modulus, n, n_primes, rng)
+        dgutil.debug(
+            rand_cyclic_zstar,
+            "Found Z_{} (order {}, generator {})", modulus, n, g
+        )
+        found += 1
+        yield modulus, n, g
 
-        while elements:
-            g = elements.pop()
+def rand_cyclic_zstar(min_modulus, max_modulus, rng=None):
+    """Finds a random cyclic group Z_m^* together with a generator.
 
-            if dgutil.isgenerator(dg.ModuloInteger(g, modulus), n, n_primes):
-                dgutil.debug(
-                    rand_cyclic_zstar,
-                    "Found Z_{} (order {}, generator {})", modulus, n, g
-                )
-                return (modulus, n, g)
+    Args:
+        min_modulus: smallest modulus, at least 2
+        max_modulus: largest modulus
+        rng: random.Random instance; the random module if not specified
 
-    dgutil.debug(
-        rand_cyclic_zstar,
-        "No cyclic Z* found in the specified interval"
+    Returns:
+        A triple (modulus, n, g) with n the order of Z_modulus^* and g a
+        generator of it, None if there is no cyclic Z_m^* in the interval
+    """
+    instance = next(
+        rand_cyclic_zstar_instances(min_modulus, max_modulus, 1, rng), None
     )
-    return None
 
-def rand_zstar_element(modulus):
-    candidates = list(range(1, modulus))
-    random.shuffle(candidates)
+    if instance is None:
+        dgutil.debug(
+            rand_cyclic_zstar,
+            "No cyclic Z* found in the specified interval"
+        )
+    return instance
+
+def rand_zstar_element(modulus, rng=None):
+    """Draws a random element of Z_modulus^*, None if modulus is below 2."""
+    if modulus < 2:
+        return None
+
+    if rng is None:
+        rng = random
 
-    for candidate in candidates:
-        if gcd(candidate, modulus) == 1:
+    while True:
+        candidate = rng.randrange(1, modulus)
+        if math.gcd(candidate, modulus) == 1:
             return candidate
-    return None
@@ -0,0 +1,150 @@
+import atexit
+import os
+import time
+
+
+# Counters kept for each solver
+COUNTERS = (
+    'calls', 'multiplications', 'exponentiations', 'inversions',
+    'table_inserts', 'table_lookups', 'steps', 'collisions', 'time'
+)
+
+
+class SolverStats:
+    """Counters accumulated over all the instrumented calls of a solver.
+
+    Attributes:
+        calls: number of completed calls
+        multiplications: group multiplications
+        exponentiations: group exponentiations
+        inversions: modular inversions made by the group elements (e.g.
+            ModuloInteger inverses, or the field inversions normalizing
+            elliptic curve points)
+        table_inserts: insertions in lookup tables
+        table_lookups: lookups in lookup tables
+        steps: iterations of the main loop (e.g. random walk steps)
+        collisions: collisions found (e.g. in random walks)
+        time: wall time in seconds
+        params: parameters chosen by the solver in its last call
+    """
+
+    __slots__ = COUNTERS + ('params',)
+
+    def __init__(self):
+        for counter in COUNTERS:
+            setattr(self, counter, 0)
+        self.time = 0.0
+        self.params = {}
+
+    def as_dict(self):
+        ret = {counter: getattr(self, counter) for counter in COUNTERS}
+        ret['params'] = dict(self.params)
+        return ret
+
+
+_enabled = "DISLOGSTATS" in os.environ
+_registry = {}
+
+# Running totals of the counters incremented by the group elements (see count)
+_totals = dict.fromkeys(COUNTERS, 0)
+
+def _name(function):
+    return "{}.{}".format(function.__module__, function.__qualname__)
+
+def enable(enabled=True):
+    """Enables or disables the collection of solver statistics.
+
+    Collection is enabled at import time if the DISLOGSTATS environment
+    variable is set.
+    """
+    global _enabled
+    _enabled = enabled
+
+def enabled():
+    return _enabled
+
+def start(function):
+    """Marks the beginning of an instrumented call.
+
+    Args:
+        function: the instrumented solver
+
+    Returns:
+        A token to be passed to record, None if collection is disabled
+    """
+    if not _enabled:
+        return None
+    return time.perf_counter(), dict(_totals)
+
+def count(counter, increment=1):
+    """Counts operations done inside the group elements.
+
+    Some operations, like the modular inversions hidden in element
+    arithmetic, cannot be computed by the solvers from their loop indices:
+    the elements count them here, and each instrumented call running at the
+    time is credited with the increments made between its start and record.
+
+    Args:
+        counter: one of the names in COUNTERS
+        increment: value to add to the counter
+    """
+    if _enabled:
+        _totals[counter] += increment
+
+def record(function, token, params=None, **counters):
+    """Records the counters of an instrumented call.
+
+    Counters are computed by the solvers from their loop indices once per
+    call, so that hot loops are not slowed down by bookkeeping, and added to
+    the ones counted by the group elements during the call (see count);
+    nothing is done if token is None (collection was disabled when the call
+    started).
+
+    Args:
+        function: the instrumented solver
+        token: value returned by start at the beginning of the call
+        params: optional dictionary of parameters chosen by the solver
+        counters: increments for the counters named in COUNTERS
+    """
+    if token is None:
+        return
+
+    started, totals = token
+    elapsed = time.perf_counter() - started
+
+    entry = _registry.get(_name(function))
+    if entry is None:
+        entry = _registry[_name(function)] = SolverStats()
+
+    entry.calls += 1
+    entry.time += elapsed
+    for counter, total in _totals.items():
+        counted = total - totals[counter]
+        if counted:
+            counters[counter] = counters.get(counter, 0) + counted
+    for counter, increment in counters.items():
+        setattr(entry, counter, getattr(entry, counter) + increment)
+
+    if params is not None:
+        entry.params = params
+
+def report():
+    """Returns the collected statistics.
+
+    Returns:
+        A dictionary with the qualified names of the solvers as keys and
+        dictionaries of their counters as values
+    """
+    return {name: entry.as_dict() for name, entry in _registry.items()}
+
+def reset():
+    """Discards the collected statistics."""
+    _registry.clear()
+
+def _print_report():
+    for name, counters in sorted(report().items()):
+        print("[dislog.util.stats]\t{}: {}".format(name, counters))
+
+
+if _enabled:
+    atexit.register(_print_report)
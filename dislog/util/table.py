@@ -0,0 +1,301 @@
+import array
+import bisect
+from dislog.util.hashing import fibonacci_hash
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Maximum fraction of occupied slots in HashTable
+_MAX_LOAD = 0.75
+
+def fingerprint(x, bits=64):
+    """Computes a fingerprint of a hashable group element.
+
+    The fingerprint is made of the most significant bits of the scrambled
+    hash of the element; different elements may share the same fingerprint,
+    so tables keyed by fingerprints only return candidates, which must be
+    verified.
+
+    Args:
+        x: hashable group element
+        bits: number of bits of the fingerprint, at most 64
+
+    Returns:
+        An integer between 0 and 2^bits - 1
+    """
+    return fibonacci_hash(x) >> (64 - bits)
+
+# Smallest array typecode for unsigned integers of the given number of bits
+def _typecode(bits):
+    for typecode in 'BHILQ':
+        if array.array(typecode).itemsize * 8 >= bits:
+            return typecode
+    raise ValueError("Integers of {} bits are not supported".format(bits))
+
+
+class DictTable:
+    """Baby-step table backed by a dictionary keyed by the elements.
+
+    Lookups are exact, but every entry costs the full element, the exponent
+    and the dictionary slot (hundreds of bytes for ModuloInteger).
+    """
+
+    exact = True
+
+    def __init__(self, size=None):
+        self.entries = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def insert(self, x, exponent):
+        # Only the smallest exponent of every element is kept
+        if x not in self.entries:
+            self.entries[x] = exponent
+
+    def finalize(self):
+        pass
+
+    def lookup(self, x):
+        exponent = self.entries.get(x)
+        return () if exponent is None else (exponent,)
+
+    def items(self):
+        return iter(self.entries.items())
+
+
+class HashTable:
+    """Baby-step table with open addressing over packed integer arrays.
+
+    Each slot stores the fingerprint of an element and its exponent (plus
+    one, zero marking empty slots) in two arrays, for about
+    (key_bits + exponent bits) / 8 / 0.75 bytes per entry; collisions are
+    resolved by linear probing. Lookups return candidate exponents, in
+    insertion order, which must be verified.
+    """
+
+    exact = False
+
+    def __init__(self, size, key_bits=32):
+        """Allocates the table.
+
+        Args:
+            size: maximum number of entries; exponents must be less than size
+            key_bits: number of fingerprint bits stored per entry
+        """
+        capacity = _capacity(size)
+
+        self.key_bits = key_bits
+        self.mask = capacity - 1
+        self.size = 0
+        self.keys = array.array(_typecode(key_bits), [0]) * capacity
+        self.values = (
+            array.array(_typecode((size + 1).bit_length()), [0]) * capacity
+        )
+
+    @classmethod
+    def from_arrays(cls, keys, values, key_bits, size):
+        """Builds a table over existing slot arrays (e.g. memory-mapped).
+
+        Args:
+            keys: sequence of fingerprints, one per slot; the number of slots
+                must be a power of two
+            values: sequence of exponents plus one, zero for empty slots
+            key_bits: number of bits of the fingerprints
+            size: number of occupied slots
+        """
+        table = cls.__new__(cls)
+        table.key_bits = key_bits
+        table.mask = len(keys) - 1
+        table.size = size
+        table.keys = keys
+        table.values = values
+        return table
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def nbytes(self):
+        return (self.keys.itemsize * len(self.keys)
+                + self.values.itemsize * len(self.values))
+
+    def insert(self, x, exponent):
+        key = fingerprint(x, self.key_bits)
+        keys, values, mask = self.keys, self.values, self.mask
+
+        slot = key & mask
+        while values[slot]:
+            slot = (slot + 1) & mask
+
+        keys[slot] = key
+        values[slot] = exponent + 1
+        self.size += 1
+
+    def finalize(self):
+        pass
+
+    def lookup(self, x):
+        key = fingerprint(x, self.key_bits)
+        keys, values, mask = self.keys, self.values, self.mask
+
+        candidates = []
+        slot = key & mask
+        while values[slot]:
+            if keys[slot] == key:
+                candidates.append(values[slot] - 1)
+            slot = (slot + 1) & mask
+
+        return candidates
+
+    def items(self):
+        for key, value in zip(self.keys, self.values):
+            if value:
+                yield key, value - 1
+
+
+class SortedTable:
+    """Baby-step table stored as fingerprints sorted in a packed array.
+
+    Entries are appended while the table is filled and sorted once by
+    finalize, after which lookups are binary searches; uses NumPy if
+    available. Each entry costs (key_bits + exponent bits) / 8 bytes, with
+    no empty slots. Lookups return candidate exponents, in increasing order,
+    which must be verified.
+    """
+
+    exact = False
+
+    def __init__(self, size, key_bits=32):
+        """Allocates the table.
+
+        Args:
+            size: maximum number of entries; exponents must be less than size
+            key_bits: number of fingerprint bits stored per entry
+        """
+        self.key_bits = key_bits
+        self.keys = array.array(_typecode(key_bits))
+        self.values = array.array(_typecode(size.bit_length()))
+
+    @classmethod
+    def from_arrays(cls, keys, values, key_bits, size=None):
+        """Builds a finalized table over existing arrays (e.g. memory-mapped).
+
+        Args:
+            keys: sequence of fingerprints, sorted
+            values: sequence of the corresponding exponents
+            key_bits: number of bits of the fingerprints
+            size: ignored, the size being the length of keys
+        """
+        table = cls.__new__(cls)
+        table.key_bits = key_bits
+        table.keys = keys
+        table.values = values
+        return table
+
+    def __len__(self):
+        return len(self.keys)
+
+    @property
+    def nbytes(self):
+        return (self.keys.itemsize * len(self.keys)
+                + self.values.itemsize * len(self.values))
+
+    def insert(self, x, exponent):
+        self.keys.append(fingerprint(x, self.key_bits))
+        self.values.append(exponent)
+
+    def finalize(self):
+        """Sorts the entries by fingerprint; must be called before lookups."""
+        if numpy is not None:
+            keys = numpy.frombuffer(self.keys, dtype=self.keys.typecode)
+            values = numpy.frombuffer(self.values, dtype=self.values.typecode)
+            order = numpy.argsort(keys, kind='stable')
+            self.keys = array.array(self.keys.typecode, keys[order].tobytes())
+            self.values = array.array(
+                self.values.typecode, values[order].tobytes()
+            )
+        else:
+            order = sorted(range(len(self.keys)), key=self.keys.__getitem__)
+            self.keys = array.array(
+                self.keys.typecode, (self.keys[i] for i in order)
+            )
+            self.values = array.array(
+                self.values.typecode, (self.values[i] for i in order)
+            )
+
+    def lookup(self, x):
+        key = fingerprint(x, self.key_bits)
+        keys = self.keys
+
+        start = bisect.bisect_left(keys, key)
+        end = start
+        while end < len(keys) and keys[end] == key:
+            end += 1
+
+        return self.values[start:end]
+
+    def items(self):
+        return zip(self.keys, self.values)
+
+
+# Approximate cost in bytes of a DictTable entry for small ModuloInteger
+# elements: instance, integer value, exponent and dictionary slot
+_DICT_ENTRY_BYTES = 160
+
+# Number of slots of a HashTable holding size entries
+def _capacity(size):
+    capacity = 1
+    while capacity * _MAX_LOAD < size:
+        capacity *= 2
+    return capacity
+
+def estimate_bytes(kind, size, key_bits=32):
+    """Estimates the memory needed by a baby-step table.
+
+    Args:
+        kind: either 'dict', 'hash' or 'sorted'
+        size: number of entries
+        key_bits: number of fingerprint bits stored per entry
+
+    Returns:
+        The estimated size of the table in bytes
+    """
+    if kind not in TABLES:
+        raise ValueError("Unknown table backend: {}".format(kind))
+
+    if kind == 'dict':
+        return size * _DICT_ENTRY_BYTES
+
+    key_size = array.array(_typecode(key_bits)).itemsize
+    if kind == 'hash':
+        value_size = array.array(_typecode((size + 1).bit_length())).itemsize
+        return _capacity(size) * (key_size + value_size)
+
+    value_size = array.array(_typecode(size.bit_length())).itemsize
+    return size * (key_size + value_size)
+
+
+# Table backends selectable in babygiant
+TABLES = {
+    'dict': DictTable,
+    'hash': HashTable,
+    'sorted': SortedTable
+}
+
+def make_table(kind, size):
+    """Creates an empty baby-step table.
+
+    Args:
+        kind: either 'dict', 'hash' or 'sorted'
+        size: maximum number of entries
+
+    Returns:
+        A table instance
+    """
+    if kind not in TABLES:
+        raise ValueError("Unknown table backend: {}".format(kind))
+    return TABLES[kind](size)
@@ -0,0 +1,283 @@
+import collections
+import random
+from dislog.group import multi_power
+from dislog.util import DEBUG
+from dislog.util import debug
+from dislog.util import fibonacci_hash
+
+
+def hash_partition(x, r):
+    """Maps a hashable group element to one of r partitions.
+
+    The hash of the element is scrambled with Fibonacci hashing, so that
+    elements whose hashes only differ in their high bits (e.g. consecutive
+    integers scaled by a common factor) are spread among the partitions.
+
+    Args:
+        x: hashable group element
+        r: number of partitions
+
+    Returns:
+        An integer between 0 and r - 1
+    """
+    return (fibonacci_hash(x) >> 32) % r
+
+
+# ClassicWalk helper list for alpha exponents
+_A_MAP = [
+    lambda a, n: a,
+    lambda a, n: (a * 2) % n,
+    lambda a, n: (a + 1) % n
+]
+
+# ClassicWalk helper list for beta exponents
+_B_MAP = [
+    lambda b, n: (b + 1) % n,
+    lambda b, n: (b * 2) % n,
+    lambda b, n: b
+]
+
+# ClassicWalk helper list for group elements
+_X_MAP = [
+    lambda x, alpha, beta: x * beta,
+    lambda x, alpha, beta: x ** 2,
+    lambda x, alpha, beta: x * alpha
+]
+
+
+class ClassicWalk:
+    """Pollard's original iteration function on three partitions.
+
+    Depending on the partition of the current element x, the next one is
+    x * beta, x^2 or x * alpha.
+    """
+
+    def __init__(self, alpha, beta, n, s_map=None):
+        """Initializes the walk.
+
+        Args:
+            alpha: logarithm base
+            beta: logarithm argument
+            n: order of the group containing alpha and beta
+            s_map: function mapping group elements to their partition, an
+                integer between 0 and 2; if not specified, the partition is
+                computed from the hash of the element
+        """
+        self.alpha = alpha
+        self.beta = beta
+        self.n = n
+        self.s_map = s_map
+
+    def start(self, a, b):
+        """Returns the triple (a, b, alpha^a * beta^b) to start a walk from."""
+        return (a, b, multi_power((self.alpha, self.beta), (a, b)))
+
+    def step(self, a, b, x):
+        """Maps a triple (alpha exponent, beta exponent, element) to the next.
+        """
+        if self.s_map is None:
+            s_num = hash_partition(x, 3)
+        else:
+            s_num = self.s_map(x)
+
+        if DEBUG:
+            debug(
+                ClassicWalk,
+                "Step for: s_num={} a={} b={} x={}", s_num, a, b, x
+            )
+
+        n = self.n
+        return (
+            _A_MAP[s_num](a, n),
+            _B_MAP[s_num](b, n),
+            _X_MAP[s_num](x, self.alpha, self.beta)
+        )
+
+
+class AddingWalk:
+    """Teske's r-adding walk, optionally mixed with squaring steps.
+
+    The group is split in r partitions by hash_partition. For the first
+    r - squarings partitions, the next element is x * M_i with a precomputed
+    multiplier M_i = alpha^(m_i) * beta^(n_i) for random m_i, n_i; for the
+    remaining ones, the next element is x^2. Plain r-adding walks (r about
+    20) behave like random mappings, and take fewer steps to a collision than
+    the classic walk.
+    """
+
+    def __init__(self, alpha, beta, n, r=20, squarings=0, seed=None):
+        """Initializes the walk, computing the multipliers.
+
+        Args:
+            alpha: logarithm base
+            beta: logarithm argument
+            n: order of the group containing alpha and beta
+            r: number of partitions
+            squarings: number of partitions mapped by squaring (mixed walk);
+                must be less than r
+            seed: seed for the exponents of the multipliers
+        """
+        if not 0 <= squarings < r:
+            raise ValueError("Must be: 0 <= squarings < r")
+
+        self.alpha = alpha
+        self.beta = beta
+        self.n = n
+        self.r = r
+        self.squarings = squarings
+
+        rng = random.Random(seed)
+        self.exponents = [
+            (rng.randrange(n), rng.randrange(n))
+            for _ in range(r - squarings)
+        ]
+        self.multipliers = [
+            multi_power((alpha, beta), exponents)
+            for exponents in self.exponents
+        ]
+
+        debug(AddingWalk, "r={} squarings={}", r, squarings)
+
+    def start(self, a, b):
+        """Returns the triple (a, b, alpha^a * beta^b) to start a walk from."""
+        return (a, b, multi_power((self.alpha, self.beta), (a, b)))
+
+    def step(self, a, b, x):
+        """Maps a triple (alpha exponent, beta exponent, element) to the next.
+        """
+        i = hash_partition(x, self.r)
+
+        if i < len(self.multipliers):
+            m, k = self.exponents[i]
+            n = self.n
+            return ((a + m) % n, (b + k) % n, x * self.multipliers[i])
+
+        n = self.n
+        return ((a * 2) % n, (b * 2) % n, x * x)
+
+
+class MixedWalk(AddingWalk):
+    """Teske's mixed walk: r-adding walk with some squaring partitions."""
+
+    def __init__(self, alpha, beta, n, r=20, squarings=4, seed=None):
+        super().__init__(alpha, beta, n, r, squarings, seed)
+
+
+class NegationWalk(AddingWalk):
+    """r-adding walk on the classes {x, x^-1} of the negation map.
+
+    In groups where inversion is cheap, like elliptic curves, the walk only
+    visits the representatives chosen by x.canonical() (see
+    dislog.group.GroupElement), negating the exponents when the
+    representative is the inverse. The walk moves in a set of about n / 2
+    classes, so that the expected number of steps to a collision shrinks by
+    a factor sqrt(2).
+
+    Two consecutive steps with the same multiplier M can bring the walk back
+    to its starting point, since (x * M)^-1 * M = x^-1, trapping it in a
+    fruitless cycle. To make 2-cycles rare, each step looks ahead and skips
+    to the next multiplier when the next element would fall in the partition
+    of the current one. Longer fruitless cycles (4, 6, ... steps) are still
+    entered every O(r^2) steps or so, which at the sizes where the negation
+    map pays off happens many times per walk. The walk therefore remembers
+    its last max_cycle elements, and when an element repeats among them,
+    escapes from the cycle by doubling its smallest element (by hash), as
+    proposed by Bos, Kleinjung and Lenstra: the escape only depends on the
+    cycle, so walks meeting in it still leave it together.
+
+    The memory makes the walk stateful: each instance must follow a single
+    sequence of steps from start (pollard gives the hare of Floyd's method a
+    copy of the walk).
+
+    The products beyond one per step are counted in the retries (look-ahead)
+    and escapes attributes, for the statistics of the solvers.
+    """
+
+    def __init__(self, alpha, beta, n, r=128, seed=None, max_cycle=12):
+        """Initializes the walk, computing the multipliers.
+
+        Args:
+            alpha: logarithm base, must implement canonical
+            beta: logarithm argument, must implement canonical
+            n: order of the group containing alpha and beta
+            r: number of partitions
+            seed: seed for the exponents of the multipliers
+            max_cycle: length of the longest fruitless cycle detected
+        """
+        super().__init__(alpha, beta, n, r, 0, seed)
+        self.max_cycle = max_cycle
+        self.retries = 0
+        self.escapes = 0
+        self._recent = collections.deque(maxlen=max_cycle)
+
+    def __copy__(self):
+        walk = object.__new__(type(self))
+        walk.__dict__.update(self.__dict__)
+        walk._recent = collections.deque(self._recent, self.max_cycle)
+        return walk
+
+    def start(self, a, b):
+        """Returns the triple (a, b, alpha^a * beta^b) to start a walk from,
+        with a, b negated if the representative is the inverse.
+        """
+        x, negated = multi_power((self.alpha, self.beta), (a, b)).canonical()
+        if negated:
+            n = self.n
+            a, b = (-a) % n, (-b) % n
+
+        self._recent.clear()
+        self._recent.append((hash(x), a, b, x))
+        return (a, b, x)
+
+    def step(self, a, b, x):
+        """Maps a triple (alpha exponent, beta exponent, element) to the next.
+        """
+        r = self.r
+        multipliers = self.multipliers
+        partition = hash_partition(x, r)
+
+        # Look-ahead: the first multiplier, from the one of the partition of
+        # x, whose product leaves that partition; the last one tried if none
+        for offset in range(r):
+            i = (partition + offset) % r
+            y, negated = (x * multipliers[i]).canonical()
+            if hash_partition(y, r) != partition:
+                break
+        if offset:
+            self.retries += offset
+
+        m, k = self.exponents[i]
+        n = self.n
+        if negated:
+            a, b = (-a - m) % n, (-b - k) % n
+        else:
+            a, b = (a + m) % n, (b + k) % n
+
+        recent = self._recent
+        key = hash(y)
+        for position, (other_key, _, _, other) in enumerate(recent):
+            if other_key == key and other == y:
+                return self._escape(list(recent)[position:])
+
+        recent.append((key, a, b, y))
+        return (a, b, y)
+
+    # Leaves a fruitless cycle, given as (hash, a, b, element) entries, from
+    # the double of its element with the smallest hash
+    def _escape(self, cycle):
+        _, a, b, x = min(cycle, key=lambda entry: entry[0])
+        self.escapes += 1
+
+        if DEBUG:
+            debug(NegationWalk, "Escaping {}-cycle from {}", len(cycle), x)
+
+        y, negated = (x * x).canonical()
+        n = self.n
+        a, b = (2 * a) % n, (2 * b) % n
+        if negated:
+            a, b = (-a) % n, (-b) % n
+
+        self._recent.clear()
+        self._recent.append((hash(y), a, b, y))
+        return (a, b, y)
+
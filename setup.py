@@ -4,6 +4,7 @@ from setuptools import setup
 setup(
     author='daberg',
     description="Implementation of discrete logarithm algorithms",
+    extras_require={'numpy': ['numpy'], 'gmpy2': ['gmpy2']},
     install_requires=['sympy>=1.4'],
     name='dislog',
     packages=['dislog', 'dislog.util'],
@@ -0,0 +1,91 @@
+import dislog
+import os
+from dislog.babygiant import choose_m
+from dislog.util.table import estimate_bytes
+import tempfile
+import unittest
+
+
+class BabyGiantSolverTestCase(unittest.TestCase):
+    # 2 is a generator of Z_{1000003}, of order 1000002
+    modulus = 1000003
+    n = 1000002
+
+    def test_solve_many(self):
+        alpha = dislog.ModuloInteger(2, self.modulus)
+        logs = [0, 1, 999, 123456, 1000001]
+
+        for table in ('dict', 'hash', 'sorted'):
+            solver = dislog.BabyGiantSolver(alpha, self.n, table=table)
+            self.assertEqual(
+                solver.solve_many(alpha ** log for log in logs),
+                logs,
+                "Incorrect logarithms with {} table".format(table)
+            )
+
+    def test_save_load(self):
+        alpha = dislog.ModuloInteger(2, self.modulus)
+        logs = [5, 777777]
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'table.bin')
+
+            for table in ('dict', 'hash', 'sorted'):
+                dislog.BabyGiantSolver(alpha, self.n, table=table).save(path)
+
+                for use_mmap in (True, False):
+                    solver = dislog.BabyGiantSolver.load(
+                        path, alpha, use_mmap=use_mmap
+                    )
+                    self.assertEqual(
+                        solver.solve_many(alpha ** log for log in logs),
+                        logs,
+                        "Incorrect logarithms with loaded {} table"
+                        .format(table)
+                    )
+                    del solver
+
+            with self.assertRaises(ValueError):
+                dislog.BabyGiantSolver.load(
+                    path, dislog.ModuloInteger(3, self.modulus)
+                )
+
+    def test_choose_m(self):
+        # Entry structure: (n, queries, expected m)
+        cases = [
+            (1, 1, 1),
+            (2, 1, 2),
+            (20, 1, 5),
+            (10 ** 6, 1, 1000),
+            (10 ** 6, 100, 10000),
+            (10 ** 40 + 1, 1, 10 ** 20 + 1)
+        ]
+
+        for n, queries, expected_m in cases:
+            self.assertEqual(choose_m(n, queries), expected_m)
+
+        self.assertEqual(choose_m(10 ** 6, max_entries=10), 10)
+
+        for table in ('dict', 'hash', 'sorted'):
+            m = choose_m(10 ** 12, memory=10 ** 5, table=table)
+            self.assertLessEqual(estimate_bytes(table, m), 10 ** 5)
+            self.assertGreater(estimate_bytes(table, m + 1), 10 ** 5)
+
+    def test_memory_budget(self):
+        alpha = dislog.ModuloInteger(2, self.modulus)
+        solver = dislog.BabyGiantSolver(
+            alpha, self.n, table='sorted', memory=4000
+        )
+
+        self.assertEqual(solver.params['memory'], 4000)
+        self.assertLess(solver.m, 1000)
+        self.assertEqual(solver.solve(alpha ** 424242), 424242)
+
+        self.assertEqual(
+            dislog.babygiant(alpha, alpha ** 31337, self.n, max_entries=100),
+            31337
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import dislog
+import unittest
+from dislog.util import backend
+
+
+class BackendTestCase(unittest.TestCase):
+    def test_backend_functions(self):
+        self.assertIn(backend.NAME, ('gmpy2', 'python'))
+
+        # Case list entry structure: (value, modulus, expected_inverse_value)
+        cases = [
+            (2, 3, 2),
+            (2, 6, None),
+            (67, 119, 16),
+            (3, 2 ** 521 - 1, pow(3, -1, 2 ** 521 - 1))
+        ]
+
+        for value, modulus, expected in cases:
+            self.assertEqual(backend.invert(value, modulus), expected)
+
+        self.assertEqual(backend.powmod(3, 10 ** 20, 1009), pow(3, 10 ** 20, 1009))
+        self.assertEqual(backend.gcd(12, 18), 6)
+
+    def test_backend_elements(self):
+        x = dislog.ModuloInteger(3, 2 ** 127 - 1)
+
+        self.assertIsInstance(x.value, type(backend.mpz(0)))
+        self.assertEqual(hash(x), hash(3))
+        self.assertEqual((x ** -1 * x).value, 1)
+        self.assertEqual(x ** backend.mpz(5), x ** 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import dislog
+import random
+import unittest
+from dislog import batch
+
+
+@unittest.skipIf(batch.numpy is None, "NumPy is not installed")
+class BatchTestCase(unittest.TestCase):
+    # 2 is a generator of Z_{20971661}, of order 2^2 * 5 * 1048583
+    modulus = 20971661
+    n = 20971660
+    n_factors = {2: 2, 5: 1, 1048583: 1}
+
+    def test_batch_solvers(self):
+        rng = random.Random(0)
+        alpha = dislog.ModuloInteger(2, self.modulus)
+        logs = [0, 1, self.n - 1] + [rng.randrange(self.n) for _ in range(200)]
+        betas = [alpha ** log for log in logs]
+
+        self.assertEqual(dislog.batch_babygiant(alpha, betas, self.n), logs)
+        self.assertEqual(
+            dislog.batch_pohlighellman(alpha, betas, self.n, self.n_factors),
+            logs
+        )
+
+        values = batch.numpy.array([beta.value for beta in betas])
+        self.assertEqual(
+            dislog.batch_babygiant(alpha, values, self.n, m=1000), logs
+        )
+
+    def test_batch_missing(self):
+        # 654 does not belong to the subgroup generated by 897
+        alpha = dislog.ModuloInteger(897, 1709)
+        betas = [654, 1, 897]
+
+        self.assertEqual(
+            dislog.batch_babygiant(alpha, betas, 1708), [None, 0, 1]
+        )
+        self.assertEqual(
+            dislog.batch_pohlighellman(
+                alpha, betas, 1708, {2: 2, 7: 1, 61: 1}
+            )[:2],
+            [None, 0]
+        )
+
+        with self.assertRaises(ValueError):
+            dislog.batch_babygiant(
+                dislog.ModuloInteger(3, 2 ** 31 + 11), [1], 2 ** 31 + 10
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -42,5 +42,21 @@ class DislogTestCase(unittest.TestCase):
                 "Incorrect return value for Pollard algorithm"
             )
 
+            # With the factorization of n, queries without a logarithm are
+            # rejected before the search
+            n_factors = factorint(n)
+            self.assertEqual(
+                dislog.exhaustive(alpha, beta, n, n_factors),
+                expected_value
+            )
+            self.assertEqual(
+                dislog.babygiant(alpha, beta, n, n_factors=n_factors),
+                expected_value
+            )
+            self.assertEqual(
+                dislog.expollard(alpha, beta, n, n_factors=n_factors, seed=0),
+                expected_value
+            )
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,192 @@
+import dislog
+import pickle
+import random
+import unittest
+
+
+# Affine group law, as reference for the Jacobian one; None is the point at
+# infinity
+def affine_add(P, Q, a, p):
+    if P is None:
+        return Q
+    if Q is None:
+        return P
+
+    (x1, y1), (x2, y2) = P, Q
+    if x1 == x2 and (y1 + y2) % p == 0:
+        return None
+
+    if P == Q:
+        slope = (3 * x1 * x1 + a) * pow(2 * y1, -1, p) % p
+    else:
+        slope = (y2 - y1) * pow(x2 - x1, -1, p) % p
+
+    x3 = (slope * slope - x1 - x2) % p
+    return (x3, (slope * (x1 - x3) - y1) % p)
+
+def affine(P):
+    return None if P.is_infinity() else (P.x, P.y)
+
+
+class EllipticCurveTestCase(unittest.TestCase):
+    # y^2 = x^3 + 3x + 6 over F_{10007} has prime order 10039
+    prime_curve = (10007, 3, 6, 10039)
+    # y^2 = x^3 + x + 1 over F_{10007} has order 10065 = 3 * 5 * 11 * 61
+    smooth_curve = (10007, 1, 1, 10065)
+    # y^2 = x^3 + 3x + 7 over F_{1000003} has prime order 999853
+    rho_curve = (1000003, 3, 7, 999853)
+
+    def points(self, curve, count, seed=0):
+        rng = random.Random(seed)
+        points = []
+        while len(points) < count:
+            point = curve.lift_x(rng.randrange(curve.p))
+            if point is not None:
+                points.append(point)
+        return points
+
+    def test_ellipticcurve_arithmetic(self):
+        p, a, b, n = self.prime_curve
+        curve = dislog.EllipticCurve(p, a, b)
+        infinity = curve.infinity()
+        points = self.points(curve, 8)
+
+        for P in points:
+            self.assertTrue(curve.contains(P.x, P.y))
+            self.assertEqual(P * infinity, P)
+            self.assertEqual(P * P.inverse(), infinity)
+            self.assertEqual(P ** 0, infinity)
+            self.assertEqual(P ** n, infinity)
+            self.assertEqual(P ** -5, (P ** 5).inverse())
+            self.assertEqual(affine(P * P), affine_add(
+                affine(P), affine(P), a, p
+            ))
+
+            # Jacobian sums of Jacobian points against the affine group law
+            double = P ** 2
+            for Q in points:
+                self.assertEqual(
+                    affine(double * (Q ** 3)),
+                    affine_add(
+                        affine_add(affine(P), affine(P), a, p),
+                        affine_add(affine_add(affine(Q), affine(Q), a, p),
+                                   affine(Q), a, p),
+                        a, p
+                    )
+                )
+
+            # Equal points have equal hashes, whatever their coordinates
+            jacobian = (P ** 3) * (P ** 4)
+            self.assertNotEqual(jacobian.Z, 1)
+            self.assertEqual(jacobian, P ** 7)
+            self.assertEqual(hash(jacobian), hash(curve.point(
+                (P ** 7).x, (P ** 7).y
+            )))
+
+            representative, negated = P.canonical()
+            self.assertLessEqual(2 * representative.y, p)
+            self.assertEqual(
+                representative, P.inverse() if negated else P
+            )
+
+        for exponents in ([0, 0], [1, -1], [n - 1, 12345], [-777, 2 * n + 3]):
+            self.assertEqual(
+                dislog.EllipticCurvePoint.multi_power(points[:2], exponents),
+                (points[0] ** exponents[0]) * (points[1] ** exponents[1])
+            )
+
+        self.assertEqual(
+            pickle.loads(pickle.dumps(points[0] ** 9)), points[0] ** 9
+        )
+
+        with self.assertRaises(ValueError):
+            curve.point(0, 1)
+
+        with self.assertRaises(ValueError):
+            dislog.EllipticCurve(p, 0, 0)
+
+        with self.assertRaises(ValueError):
+            points[0] * dislog.EllipticCurve(*self.smooth_curve).infinity()
+
+        with self.assertRaises(TypeError):
+            points[0] * dislog.ModuloInteger(1, p)
+
+    def test_ellipticcurve_solvers(self):
+        p, a, b, n = self.prime_curve
+        curve = dislog.EllipticCurve(p, a, b, order=n)
+        alpha = curve.point(0, 1973)
+        self.assertIsInstance(alpha, dislog.GroupElement)
+
+        for log in (0, 1, 1234, n - 1):
+            beta = alpha ** log
+            self.assertEqual(dislog.exhaustive(alpha, beta, n), log)
+            self.assertEqual(dislog.babygiant(alpha, beta, n), log)
+            self.assertEqual(
+                dislog.babygiant(alpha, beta, n, table='hash'), log
+            )
+            self.assertEqual(dislog.solve(alpha, beta), log)
+
+        p, a, b, n = self.smooth_curve
+        curve = dislog.EllipticCurve(p, a, b, order=n)
+        n_factors = {3: 1, 5: 1, 11: 1, 61: 1}
+        alpha = next(
+            P for P in self.points(curve, 20)
+            if all(P ** (n // q) != curve.infinity() for q in n_factors)
+        )
+
+        for log in (2, 4321, n - 2):
+            beta = alpha ** log
+            self.assertEqual(
+                dislog.pohlighellman(alpha, beta, n, n_factors), log
+            )
+            self.assertEqual(dislog.solve(alpha, beta, n), log)
+
+    def test_ellipticcurve_negation_walk(self):
+        p, a, b, n = self.rho_curve
+        curve = dislog.EllipticCurve(p, a, b, order=n)
+        alpha = self.points(curve, 1)[0]
+
+        for log in (3, 777777):
+            beta = alpha ** log
+
+            for walk in (dislog.AddingWalk(alpha, beta, n, seed=log),
+                         dislog.NegationWalk(alpha, beta, n, seed=log)):
+                self.assertEqual(
+                    dislog.expollard(alpha, beta, n, seed=log, walk=walk),
+                    log,
+                    "Incorrect logarithm with {}".format(type(walk).__name__)
+                )
+
+            # The exponents follow the representatives chosen by the walk
+            walk = dislog.NegationWalk(alpha, beta, n, seed=log)
+            a_exp, b_exp, x = walk.start(5, 6)
+            for _ in range(200):
+                a_exp, b_exp, x = walk.step(a_exp, b_exp, x)
+                self.assertEqual((alpha ** a_exp) * (beta ** b_exp), x)
+                self.assertFalse(x.canonical()[1])
+
+    def test_ellipticcurve_negation_walk_cycles(self):
+        # Supersingular curve y^2 = x^3 + x with p = 3 (mod 4), of order
+        # p + 1 = 4q, q > 2^30 prime: fruitless cycles are entered many times
+        # per walk, and single walks only succeed by escaping them
+        q = 1073741843
+        p = 4 * q - 1
+        curve = dislog.EllipticCurve(p, 1, 0, order=p + 1)
+        alpha = curve.lift_x(3) ** 4
+        self.assertEqual(alpha ** q, curve.infinity())
+
+        for log, method in ((123456789, 'brent'), (987654321, 'brent'),
+                            (555555555, 'floyd')):
+            beta = alpha ** log
+            walk = dislog.NegationWalk(alpha, beta, q, seed=log)
+            self.assertEqual(
+                dislog.pollard(alpha, beta, q, a_start=log % 1000, b_start=1,
+                               method=method, walk=walk),
+                log,
+                "Incorrect logarithm with {}".format(method)
+            )
+            self.assertGreater(walk.escapes, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
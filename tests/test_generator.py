@@ -0,0 +1,68 @@
+import dislog
+import unittest
+from dislog.util import isgenerator
+from dislog.util import order
+from dislog.util import order_factors
+from dislog.util import subgroup_order
+
+
+class GeneratorTestCase(unittest.TestCase):
+    # Z_{1709} is cyclic, of order 1708 = 2^2 * 7 * 61, generated by 3
+    modulus = 1709
+    n = 1708
+    n_factors = {2: 2, 7: 1, 61: 1}
+
+    def test_order(self):
+        divisors = [d for d in range(1, self.n + 1) if self.n % d == 0]
+
+        for value in range(1, self.modulus):
+            x = dislog.ModuloInteger(value, self.modulus)
+            expected = next(d for d in divisors if x ** d == x ** 0)
+
+            self.assertEqual(order(x, self.n, self.n_factors), expected)
+            self.assertEqual(
+                isgenerator(x, self.n, self.n_factors),
+                expected == self.n
+            )
+
+        alpha = dislog.ModuloInteger(3, self.modulus)
+        self.assertEqual(
+            order_factors(alpha ** 28, self.n, self.n_factors), {61: 1}
+        )
+        self.assertEqual(order_factors(alpha ** 0, self.n, self.n_factors), {})
+
+        # 3 has order 1708, which does not divide 1708 / 7; 10 is not
+        # invertible modulo 50, so no power of it is the identity
+        self.assertIsNone(order(alpha, self.n // 7, {2: 2, 61: 1}))
+        self.assertIsNone(
+            order_factors(dislog.ModuloInteger(10, 50), 20, {2: 2, 5: 1})
+        )
+
+    def test_subgroup_order(self):
+        alpha = dislog.ModuloInteger(3, self.modulus)
+
+        self.assertEqual(
+            subgroup_order(alpha ** 28, alpha ** 140, self.n, self.n_factors),
+            (61, {61: 1})
+        )
+
+        # 897 = 3^945 has order 2^2 * 61, and 654 = 3^1552 does not belong
+        # to its subgroup
+        self.assertIsNone(
+            subgroup_order(
+                dislog.ModuloInteger(897, self.modulus),
+                dislog.ModuloInteger(654, self.modulus),
+                self.n, self.n_factors
+            )
+        )
+
+        self.assertIsNone(
+            subgroup_order(
+                dislog.ModuloInteger(10, 50), dislog.ModuloInteger(0, 50),
+                20, {2: 2, 5: 1}
+            )
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import dislog
+import random
+import unittest
+from dislog.indexcalculus import _EchelonSystem
+from dislog.indexcalculus import _split
+
+
+class IndexCalculusTestCase(unittest.TestCase):
+    # Safe prime: 2 * 140737488355781 + 1
+    safe_prime = 281474976711563
+    # p - 1 = 2 * 1723 * 2447 * 273451615243
+    prime = 2305843009213693967
+
+    def test_indexcalculus_helpers(self):
+        rng = random.Random(0)
+        for _ in range(100):
+            z = rng.randrange(1, self.prime)
+            r, t = _split(z, self.prime)
+            self.assertEqual((z * t - r) % self.prime, 0)
+            self.assertLess(abs(r) * abs(t), 2 * self.prime)
+
+        # Rank deficient system modulo 7^2: x0 + x1 = 3, x1 = 2, 7 * x2 = 7
+        system = _EchelonSystem(7, 49)
+        self.assertTrue(system.add({0: 1, 1: 1}, 3))
+        self.assertTrue(system.add({1: 1}, 2))
+        self.assertFalse(system.add({0: 2, 1: 2}, 6))
+        self.assertFalse(system.add({2: 7}, 7))
+        self.assertEqual(system.rank, 2)
+        self.assertEqual(system.solve(), {0: 1, 1: 2})
+
+    def test_indexcalculus_solver(self):
+        rng = random.Random(1)
+
+        for p in (self.safe_prime, self.prime):
+            solver = dislog.IndexCalculusSolver(p, seed=p)
+            g = solver.generator
+            cofactor = (p - 1) // solver.large_modulus
+
+            # Factor base logarithms are known modulo large_modulus only
+            for q, log in solver.logs.items():
+                x = g ** log * dislog.ModuloInteger(q, p) ** -1
+                self.assertEqual((x ** cofactor).value, 1)
+
+            for _ in range(5):
+                log = rng.randrange(p - 1)
+                self.assertEqual(solver.log(g ** log), log)
+
+            # Base of smaller order
+            alpha = g ** 6
+            order = (p - 1) // 6 if p == self.prime else (p - 1) // 2
+            log = rng.randrange(order)
+            self.assertEqual(solver.solve(alpha, alpha ** log), log)
+            self.assertIsNone(solver.solve(alpha, g))
+            self.assertIsNone(solver.log(dislog.ModuloInteger(0, p)))
+
+        with self.assertRaises(ValueError):
+            dislog.IndexCalculusSolver(self.safe_prime + 2)
+
+        # Tiny fields, down to the trivial group Z_2^*
+        for p in (2, 3, 5, 13):
+            solver = dislog.IndexCalculusSolver(p)
+            g = solver.generator
+            for log in range(p - 1):
+                self.assertEqual(solver.log(g ** log), log)
+
+    def test_indexcalculus_trials(self):
+        # With the factor base {2}, relations need both halves of a
+        # splitting to be powers of two: collection gives up after
+        # max_trials, and no logarithm can be computed
+        solver = dislog.IndexCalculusSolver(
+            self.safe_prime, bound=2, seed=0, max_trials=1000
+        )
+        self.assertEqual(solver.relations, 0)
+        self.assertEqual(solver.logs, {})
+        self.assertIsNone(solver.log(solver.generator ** 12345))
+
+    def test_indexcalculus_solve(self):
+        p = self.safe_prime
+        q = (p - 1) // 2
+        alpha = dislog.ModuloInteger(4, p)
+
+        for log in (0, 1, 123456789, q - 1):
+            beta = alpha ** log
+            self.assertEqual(dislog.indexcalculus(alpha, beta), log)
+
+            # Prime order beyond the baby-step giant-step limit
+            self.assertEqual(dislog.solve(alpha, beta, q), log)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import dislog
+import random
+import unittest
+from dislog.util import stats
+
+
+class KangarooTestCase(unittest.TestCase):
+    # 2^61 - 1 is prime, and 37 generates Z_{2^61 - 1}
+    modulus = 2 ** 61 - 1
+
+    def test_kangaroo(self):
+        rng = random.Random(0)
+        alpha = dislog.ModuloInteger(37, self.modulus)
+
+        for width in (0, 10, 1000, 10 ** 6):
+            for _ in range(5):
+                lo = rng.randrange(10 ** 15)
+                log = lo + rng.randrange(width + 1)
+                beta = alpha ** log
+
+                self.assertEqual(
+                    dislog.kangaroo(alpha, beta, lo, lo + width), log,
+                    "Incorrect logarithm in [{}, {}]".format(lo, lo + width)
+                )
+                self.assertEqual(
+                    dislog.interval_babygiant(alpha, beta, lo, lo + width),
+                    log
+                )
+                self.assertEqual(
+                    dislog.interval_babygiant(
+                        alpha, beta, lo, lo + width, table='hash',
+                        n=self.modulus - 1
+                    ),
+                    log
+                )
+
+        # Logarithm outside of the interval
+        beta = alpha ** 999
+        self.assertIsNone(dislog.kangaroo(alpha, beta, 1000, 10 ** 6))
+        self.assertIsNone(
+            dislog.interval_babygiant(alpha, beta, 1000, 10 ** 6)
+        )
+
+        with self.assertRaises(ValueError):
+            dislog.kangaroo(alpha, beta, 10, 9)
+
+    def test_kangaroo_ellipticcurve(self):
+        # y^2 = x^3 + 3x + 7 over F_{1000003} has prime order 999853
+        curve = dislog.EllipticCurve(1000003, 3, 7, order=999853)
+        alpha = curve.lift_x(2)
+
+        for lo, log in ((0, 5), (200000, 234567), (900000, 999852)):
+            beta = alpha ** log
+            self.assertEqual(dislog.kangaroo(alpha, beta, lo, lo + 99999), log)
+            self.assertEqual(
+                dislog.interval_babygiant(alpha, beta, lo, lo + 99999), log
+            )
+
+    def test_parallel_kangaroo(self):
+        alpha = dislog.ModuloInteger(37, self.modulus)
+
+        for lo, log in ((0, 77777), (10 ** 12, 10 ** 12 + 3 * 10 ** 6)):
+            beta = alpha ** log
+            self.assertEqual(
+                dislog.parallel_kangaroo(
+                    alpha, beta, lo, lo + 10 ** 7, workers=2, seed=log
+                ),
+                log,
+                "Incorrect logarithm for parallel kangaroos"
+            )
+
+        # Small intervals are scanned in the calling process, and recorded
+        stats.reset()
+        stats.enable()
+        try:
+            self.assertEqual(
+                dislog.parallel_kangaroo(alpha, alpha ** 105, 100, 110), 105
+            )
+            report = stats.report()
+        finally:
+            stats.enable(False)
+            stats.reset()
+
+        record = report['dislog.kangaroo.parallel_kangaroo']
+        self.assertEqual(record['calls'], 1)
+        self.assertEqual(record['multiplications'], 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import dislog
+import random
 import unittest
 
 
@@ -35,6 +36,110 @@ class ModuloIntegerTestCase(unittest.TestCase):
                     "Multiplication result should be 1"
                 )
 
+    def test_modulointeger_context(self):
+        context = dislog.ModulusContext(97, order=96)
+        alpha = dislog.ModuloInteger(5, context)
+        beta = dislog.ModuloInteger(35, 97)
+
+        self.assertFalse(hasattr(alpha, '__dict__'))
+        self.assertEqual(alpha.modulus, 97)
+        self.assertIs((alpha * alpha).context, context)
+        self.assertEqual((alpha * beta).value, (5 * 35) % 97)
+
+        # Exponents are reduced modulo the order of the context
+        self.assertEqual(alpha ** -1, alpha ** 95)
+        self.assertEqual(alpha ** (96 * 10 ** 30 + 3), alpha ** 3)
+
+        # ... but only for units: zero divisors have no negative powers,
+        # and their positive powers are not periodic modulo the order
+        units = dislog.ModulusContext(12, order=4)
+        divisor = dislog.ModuloInteger(2, units)
+        self.assertIsNone(divisor ** -1)
+        self.assertEqual((divisor ** 4).value, 4)
+        self.assertEqual((dislog.ModuloInteger(5, units) ** -1).value, 5)
+        self.assertIsNone(
+            dislog.ModuloInteger.multi_power([divisor], [-1])
+        )
+        self.assertEqual(
+            dislog.ModuloInteger.multi_power([divisor], [4]).value, 4
+        )
+
+        # In-place multiplication must not mutate aliased instances
+        power = beta
+        power *= alpha
+        self.assertEqual(beta.value, 35)
+        self.assertEqual(power.value, (5 * 35) % 97)
+
+        with self.assertRaises(ValueError):
+            alpha * dislog.ModuloInteger(5, 96)
+
+        with self.assertRaises(ValueError):
+            dislog.ModulusContext(0)
+
+        with self.assertRaises(TypeError):
+            dislog.ModuloInteger(5, "97")
+
+    def test_modulointeger_batch_inverse(self):
+        # Case list entry structure: (values, modulus)
+        cases = [
+            ([], 7),
+            ([3], 7),
+            ([1, 2, 3, 4, 5, 6], 7),
+            ([2, 3, 4, 5, 7, 0, 11], 12),
+            ([0, 6, 3], 9),
+            ([12345, 67890, 2 ** 100 + 1], 2 ** 127 - 1)
+        ]
+
+        for values, modulus in cases:
+            elements = [dislog.ModuloInteger(v, modulus) for v in values]
+            inverses = dislog.batch_inverse(elements)
+
+            self.assertEqual(
+                inverses,
+                [element.inverse() for element in elements],
+                "Incorrect inverses for {} mod {}".format(values, modulus)
+            )
+
+        with self.assertRaises(ValueError):
+            dislog.batch_inverse([
+                dislog.ModuloInteger(2, 7), dislog.ModuloInteger(2, 9)
+            ])
+
+    def test_modulointeger_multi_power(self):
+        rng = random.Random(0)
+
+        # Small moduli use the built-in exponentiation, large ones Straus'
+        # method, for both integer backends
+        for modulus in (7, 2 ** 127 - 1, 2 ** 2203 - 1):
+            bases = [
+                dislog.ModuloInteger(rng.randrange(1, modulus), modulus)
+                for _ in range(3)
+            ]
+
+            for exponents in ([0, 0, 0], [1, 0, 5], [-3, 2 ** 130, 12345]):
+                expected = (
+                    (bases[0] ** exponents[0]) * (bases[1] ** exponents[1])
+                    * (bases[2] ** exponents[2])
+                )
+                self.assertEqual(
+                    dislog.ModuloInteger.multi_power(bases, exponents),
+                    expected,
+                    "Incorrect product of powers mod {}".format(modulus)
+                )
+
+        self.assertIsNone(
+            dislog.ModuloInteger.multi_power(
+                [dislog.ModuloInteger(2, 6), dislog.ModuloInteger(5, 6)],
+                [-1, 1]
+            )
+        )
+
+        with self.assertRaises(ValueError):
+            dislog.ModuloInteger.multi_power(
+                [dislog.ModuloInteger(2, 7), dislog.ModuloInteger(2, 9)],
+                [1, 1]
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,113 @@
+import concurrent.futures
+import dislog
+import unittest
+
+
+class PohligHellmanTestCase(unittest.TestCase):
+    # 2 is a generator of Z_{20971661}, of order 2^2 * 5 * 1048583
+    modulus = 20971661
+    n = 20971660
+    n_factors = {2: 2, 5: 1, 1048583: 1}
+
+    def test_subsolvers(self):
+        alpha = dislog.ModuloInteger(2, self.modulus)
+        logs = [0, 1, 20971659, 12345678]
+
+        for subsolver in ('auto', 'babygiant', 'pollard'):
+            for log in logs:
+                self.assertEqual(
+                    dislog.pohlighellman(
+                        alpha, alpha ** log, self.n, self.n_factors,
+                        subsolver=subsolver
+                    ),
+                    log,
+                    "Incorrect logarithm with {} subsolver".format(subsolver)
+                )
+
+    def test_invalid_order(self):
+        # 3 has order 6 modulo 7, which does not divide 4; 10 is not
+        # invertible modulo 50
+        self.assertIsNone(
+            dislog.pohlighellman(
+                dislog.ModuloInteger(3, 7), dislog.ModuloInteger(2, 7),
+                4, {2: 2}
+            )
+        )
+        self.assertIsNone(
+            dislog.pohlighellman(
+                dislog.ModuloInteger(10, 50), dislog.ModuloInteger(0, 50),
+                20, {2: 2, 5: 1}
+            )
+        )
+
+    def test_prime_powers(self):
+        # 3 is a generator of Z_{2^16 + 1}, of order 2^16
+        alpha = dislog.ModuloInteger(3, 65537)
+
+        for log in (0, 1, 2 ** 15, 65535, 40000):
+            self.assertEqual(
+                dislog.pohlighellman(
+                    alpha, alpha ** log, 65536, {2: 16},
+                    subsolver='exhaustive'
+                ),
+                log
+            )
+
+    def test_large_prime_power(self):
+        # 10 is a generator of Z_{3 * 2^66 + 1}, of order 2^66 * 3
+        modulus = 3 * 2 ** 66 + 1
+        alpha = dislog.ModuloInteger(10, modulus)
+        n = modulus - 1
+
+        for log in (0, 1, 2 ** 65, n - 1, 123456789123456789123):
+            self.assertEqual(
+                dislog.pohlighellman(alpha, alpha ** log, n, {2: 66, 3: 1}),
+                log
+            )
+
+    def test_custom_subsolver(self):
+        alpha = dislog.ModuloInteger(2, self.modulus)
+        calls = []
+
+        def subsolver(base, arg, p):
+            calls.append(p)
+            return dislog.babygiant(base, arg, p)
+
+        self.assertEqual(
+            dislog.pohlighellman(
+                alpha, alpha ** 777, self.n, self.n_factors, subsolver
+            ),
+            777
+        )
+        self.assertEqual(sorted(calls), [2, 2, 5, 1048583])
+
+    def test_executors(self):
+        alpha = dislog.ModuloInteger(2, self.modulus)
+        executors = [
+            concurrent.futures.ThreadPoolExecutor(max_workers=3),
+            concurrent.futures.ProcessPoolExecutor(max_workers=2)
+        ]
+
+        for executor in executors:
+            with executor:
+                for log in (3, 20000000):
+                    self.assertEqual(
+                        dislog.pohlighellman(
+                            alpha, alpha ** log, self.n, self.n_factors,
+                            executor=executor
+                        ),
+                        log,
+                        "Incorrect logarithm with {}"
+                        .format(type(executor).__name__)
+                    )
+
+                self.assertIsNone(
+                    dislog.pohlighellman(
+                        alpha ** 2, alpha, self.n, self.n_factors,
+                        executor=executor
+                    )
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+import dislog
+import os
+import tempfile
+import unittest
+
+
+class PollardTestCase(unittest.TestCase):
+    # 4 generates the subgroup of prime order 1019 of Z_{2039}
+    modulus = 2039
+    n = 1019
+
+    def test_pollard_methods(self):
+        alpha = dislog.ModuloInteger(4, self.modulus)
+
+        for log in (1, 2, 500, 1018):
+            beta = alpha ** log
+
+            for method in ('floyd', 'brent', 'distinguished'):
+                for checked in (False, True):
+                    self.assertEqual(
+                        dislog.pollard(
+                            alpha, beta, self.n, dislog.modint_pollard_map,
+                            method=method, checked=checked
+                        ),
+                        log,
+                        "Incorrect logarithm with method {}".format(method)
+                    )
+
+    def test_pollard_checked(self):
+        alpha = dislog.ModuloInteger(4, self.modulus)
+        beta = alpha ** 10
+
+        # Wrong group order breaks the invariant of the walk
+        with self.assertRaises(AssertionError):
+            dislog.pollard(
+                alpha, beta, self.n - 1, dislog.modint_pollard_map,
+                method='brent', checked=True
+            )
+
+        with self.assertRaises(ValueError):
+            dislog.pollard(
+                alpha, beta, self.n, dislog.modint_pollard_map,
+                method='unknown'
+            )
+
+    def test_pollard_walks(self):
+        alpha = dislog.ModuloInteger(4, self.modulus)
+
+        for log in (7, 1000):
+            beta = alpha ** log
+            walks = [
+                dislog.ClassicWalk(alpha, beta, self.n),
+                dislog.AddingWalk(alpha, beta, self.n, seed=log),
+                dislog.MixedWalk(alpha, beta, self.n, seed=log)
+            ]
+
+            for walk in walks:
+                self.assertEqual(
+                    dislog.pollard(
+                        alpha, beta, self.n, walk=walk, method='brent',
+                        checked=True
+                    ),
+                    log,
+                    "Incorrect logarithm with {}".format(type(walk).__name__)
+                )
+
+    def test_expollard(self):
+        # 3 is a generator of Z_{1709}, of composite order 1708
+        alpha = dislog.ModuloInteger(3, 1709)
+
+        for log in range(0, 1708, 61):
+            self.assertEqual(
+                dislog.expollard(alpha, alpha ** log, 1708, seed=log),
+                log,
+                "Incorrect logarithm for Pollard algorithm with restarts"
+            )
+
+        # 654 does not belong to the subgroup generated by 897
+        self.assertIsNone(
+            dislog.expollard(
+                dislog.ModuloInteger(897, 1709),
+                dislog.ModuloInteger(654, 1709),
+                1708
+            )
+        )
+
+    def test_parallel_pollard(self):
+        alpha = dislog.ModuloInteger(4, self.modulus)
+
+        for log in (3, 777):
+            beta = alpha ** log
+
+            self.assertEqual(
+                dislog.parallel_pollard(
+                    alpha, beta, self.n, dislog.modint_pollard_map,
+                    workers=2, seed=log
+                ),
+                log,
+                "Incorrect logarithm for parallel Pollard algorithm"
+            )
+
+    def test_rho_solver(self):
+        # 4 generates the subgroup of prime order 8388953 of Z_{16777907}
+        alpha = dislog.ModuloInteger(4, 16777907)
+        n = 8388953
+        solver = dislog.RhoSolver(alpha, n, seed=1)
+
+        logs = [0, 1, n - 1] + list(range(12345, n, 199999))
+        self.assertEqual(
+            solver.solve_many(alpha ** log for log in logs),
+            logs,
+            "Incorrect logarithms for multi-target rho"
+        )
+
+        # -1 does not belong to the subgroup generated by 4
+        self.assertIsNone(
+            solver.solve(dislog.ModuloInteger(-1, 16777907), max_walks=50)
+        )
+
+        bounded = dislog.RhoSolver(alpha, n, max_points=10, seed=2)
+        self.assertEqual(bounded.solve_many([alpha ** 5, alpha ** 7]), [5, 7])
+        self.assertLessEqual(len(bounded.points), 10)
+
+    def test_rho_solver_save_load(self):
+        alpha = dislog.ModuloInteger(4, 16777907)
+        n = 8388953
+        solver = dislog.RhoSolver(alpha, n, seed=3)
+        solver.solve(alpha ** 1000)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'points.json')
+            solver.save(path)
+
+            loaded = dislog.RhoSolver.load(path, alpha)
+            self.assertEqual(loaded.points, solver.points)
+
+            # The starting points continue where the saved solver stopped,
+            # instead of replaying the ones of a new solver with its seed
+            fresh = dislog.RhoSolver(alpha, n, seed=3)
+            state = loaded._rng.getstate()
+            self.assertEqual(state, solver._rng.getstate())
+            self.assertNotEqual(state, fresh._rng.getstate())
+
+            self.assertEqual(loaded.solve(alpha ** 424242), 424242)
+
+            with self.assertRaises(ValueError):
+                dislog.RhoSolver.load(path, alpha ** 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import dislog
+import dislog.util as dgutil
+import unittest
+from dislog.group import multi_power
+
+
+class PowerTestCase(unittest.TestCase):
+    def test_power(self):
+        # Case list entry structure: (value, exponent, modulus)
+        cases = [
+            (3, 0, 7),
+            (3, 1, 7),
+            (2, 10, 1009),
+            (5, 123456789, 1000003),
+            (7, 2 ** 200 + 12345, 2 ** 127 - 1)
+        ]
+
+        for value, exponent, modulus in cases:
+            base = dislog.ModuloInteger(value, modulus)
+            self.assertEqual(
+                (base ** exponent).value, pow(value, exponent, modulus)
+            )
+
+    def test_power_negative(self):
+        # 3 is a generator of Z_{101}, of order 100
+        base = dislog.ModuloInteger(3, 101)
+        inverse = base.inverse()
+
+        self.assertEqual(base ** -5, inverse ** 5)
+        context = dislog.ModulusContext(101, order=100)
+        self.assertEqual(
+            dislog.ModuloInteger(3, context) ** -5, inverse ** 5
+        )
+        self.assertEqual(
+            dislog.ModuloInteger(3, context) ** 12345, base ** 45
+        )
+
+        self.assertIsNone(dislog.ModuloInteger(2, 6) ** -1)
+
+    def test_straus(self):
+        modulus = 2 ** 127 - 1
+        identity = dislog.ModuloInteger(1, modulus)
+        bases = [dislog.ModuloInteger(v, modulus) for v in (3, 5, 7)]
+
+        for exponents in ([0, 0, 0], [1, 0, 0], [12345, 2 ** 126 + 1, 77]):
+            expected = identity
+            for base, exponent in zip(bases, exponents):
+                expected = expected * base ** exponent
+
+            for width in (None, 1, 3, 5):
+                self.assertEqual(
+                    dgutil.straus(bases, exponents, identity, width),
+                    expected,
+                    "Incorrect product of powers (width {})".format(width)
+                )
+
+            self.assertEqual(multi_power(bases, exponents), expected)
+
+        # Elements without a multi_power method are raised separately
+        self.assertEqual(multi_power([3, 5], [2, 3]), 9 * 125)
+
+        with self.assertRaises(ValueError):
+            dgutil.straus(bases, [1, -1, 1], identity)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import dislog
+import math
+import random
+import unittest
+from dislog.util import rand_cyclic_zstar
+from dislog.util import rand_cyclic_zstar_instances
+from dislog.util import rand_zstar_element
+from sympy.ntheory import n_order
+
+
+class RandTestCase(unittest.TestCase):
+    def test_rand_cyclic_zstar(self):
+        rng = random.Random(0)
+
+        # Cyclic moduli up to 50: 2, 4, p^k and 2p^k
+        cyclic = [
+            2, 3, 4, 5, 6, 7, 9, 10, 11, 13, 14, 17, 18, 19, 22, 23, 25, 26,
+            27, 29, 31, 34, 37, 38, 41, 43, 46, 47, 49, 50
+        ]
+        instances = list(rand_cyclic_zstar_instances(2, 50, rng=rng))
+        self.assertEqual(sorted(m for m, _, _ in instances), cyclic)
+
+        for modulus, n, g in instances:
+            self.assertEqual(
+                n, sum(math.gcd(i, modulus) == 1 for i in range(modulus))
+            )
+            self.assertEqual(math.gcd(g, modulus), 1)
+            self.assertEqual(n_order(g, modulus) if modulus > 2 else 1, n)
+
+        self.assertIsNone(rand_cyclic_zstar(8, 8))
+        self.assertEqual(rand_cyclic_zstar(4, 4), (4, 2, 3))
+
+        # Large intervals are never materialized
+        modulus, n, g = rand_cyclic_zstar(10 ** 17, 10 ** 18, rng)
+        alpha = dislog.ModuloInteger(g, modulus)
+        self.assertEqual((alpha ** n).value, 1)
+        self.assertEqual(
+            len(list(rand_cyclic_zstar_instances(10 ** 17, 10 ** 18, 20, rng))),
+            20
+        )
+
+        with self.assertRaises(ValueError):
+            rand_cyclic_zstar(1, 10)
+
+    def test_rand_zstar_element(self):
+        rng = random.Random(0)
+
+        self.assertIsNone(rand_zstar_element(1))
+        self.assertEqual(rand_zstar_element(2, rng), 1)
+        for _ in range(20):
+            self.assertEqual(math.gcd(rand_zstar_element(10 ** 18, rng),
+                                      10 ** 18), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import dislog
+import unittest
+from dislog.solve import _use_indexcalculus
+from dislog.solve import _LRUCache
+from dislog.solve import _solvers
+from dislog.util import stats
+
+
+class SolveTestCase(unittest.TestCase):
+    def test_solve(self):
+        # Entry structure: (alpha, modulus, logarithms)
+        cases = [
+            # Tiny order
+            (5, 97, [0, 1, 35, 95]),
+            # Order 2 * 3 * 166667, with a large prime factor
+            (2, 1000003, [0, 1, 654321]),
+            # Smooth order 2^2 * 5 * 1048583
+            (2, 20971661, [0, 1, 12345678])
+        ]
+
+        for value, modulus, logs in cases:
+            alpha = dislog.ModuloInteger(value, modulus)
+            for log in logs:
+                self.assertEqual(
+                    dislog.solve(alpha, alpha ** log),
+                    log,
+                    "Incorrect logarithm in Z_{}".format(modulus)
+                )
+
+    def test_solve_order(self):
+        alpha = dislog.ModuloInteger(4, 2039)
+
+        self.assertEqual(dislog.solve(alpha, alpha ** 777, 1019), 777)
+        self.assertEqual(
+            dislog.solve(alpha, alpha ** 777, 1019, {1019: 1}), 777
+        )
+
+        context = dislog.ModulusContext(2039, order=1019)
+        alpha = dislog.ModuloInteger(4, context)
+        self.assertEqual(dislog.solve(alpha, alpha ** 500), 500)
+
+        with self.assertRaises(ValueError):
+            dislog.solve(object(), object())
+
+        # 10 is not invertible modulo 50: no power of it is the identity
+        self.assertIsNone(
+            dislog.solve(
+                dislog.ModuloInteger(10, 50), dislog.ModuloInteger(0, 50)
+            )
+        )
+
+    def test_solve_subgroup(self):
+        # 2 is a generator of Z_{20971661}; 2^20 has order 1048583
+        generator = dislog.ModuloInteger(2, 20971661)
+        alpha = generator ** 20
+
+        for log in (0, 1, 1048582, 777777):
+            self.assertEqual(dislog.solve(alpha, alpha ** log), log)
+
+        stats.reset()
+        stats.enable()
+        try:
+            self.assertIsNone(dislog.solve(alpha, generator))
+            report = stats.report()
+        finally:
+            stats.enable(False)
+            stats.reset()
+
+        # The query is rejected without any search
+        self.assertEqual(
+            report['dislog.solve.solve']['params']['method'], 'precheck'
+        )
+        self.assertNotIn('dislog.babygiant.BabyGiantSolver.solve', report)
+
+    def test_solve_indexcalculus_dispatch(self):
+        # Safe prime 2q + 1: index calculus beats rho in the subgroup of
+        # order q
+        p = 281474976711563
+        self.assertTrue(_use_indexcalculus(p, (p - 1) // 2))
+
+        # Large fields with a small subgroup, where the factor base would
+        # never be finished, and composite moduli are left to rho
+        self.assertFalse(_use_indexcalculus(2 ** 521 - 1, 2 ** 41 + 15))
+        self.assertFalse(_use_indexcalculus(2 ** 89 - 1, 2 ** 41 + 15))
+        self.assertFalse(_use_indexcalculus(p * 3, (p - 1) // 2))
+
+    def test_solve_caches(self):
+        dislog.clear_caches()
+        alpha = dislog.ModuloInteger(2, 20971661)
+        stats.reset()
+        stats.enable()
+
+        try:
+            for log in (1, 2, 3):
+                self.assertEqual(dislog.solve(alpha, alpha ** log), log)
+            report = stats.report()
+        finally:
+            stats.enable(False)
+            stats.reset()
+
+        # The table of the large prime order subgroup is built only once
+        self.assertEqual(report['dislog.babygiant.BabyGiantSolver']['calls'], 1)
+        self.assertEqual(len(_solvers.entries), 1)
+        self.assertGreater(_solvers.total, 0)
+
+        dislog.clear_caches()
+        self.assertEqual(len(_solvers.entries), 0)
+        self.assertEqual(_solvers.total, 0)
+
+    def test_cache_weight(self):
+        cache = _LRUCache(10, 100, len)
+
+        for key in 'abcde':
+            cache.get(key, lambda: [key] * 30)
+        cache.get('c', None)
+
+        # The least recently used entries are discarded beyond 100 items,
+        # and values heavier than the whole budget are not kept
+        self.assertEqual(list(cache.entries), ['d', 'e', 'c'])
+        self.assertEqual(cache.total, 90)
+        self.assertEqual(len(cache.get('f', lambda: [0] * 101)), 101)
+        self.assertNotIn('f', cache.entries)
+
+
+if __name__ == '__main__':
+    unittest.main()
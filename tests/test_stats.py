@@ -0,0 +1,94 @@
+import dislog
+import unittest
+from dislog.util import stats
+
+
+class StatsTestCase(unittest.TestCase):
+    def setUp(self):
+        stats.reset()
+        stats.enable()
+
+    def tearDown(self):
+        stats.enable(False)
+        stats.reset()
+
+    def test_solver_counters(self):
+        alpha = dislog.ModuloInteger(33, 50)
+        beta = dislog.ModuloInteger(47, 50)
+
+        self.assertEqual(dislog.exhaustive(alpha, beta, 20), 19)
+        self.assertEqual(dislog.babygiant(alpha, beta, 20), 19)
+
+        report = stats.report()
+        exhaustive = report['dislog.exhaustive.exhaustive']
+        babygiant = report['dislog.babygiant.babygiant']
+
+        self.assertEqual(exhaustive['calls'], 1)
+        self.assertEqual(exhaustive['multiplications'], 19)
+        self.assertEqual(exhaustive['steps'], 19)
+        self.assertEqual(babygiant['calls'], 1)
+        self.assertGreater(babygiant['table_inserts'], 0)
+        self.assertGreater(babygiant['table_lookups'], 0)
+        self.assertGreaterEqual(babygiant['time'], 0)
+
+    def test_pollard_counters(self):
+        # 4 generates the subgroup of prime order 8388953 of Z_{16777907}
+        alpha = dislog.ModuloInteger(4, 16777907)
+        beta = alpha ** 123456
+
+        self.assertEqual(
+            dislog.pollard(alpha, beta, 8388953, a_start=3, b_start=5,
+                           method='distinguished'),
+            123456
+        )
+        pollard = stats.report()['dislog.pollard.pollard']
+
+        # Start, then one product per step, then the two powers and the
+        # products verifying the candidates of the collision
+        self.assertEqual(pollard['exponentiations'], 3)
+        self.assertGreaterEqual(pollard['multiplications'], pollard['steps'])
+        self.assertEqual(
+            pollard['table_lookups'], pollard['table_inserts'] + 1
+        )
+
+    def test_disabled(self):
+        stats.enable(False)
+
+        alpha = dislog.ModuloInteger(33, 50)
+        beta = dislog.ModuloInteger(47, 50)
+        dislog.exhaustive(alpha, beta, 20)
+
+        self.assertEqual(stats.report(), {})
+
+    def test_inversions(self):
+        # Inversions are counted by the group elements, and credited to the
+        # calls running at the time
+        alpha = dislog.ModuloInteger(3, 1019)
+        beta = alpha ** 500
+        curve = dislog.EllipticCurve(1019, 1, 0, order=1020)
+        point = curve.lift_x(4)
+
+        def inversions(function, *args):
+            token = stats.start(inversions)
+            function(*args)
+            stats.record(inversions, token)
+            ret, = [
+                counters['inversions']
+                for name, counters in stats.report().items()
+                if name.endswith('<locals>.inversions')
+            ]
+            stats.reset()
+            return ret
+
+        self.assertEqual(inversions(dislog.exhaustive, alpha, beta, 1018), 0)
+        self.assertEqual(inversions(alpha.inverse), 1)
+        self.assertEqual(inversions(lambda: alpha ** -5), 1)
+        self.assertEqual(inversions(dislog.batch_inverse, [alpha, beta]), 1)
+
+        # Normalizing a point in Jacobian coordinates takes a field inversion
+        self.assertEqual(inversions(point.canonical), 0)
+        self.assertEqual(inversions((point * point).canonical), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
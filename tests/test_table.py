@@ -0,0 +1,46 @@
+import dislog
+import unittest
+from dislog.util import table
+
+
+class TableTestCase(unittest.TestCase):
+    def test_table_backends(self):
+        for kind in table.TABLES:
+            exp_table = table.make_table(kind, 1000)
+            for j in range(1000):
+                exp_table.insert(dislog.ModuloInteger(j * j, 1000003), j)
+            exp_table.finalize()
+
+            self.assertEqual(len(exp_table), 1000)
+            for j in (0, 1, 500, 999):
+                self.assertIn(
+                    j,
+                    list(exp_table.lookup(
+                        dislog.ModuloInteger(j * j, 1000003)
+                    )),
+                    "Missing entry in {} table".format(kind)
+                )
+
+    def test_babygiant_tables(self):
+        # Entry structure: (alpha, beta, modulus, n, expected value)
+        cases = [
+            (2, 1, 3, 2, 0),
+            (33, 47, 50, 20, 19),
+            (897, 654, 1709, 1708, None),
+            (2, pow(2, 654321, 1000003), 1000003, 1000002, 654321)
+        ]
+
+        for case in cases:
+            alpha = dislog.ModuloInteger(case[0], case[2])
+            beta = dislog.ModuloInteger(case[1], case[2])
+
+            for kind in table.TABLES:
+                self.assertEqual(
+                    dislog.babygiant(alpha, beta, case[3], table=kind),
+                    case[4],
+                    "Incorrect return value with {} table".format(kind)
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()